@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks for the game's hot paths.
+
+Run with `python -m benchmarks.bench`; see `bench.py` for options.
+"""
@@ -0,0 +1,298 @@
+"""
+bench.py
+Plain-timeit benchmarks of hot paths, compared against a JSON baseline.
+
+Example:
+    python -m benchmarks.bench                 # compare with baseline.json
+    python -m benchmarks.bench --save          # record a new baseline
+    python -m benchmarks.bench -k inventory --threshold 0.1
+
+Each benchmark reports the best per-call time over several repeats, which
+is the least noisy statistic for short code paths. The run fails (exit 1)
+when any benchmark is slower than its baseline by more than `--threshold`
+(a fraction, default 0.25). Baselines are machine-specific: record one on
+the machine that will do the comparing.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import sys
+import timeit
+from typing import Callable
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# pylint: disable=wrong-import-position,no-member
+import pygame
+
+from src import config
+from src.core.battle_log import BattleLog
+from src.core.state_machine import StateMachine
+from src.core.ui import UI, render_battle_screen
+from src.entities import Enemy, Player
+from src.entities.archetypes import EnemyPool
+from src.entities.status import (BleedStatus, PoisonStatus, RegenerationStatus, StunStatus,
+                                 tick_all)
+from src.events.mini_events import choose_event, choose_events
+from src.items.inventory import Inventory
+from src.items.items import Antidote, HealingPotion, StaminaPotion
+from src.rng import RNGService
+from src.sampling import AliasTable
+from src.sim.battle import SKILL_KEYS, default_policy
+from src.states.battle import BattleState
+from src.utils import (EncounterMeta, add_to_log, give_status, group_inventory,
+                       handle_item_use)
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_THRESHOLD = 0.25
+
+# name -> setup function returning the zero-argument callable to time
+BENCHMARKS: dict[str, Callable[[], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    """Register a setup function under `name`."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+def _screen() -> pygame.Surface:
+    pygame.font.init()
+    return pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+
+def _inventory(size: int) -> list:
+    kinds = (HealingPotion, StaminaPotion, Antidote)
+    return [kinds[i % len(kinds)]() for i in range(size)]
+
+
+@benchmark("ui.display_text")
+def _display_text():
+    screen = _screen()
+    return lambda: UI.display_text(screen, "Critical hit! Player deals 17 damage.", (20, 20))
+
+
+@benchmark("ui.render_battle_screen")
+def _render_battle_screen():
+    screen = _screen()
+    battle = BattleState(Player(), Enemy(3), EncounterMeta(3), screen, RNGService(0))
+    battle.start()
+    return lambda: render_battle_screen(screen, battle)
+
+
+@benchmark("ui.battle_hud")
+def _battle_hud():
+    screen = _screen()
+    battle = BattleState(Player(), Enemy(3), EncounterMeta(3), screen, RNGService(0))
+    battle.start()
+    return lambda: battle.render(screen)
+
+
+for _size in (10, 1_000, 100_000):
+    benchmark(f"utils.group_inventory[{_size}]")(
+        lambda size=_size: (lambda inventory=_inventory(size): group_inventory(inventory)))
+
+
+benchmark("utils.group_inventory[Inventory 100000]")(
+    lambda: (lambda inventory=Inventory(_inventory(100_000)): group_inventory(inventory)))
+
+
+@benchmark("utils.handle_item_use[100]")
+def _handle_item_use():
+    player = Player()
+    for item in _inventory(100):
+        player.add_item(item)
+
+    def use():
+        player.add_item(HealingPotion())  # refill the first slot
+        handle_item_use(player, pygame.K_1, lambda _msg: None)
+    return use
+
+
+@benchmark("entity.tick_statuses[200]")
+def _tick_statuses():
+    player = Player()
+    for _ in range(200):
+        player.apply_status(RegenerationStatus(duration=10**9))
+
+    class _Battle:  # pylint: disable=too-few-public-methods
+        battle_log: list = []
+    return lambda: player.tick_statuses(_Battle)
+
+
+@benchmark("status.tick_all[1000 entities]")
+def _tick_all():
+    enemies = [Enemy(0) for _ in range(1000)]
+    for enemy in enemies:
+        for status in (PoisonStatus, BleedStatus, RegenerationStatus):
+            enemy.apply_status(status(duration=10**9))
+
+    class _Battle:  # pylint: disable=too-few-public-methods
+        battle_log: list = []
+    return lambda: tick_all(enemies, _Battle)
+
+
+@benchmark("status.churn[1000 entities]")
+def _status_churn():
+    enemies = [Enemy(0) for _ in range(1000)]
+
+    class _Battle:  # pylint: disable=too-few-public-methods
+        battle_log: list = []
+
+    def churn():
+        for enemy in enemies:
+            give_status(enemy, BleedStatus, 1)
+        tick_all(enemies, _Battle, log=None)
+    return churn
+
+
+@benchmark("entity.has_status[200]")
+def _has_status():
+    player = Player()
+    for _ in range(200):
+        player.apply_status(RegenerationStatus(duration=10**9))
+    return lambda: player.has_status(StunStatus)
+
+
+@benchmark("battle_log.add[1000]")
+def _battle_log_add():
+    log = BattleLog()
+    player = Player()
+
+    def add():
+        for turn in range(1000):
+            add_to_log(log, "{} deals {} damage.", player.name, turn)
+    return add
+
+
+@benchmark("enemy.spawn")
+def _enemy_spawn():
+    pool = EnemyPool()
+    indices = iter(range(10**9))
+
+    def spawn():
+        pool.release(pool.acquire(next(indices) % 40))
+    return spawn
+
+
+@benchmark("events.choose_event")
+def _choose_event():
+    rng = RNGService(0).events
+    return lambda: choose_event(rng)
+
+
+@benchmark("events.choose_events[1000]")
+def _choose_events():
+    rng = RNGService(0).events
+    return lambda: choose_events(1000, rng)
+
+
+@benchmark("sampling.alias[10000]")
+def _alias_sample():
+    rng = RNGService(0).loot
+    table = AliasTable([1 + i % 7 for i in range(10_000)])
+    return lambda: table.sample(rng)
+
+
+def _battle_signals(battle: BattleState) -> dict:
+    action = default_policy(battle) if battle.player_turn else None
+    if action in SKILL_KEYS:
+        return {f"skill_{action}": True}
+    return {action: True} if action else {}
+
+
+@benchmark("battle.full_fight")
+def _full_fight():
+    seeds = iter(range(10**9))
+
+    def fight():
+        battle = BattleState(Player(), Enemy(3), EncounterMeta(3), None,
+                             RNGService(next(seeds)))
+        machine = StateMachine(battle)
+        while machine.current is battle:
+            machine.update(_battle_signals(battle))
+    return fight
+
+
+def measure(func: Callable[[], object], repeat: int = 5) -> float:
+    """Best time per call, in seconds, over `repeat` timed batches."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(names: list[str], repeat: int = 5) -> dict[str, float]:
+    """Measure the named benchmarks."""
+    pygame.init()
+    return {name: measure(BENCHMARKS[name](), repeat) for name in names}
+
+
+def compare(results: dict[str, float], baseline: dict[str, float],
+            threshold: float) -> list[str]:
+    """Names of benchmarks more than `threshold` slower than `baseline`."""
+    return [name for name, seconds in results.items()
+            if name in baseline and seconds > baseline[name] * (1 + threshold)]
+
+
+def _format_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.1f} ns"
+
+
+def main(argv=None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Benchmark hot paths against a baseline.")
+    parser.add_argument("-k", dest="pattern", default="",
+                        help="Only run benchmarks whose name contains this text.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON path.")
+    parser.add_argument("--save", action="store_true",
+                        help="Write the results as the new baseline instead of comparing.")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown as a fraction (default: %(default)s).")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed batches per benchmark.")
+    args = parser.parse_args(argv)
+
+    names = [name for name in BENCHMARKS if args.pattern in name]
+    results = run(names, args.repeat)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as stream:
+            baseline = json.load(stream)["results"]
+
+    if args.save:
+        payload = {"python": platform.python_version(), "machine": platform.machine(),
+                   "results": {**baseline, **results}}
+        with open(args.baseline, "w", encoding="utf-8") as stream:
+            json.dump(payload, stream, indent=2, sort_keys=True)
+            stream.write("\n")
+        for name, seconds in results.items():
+            print(f"{name:40} {_format_time(seconds)}")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return 0
+
+    regressions = compare(results, baseline, args.threshold)
+    for name, seconds in results.items():
+        if name in baseline:
+            change = f"{seconds / baseline[name] - 1:+7.1%}"
+        else:
+            change = "    new"
+        flag = "  REGRESSION" if name in regressions else ""
+        print(f"{name:40} {_format_time(seconds)} {change}{flag}")
+    if regressions:
+        print(f"{len(regressions)} benchmark(s) regressed by more than "
+              f"{args.threshold:.0%}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,7 +7,9 @@ __all__ = [
     "core",
     "entities",
     "items",
+    "sim",
     "states",
+    "tools",
     "config",
     "utils",
 ]
@@ -6,6 +6,7 @@ even if the enemy AI does not use hotkeys, for consistency with the player's ski
 """
 from __future__ import annotations
 
+from random import Random
 from typing import TYPE_CHECKING
 
 from .base import Ability
@@ -24,12 +25,14 @@ class EnemyAttackAbility(Ability):  # pylint: disable=too-few-public-methods
     def __init__(self):
         super().__init__(name="Attack", base_cooldown=0)
 
-    def execute(self, actor: Entity, target: Entity | None = None) -> dict:
+    def execute(self, actor: Entity, target: Entity | None = None,
+                rng: Random | None = None) -> dict:
         """
         Executes the attack, calculating damage.
 
         :param actor: The enemy entity.
         :param target: The player entity being attacked.
+        :param rng: Accepted for parity with the player's attack; unused.
         :return: A dictionary with damage dealt.
         """
         # NOTE: Simplified compared to player attack. No miss/crit for now.
@@ -4,10 +4,11 @@ Defines the player's abilities.
 """
 from __future__ import annotations
 
-import random
+from random import Random
 from typing import TYPE_CHECKING
 
 from src import config
+from src.rng import get_service
 
 from .base import Ability
 
@@ -29,22 +30,26 @@ class PlayerAttackAbility(Ability):  # pylint: disable=too-few-public-methods
     def __init__(self):
         super().__init__(name="Attack", base_cooldown=0)
 
-    def execute(self, actor: Entity, target: Entity | None = None) -> dict:
+    def execute(self, actor: Entity, target: Entity | None = None,
+                rng: Random | None = None) -> dict:
         """
         Executes the attack, calculating damage, crit, and miss chances.
 
         :param actor: The player entity.
         :param target: The enemy entity being attacked.
+        :param rng: Random stream for the rolls; defaults to the combat stream.
         :return: A dictionary with damage, crit status, and miss status.
         """
-        miss = random.random() < config.PLAYER_MISS_CHANCE
+        if rng is None:
+            rng = get_service().combat
+        miss = rng.random() < config.PLAYER_MISS_CHANCE
         if miss:
             return {"damage": 0, "crit": False, "miss": True}
 
-        crit = random.random() < config.PLAYER_CRIT_CHANCE
+        crit = rng.random() < config.PLAYER_CRIT_CHANCE
         base_damage = (actor.attack + actor.power_strike_bonus) * actor.damage_mult
 
-        damage_multiplier = random.uniform(*config.PLAYER_DMG_VARIATION)
+        damage_multiplier = rng.uniform(*config.PLAYER_DMG_VARIATION)
         damage = base_damage * damage_multiplier
 
         if crit:
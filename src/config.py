@@ -7,6 +7,7 @@ SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 GAME_TITLE = "Turn-Based Game"
 FPS = 60
+DIRTY_RECTS = True  # Redraw only changed screen regions; False redraws every frame
 
 # -- Colors --
 BG_COLOR = (30, 30, 60)
@@ -29,6 +30,12 @@ DEFAULT_FONT_SIZE = 30
 LARGE_FONT_SIZE = 32
 MEDIUM_FONT_SIZE = 28
 SMALL_FONT_SIZE = 24
+TEXT_CACHE_SIZE = 512  # Rendered text surfaces kept by the UI text cache
+
+# -- Assets --
+ASSETS_DIR = "assets"       # Icons are looked up as <ASSETS_DIR>/<icon_key>.png
+ICON_SIZE = 16              # Atlas cell size and drawn icon size; art is scaled to it
+ICON_ATLAS_COLUMNS = 8      # Cells per atlas row; the atlas grows by whole rows
 
 # -- UI Layout --
 SHOP_MENU_START_X = 250
@@ -86,6 +93,7 @@ ENEMY_MISS_CHANCE = 0.1
 ENEMY_CRIT_CHANCE = 0.15
 ENEMY_CRIT_MULTIPLIER = 1.5
 ENEMY_DMG_VARIATION = (0.7, 1.3)
+ENEMY_TABLE_DEPTH = 50  # encounter indices precomputed in the archetype table
 
 # Actions
 MAX_STAMINA = 3
@@ -113,15 +121,26 @@ HP_BOOST_BASE_COST = 50       # XP
 BOOST_COST_GROWTH = 1.5       # Exponential multiplier per level
 
 # -- Game Flow --
-DEBUG = True
+DEBUG = False             # Time every frame; F3 shows the profiler overlay (see src/core/profiler.py)
+PROFILE_WINDOW = 600      # Frames kept by the frame profiler
+PROFILE_PATH = "saves/frame_profile.json"  # Histograms written on exit when DEBUG; None disables
 MAX_LOG_MESSAGES = 5
 ENEMY_TURN_PAUSE_MS = 700
 END_OF_BATTLE_PAUSE_MS = 1000
 GAME_OVER_PAUSE_MS = 1500
+SHOP_MESSAGE_MS = 1500
+IDLE_WAIT = True          # Block on input between turns instead of polling at FPS
+IDLE_MAX_WAIT_MS = 1000   # Longest single sleep while idle
 FLEE_SUCCESS_PROB = 0.25
 
+# -- Save Games --
+AUTOSAVE_PATH = "saves/autosave.sav"  # Written after every won battle; None disables
+SNAPSHOT_COMPRESS = False             # zlib-compress snapshot bodies
+REPLAY_RECORD_PATH = "saves/last_session.rpl"  # Input recording of the last session; None disables
+
 # -- Exploration --
 BASE_ENCOUNTER_CHANCE = 0.10
 ENCOUNTER_INCREMENT = 0.05
 ITEM_FIND_CHANCE = 0.30
 MINI_EVENT_BASE_CHANCE = 0.20
+CONTENT_PATH = "assets/content.json"  # Loot and mini-event tables (see src/content.py)
@@ -0,0 +1,220 @@
+"""
+content.py
+Designer-editable loot and mini-event tables.
+
+The tables live in a JSON file (`config.CONTENT_PATH`):
+
+    {
+      "loot": {
+        "<table>": [
+          {"item": "Healing Potion", "weight": 0.5},
+          {"item": "Gold Pile", "weight": 0.3, "amount": [5, 20]},
+          {"item": null, "weight": 0.2}
+        ]
+      },
+      "events": {"<MiniEvent class name>": 0.35},
+      "event_contexts": {"<context>": {"<MiniEvent class name>": 0.5}}
+    }
+
+`item` is an item's display name, or null for "nothing". Items that take
+an amount (`GoldPile`) get a random one from the inclusive `amount` range.
+Each optional event context (a depth band, a biome) is a complete event
+table used instead of `events` when exploring in that context.
+
+At startup the file is compiled into alias tables, so every draw costs
+O(1) however large a table grows. The compiled form is cached in a binary
+sidecar next to the file (`<path>.cache`), keyed by the SHA-256 of the
+JSON and of the registered item names, so later startups skip parsing and
+compiling until the file or the set of items changes.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import marshal
+import os
+from random import Random
+
+from . import config
+from .items.items import Item, ItemMeta
+from .sampling import AliasTable
+
+CACHE_MAGIC = b"RPGC"
+CACHE_VERSION = 2
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class ContentError(ValueError):
+    """Raised for a content file that does not describe valid tables."""
+
+
+class LootTable:
+    """A weighted list of item drops, sampled in O(1)."""
+
+    __slots__ = ("name", "entries", "weights", "_sampler")
+
+    def __init__(self, name: str, entries: list, weights: list[float],
+                 sampler: AliasTable | None = None):
+        """
+        Args:
+            name: Table name, for error messages.
+            entries: Per outcome, `None` for nothing or `[item_name, low, high]`
+                with `low`/`high` None for items without an amount.
+            weights: Relative weight of each outcome.
+            sampler: A prebuilt sampler for `weights`, e.g. from the cache.
+        """
+        self.name = name
+        self.entries = entries
+        self.weights = weights
+        self._sampler = sampler or AliasTable(weights)
+
+    def draw(self, rng: Random) -> Item | None:
+        """Roll the table: a new item, or None when nothing drops."""
+        entry = self.entries[self._sampler.sample(rng)]
+        if entry is None:
+            return None
+        name, low, high = entry
+        if low is None:
+            return ItemMeta.registry[name]()
+        return ItemMeta.registry[name](rng.randint(low, high))
+
+
+class Content:
+    """Compiled loot tables and mini-event weights."""
+
+    def __init__(self, loot: dict[str, LootTable], events: list[tuple[str, float]],
+                 event_contexts: dict[str, list[tuple[str, float]]] | None = None):
+        self.loot = loot
+        self.events = events
+        self.event_contexts = event_contexts or {}
+
+    def loot_table(self, name: str) -> LootTable:
+        """
+        The loot table called `name`.
+
+        Raises:
+            ContentError: If the content file has no such table.
+        """
+        try:
+            return self.loot[name]
+        except KeyError:
+            raise ContentError(f"content has no loot table {name!r}") from None
+
+
+def compile_content(source: dict) -> dict:
+    """
+    Validate parsed content and compile it to plain data (lists, numbers,
+    strings) that `marshal` can cache.
+
+    Raises:
+        ContentError: For unknown items, bad weights or malformed entries.
+    """
+    try:
+        loot = {}
+        for table_name, rows in source.get("loot", {}).items():
+            entries, weights = [], []
+            for row in rows:
+                name = row["item"]
+                if name is not None and name not in ItemMeta.registry:
+                    raise ContentError(f"loot table {table_name!r}: unknown item {name!r}")
+                low, high = row.get("amount", (None, None))
+                entries.append(None if name is None else [name, low, high])
+                weights.append(float(row["weight"]))
+            sampler = AliasTable(weights)
+            loot[table_name] = [entries, weights, sampler.prob, sampler.alias]
+        events = [[name, float(weight)] for name, weight in source.get("events", {}).items()]
+        contexts = {context: [[name, float(weight)] for name, weight in table.items()]
+                    for context, table in source.get("event_contexts", {}).items()}
+    except ContentError:
+        raise
+    except (KeyError, TypeError, ValueError) as exc:
+        raise ContentError(f"malformed content: {exc!r}") from exc
+    return {"loot": loot, "events": events, "event_contexts": contexts}
+
+
+def _from_compiled(compiled: dict) -> Content:
+    loot = {name: LootTable(name, entries, weights, AliasTable.from_columns(prob, alias))
+            for name, (entries, weights, prob, alias) in compiled["loot"].items()}
+    contexts = {context: [(name, weight) for name, weight in table]
+                for context, table in compiled["event_contexts"].items()}
+    return Content(loot, [(name, weight) for name, weight in compiled["events"]], contexts)
+
+
+def _cache_key(raw: bytes) -> bytes:
+    """
+    Digest of the content file and of the item names it was checked
+    against, so a cache compiled before an item was renamed or removed
+    is compiled (and rejected) again instead of failing at draw time.
+    """
+    digest = hashlib.sha256(raw)
+    for name in sorted(ItemMeta.registry):
+        digest.update(b"\0" + name.encode("utf-8"))
+    return digest.digest()
+
+
+def _read_cache(path: str, digest: bytes) -> dict | None:
+    try:
+        with open(path, "rb") as stream:
+            header = stream.read(len(CACHE_MAGIC) + 1 + len(digest))
+            if header != CACHE_MAGIC + bytes([CACHE_VERSION]) + digest:
+                return None
+            return marshal.load(stream)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+
+def _write_cache(path: str, digest: bytes, compiled: dict) -> None:
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, "wb") as stream:
+            stream.write(CACHE_MAGIC + bytes([CACHE_VERSION]) + digest)
+            marshal.dump(compiled, stream)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # read-only install: compile again next time
+
+
+def load_content(path: str | None = None, use_cache: bool = True) -> Content:
+    """
+    Load and compile the content file at `path` (default
+    `config.CONTENT_PATH`; relative paths fall back to the project root).
+
+    Raises:
+        ContentError: If the file is not valid JSON or not valid content.
+    """
+    path = path or config.CONTENT_PATH
+    if not os.path.isabs(path) and not os.path.exists(path):
+        path = os.path.join(_ROOT, path)
+    with open(path, "rb") as stream:
+        raw = stream.read()
+    digest = _cache_key(raw)
+    cache_path = f"{path}.cache"
+
+    compiled = _read_cache(cache_path, digest) if use_cache else None
+    if compiled is None:
+        try:
+            source = json.loads(raw)
+        except ValueError as exc:
+            raise ContentError(f"{path}: {exc}") from exc
+        compiled = compile_content(source)
+        if use_cache:
+            _write_cache(cache_path, digest, compiled)
+    return _from_compiled(compiled)
+
+
+_content: Content | None = None
+
+
+def get_content() -> Content:
+    """The game's content, loaded on first use."""
+    global _content  # pylint: disable=global-statement
+    if _content is None:
+        _content = load_content()
+    return _content
+
+
+def set_content(content: Content | None) -> None:
+    """Replace the game's content; None reloads it on next use."""
+    global _content  # pylint: disable=global-statement
+    _content = content
@@ -1,7 +1,6 @@
 """
 Initializes the core game components package.
 """
-from .game import Game
 from .events import *
 from .ui import UI
 from .state_machine import StateMachine, BaseState
@@ -9,3 +8,12 @@ from .ui import render_battle_screen  # add below existing imports
 
 __all__ = ["Game", "UI", "StateMachine", "BaseState"]
 __all__.append("render_battle_screen")
+
+
+def __getattr__(name: str):
+    # `Game` imports every state, and states, sims and entities import
+    # `src.core` submodules, so load it on first use to avoid a cycle.
+    if name == "Game":
+        from .game import Game  # pylint: disable=import-outside-toplevel
+        return Game
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,140 @@
+"""
+assets.py
+Icon atlas with cached scaled variants.
+
+Icons are looked up by key (`Status.icon_key`, e.g. "icons/poison") as
+`<config.ASSETS_DIR>/<key>.png`, relative to the project root unless the
+directory exists in the working directory. The first time a key is asked for, its
+image is scaled to `config.ICON_SIZE` and packed into a cell of one shared
+atlas surface; keys without a file get a flat square of the caller's
+fallback colour instead, so the game runs without any icon art. `icon()`
+hands out subsurfaces of the atlas and keeps the scaled copy for every
+size drawn, so a frame never loads, converts or scales an image.
+"""
+import os
+
+import pygame
+
+from src import config
+from ..utils import load_image
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class AssetManager:
+    """Packs icons into an atlas on first use and caches their scaled variants."""
+
+    def __init__(self, root: str | None = None, cell: int | None = None,
+                 columns: int | None = None):
+        """
+        Args:
+            root: Directory icon keys are relative to; `config.ASSETS_DIR` if omitted.
+            cell: Side of an atlas cell in pixels; `config.ICON_SIZE` if omitted.
+            columns: Cells per atlas row; `config.ICON_ATLAS_COLUMNS` if omitted.
+        """
+        root = config.ASSETS_DIR if root is None else root
+        if not os.path.isabs(root) and not os.path.exists(root):
+            root = os.path.join(_ROOT, root)
+        self.root = root
+        self.cell = config.ICON_SIZE if cell is None else cell
+        self.columns = config.ICON_ATLAS_COLUMNS if columns is None else columns
+        self.atlas: pygame.Surface | None = None
+        self._slots: dict[str, int] = {}
+        self._icons: dict[str, pygame.Surface] = {}
+        self._scaled: dict[tuple[str, int], pygame.Surface] = {}
+        self.loaded = 0
+        self.generated = 0
+
+    def icon(self, key: str, size: int | None = None,
+             fallback=(150, 150, 150)) -> pygame.Surface:
+        """
+        The icon for `key` as a `size`×`size` surface (the cell size if
+        omitted). Returned surfaces are shared and must not be drawn onto.
+        `fallback` colours the generated square when `key` has no image; it
+        only matters the first time `key` is requested.
+        """
+        size = self.cell if size is None else size
+        surface = self._scaled.get((key, size))
+        if surface is None:
+            base = self._icons.get(key)
+            if base is None:
+                base = self._pack(key, fallback)
+            surface = base if size == self.cell else pygame.transform.smoothscale(
+                base, (size, size))
+            self._scaled[(key, size)] = surface
+        return surface
+
+    def _cell_rect(self, slot: int) -> pygame.Rect:
+        row, column = divmod(slot, self.columns)
+        return pygame.Rect(column * self.cell, row * self.cell, self.cell, self.cell)
+
+    def _load(self, key: str) -> pygame.Surface | None:
+        path = os.path.join(self.root, f"{key}.png")
+        if not key or not os.path.isfile(path):
+            return None
+        image = load_image(path)
+        # smoothscale needs 24/32-bit pixels; palette images are copied first.
+        layer = pygame.Surface(image.get_size(), pygame.SRCALPHA)  # pylint: disable=no-member
+        layer.blit(image, (0, 0))
+        return pygame.transform.smoothscale(layer, (self.cell, self.cell))
+
+    def _grow(self) -> None:
+        rows = 1 if self.atlas is None else 2 * (self.atlas.get_height() // self.cell)
+        atlas = pygame.Surface((self.columns * self.cell, rows * self.cell),
+                               pygame.SRCALPHA)  # pylint: disable=no-member
+        if pygame.display.get_surface() is not None:
+            atlas = atlas.convert_alpha()
+        if self.atlas is not None:
+            atlas.blit(self.atlas, (0, 0))
+        self.atlas = atlas
+        # Handles into the old atlas would keep it alive; cut them again.
+        for key, slot in self._slots.items():
+            self._icons[key] = self._scaled[(key, self.cell)] = atlas.subsurface(
+                self._cell_rect(slot))
+
+    def _pack(self, key: str, fallback) -> pygame.Surface:
+        slot = len(self._slots)
+        if self.atlas is None or self._cell_rect(slot).bottom > self.atlas.get_height():
+            self._grow()
+        rect = self._cell_rect(slot)
+        image = self._load(key)
+        if image is None:
+            self.atlas.fill(fallback, rect)
+            self.generated += 1
+        else:
+            self.atlas.blit(image, rect)
+            self.loaded += 1
+        self._slots[key] = slot
+        icon = self._icons[key] = self.atlas.subsurface(rect)
+        return icon
+
+    def memory_bytes(self) -> int:
+        """Pixel memory held: the atlas plus every scaled copy."""
+        total = 0 if self.atlas is None else _surface_bytes(self.atlas)
+        for (_, size), surface in self._scaled.items():
+            if size != self.cell:
+                total += _surface_bytes(surface)
+        return total
+
+    def stats(self) -> dict:
+        """Counters for profiling overlays and benchmarks."""
+        return {
+            "icons": len(self._slots),
+            "loaded": self.loaded,
+            "generated": self.generated,
+            "scaled": sum(1 for _, size in self._scaled if size != self.cell),
+            "bytes": self.memory_bytes(),
+        }
+
+    def clear(self) -> None:
+        """Drop the atlas and every cached icon, e.g. after new art was added."""
+        self.atlas = None
+        self._slots.clear()
+        self._icons.clear()
+        self._scaled.clear()
+        self.loaded = 0
+        self.generated = 0
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
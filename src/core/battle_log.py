@@ -0,0 +1,113 @@
+"""
+battle_log.py
+Bounded message log for battles and exploration.
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import Iterable, Iterator
+
+from src import config
+
+
+class BattleLog:
+    """
+    The last `maxlen` messages, oldest first.
+
+    Backed by a `deque(maxlen)`, so adding is O(1) and old messages fall
+    off the front. `add(template, *args)` stores the template and its
+    arguments; the text is only built (once) when the message is read,
+    which in practice means when it is rendered. `revision` counts every
+    addition, so renderers can tell cheaply whether anything changed.
+
+    Reading behaves like the list of strings it replaces: iteration,
+    `len`, indexing, slicing and `==` against a list all see formatted text.
+    """
+
+    __slots__ = ("_entries", "revision")
+
+    def __init__(self, messages: Iterable[str] = (),
+                 maxlen: int = config.MAX_LOG_MESSAGES):
+        self._entries: deque = deque(messages, maxlen)
+        self.revision = 0
+
+    @property
+    def maxlen(self) -> int:
+        """Number of messages kept."""
+        return self._entries.maxlen
+
+    @property
+    def enabled(self) -> bool:
+        """False for a sink that drops everything; skip building messages then."""
+        return True
+
+    def add(self, template: str, *args) -> None:
+        """Add a message; with `args`, `template` is a `str.format` template."""
+        self._entries.append((template, args) if args else template)
+        self.revision += 1
+
+    def append(self, message: str) -> None:
+        """List-style alias of `add` for a ready-made message."""
+        self._entries.append(message)
+        self.revision += 1
+
+    def extend(self, messages: Iterable[str]) -> None:
+        """Append ready-made messages in order."""
+        for message in messages:
+            self.append(message)
+
+    def clear(self) -> None:
+        """Remove every message."""
+        self._entries.clear()
+        self.revision += 1
+
+    def _text(self, index: int) -> str:
+        entry = self._entries[index]
+        if entry.__class__ is tuple:
+            template, args = entry
+            entry = self._entries[index] = template.format(*args)
+        return entry
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(len(self._entries)):
+            yield self._text(index)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._text(i) for i in range(len(self._entries))[index]]
+        return self._text(index)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (BattleLog, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"BattleLog({list(self)!r})"
+
+
+class NullLog(BattleLog):
+    """A log that drops every message, for headless simulation."""
+
+    __slots__ = ()
+
+    def __init__(self):
+        super().__init__(maxlen=0)
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def add(self, template: str, *args) -> None:
+        """Discard the message."""
+
+    def append(self, message: str) -> None:
+        """Discard the message."""
@@ -0,0 +1,53 @@
+"""
+dirty.py
+Change tracking for dirty-rectangle rendering.
+
+States describe their screen as named regions, each with a rectangle and
+the value drawn inside it (e.g. `(player.health, player.max_health)`).
+`DirtyTracker` compares those values with the last presented frame and
+returns only the rectangles that need to be redrawn and pushed to the
+display. An unchanged screen yields no rectangles at all.
+"""
+from __future__ import annotations
+
+from typing import Iterable
+
+import pygame
+
+Region = tuple[str, pygame.Rect, object]
+
+
+class DirtyTracker:
+    """Remembers what each region showed when it was last drawn."""
+
+    def __init__(self):
+        self._drawn: dict[str, tuple[pygame.Rect, object]] = {}
+        self._full = True
+
+    def invalidate(self) -> None:
+        """Force the next frame to redraw the whole screen."""
+        self._full = True
+
+    def collect(self, regions: Iterable[Region], screen_rect: pygame.Rect) -> list[pygame.Rect]:
+        """
+        Return the rectangles that changed since the last call.
+
+        A region whose value or rectangle changed contributes both its old
+        and new rectangle, so content that moved or shrank is erased too.
+        """
+        if self._full:
+            self._full = False
+            self._drawn = {name: (pygame.Rect(rect), value) for name, rect, value in regions}
+            return [pygame.Rect(screen_rect)]
+
+        dirty = []
+        for name, rect, value in regions:
+            previous = self._drawn.get(name)
+            if previous is not None and previous[1] == value and previous[0] == rect:
+                continue
+            if previous is not None:
+                dirty.append(previous[0])
+            rect = pygame.Rect(rect)
+            dirty.append(rect)
+            self._drawn[name] = (rect, value)
+        return [rect.clip(screen_rect) for rect in dirty]
@@ -5,12 +5,9 @@ Handles user input and game events.
 import pygame
 # pylint: disable=no-member
 
-def process_events():
-    """
-    Process pygame events and return a dictionary of game actions.
-    """
-    raw_events = pygame.event.get()
-    events = {
+def empty_signals() -> dict:
+    """Return a signals dictionary with no actions set."""
+    return {
         "quit": False,
         "attack": False,
         "defend": False,
@@ -23,8 +20,33 @@ def process_events():
         "skill_w": False,
         "skill_e": False,
         "skill_r": False,
+        "raw_events": [],
     }
 
+
+def process_events(wait_ms: int = 0):
+    """
+    Process pygame events and return a dictionary of game actions.
+
+    With `wait_ms > 0` the call sleeps until an event arrives or `wait_ms`
+    milliseconds pass, instead of returning immediately.
+    """
+    raw_events = []
+    if wait_ms > 0:
+        first = pygame.event.wait(wait_ms)
+        if first.type != pygame.NOEVENT:
+            raw_events.append(first)
+    raw_events.extend(pygame.event.get())
+    return signals_from_events(raw_events)
+
+
+def signals_from_events(raw_events: list) -> dict:
+    """
+    Map a frame's raw pygame events onto a signals dictionary. Pure, so
+    recorded events can be replayed without a display.
+    """
+    events = empty_signals()
+
     for event in raw_events:
         if event.type == pygame.QUIT:
             events["quit"] = True
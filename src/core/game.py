@@ -4,50 +4,120 @@ Core game loop and state management.
 """
 import pygame
 
-# pylint: disable=no-member,too-many-branches,inconsistent-return-statements,unnecessary-dunder-call
+# pylint: disable=no-member,too-many-branches,inconsistent-return-statements
 from .. import config
+from . import snapshot
 from .events import process_events
+from .profiler import FrameProfiler, NullProfiler
+from .replay import Recorder
 from .state_machine import StateMachine
+from .ui import UI
 from ..entities import Player
 from ..items.items import HealingPotion, StaminaPotion
+from ..rng import RNGService
 from ..states.explore import ExploreState
+from ..states.victory import VictoryState
 from ..utils import EncounterMeta
 
+# Window events after which the OS may have discarded our pixels.
+REDRAW_EVENTS = (pygame.WINDOWEXPOSED, pygame.WINDOWRESTORED, pygame.WINDOWSIZECHANGED)
+
+
+def new_session(screen, rng: RNGService | None = None
+                ) -> tuple[Player, EncounterMeta, StateMachine]:
+    """
+    Create a fresh player with starting items, encounter metadata and a
+    state machine positioned in `ExploreState`, drawing randomness from
+    `rng` (a new unseeded service if omitted).
+
+    Shared by `Game` and the headless simulators so both start identically.
+    The machine will hold all shared resources that states need to access.
+    """
+    player = Player()
+    meta = EncounterMeta(encounter_index=0)
+
+    # Add starting items
+    player.add_item(HealingPotion())
+    player.add_item(StaminaPotion())
+
+    machine = StateMachine(ExploreState(player, meta, screen, rng or RNGService()))
+    return player, meta, machine
+
 
 # pylint: disable=too-few-public-methods
 class Game:
     """Manages the main game loop and state transitions."""
 
-    def __init__(self):
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Seed for every random stream; a fresh random seed if None.
+        """
         pygame.init()
         self.screen = pygame.display.set_mode((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
         pygame.display.set_caption(config.GAME_TITLE)
         self.clock = pygame.time.Clock()
         self.running = True
+        self.rng = RNGService(seed)
+        self.recorder = Recorder(self.rng.seed) if config.REPLAY_RECORD_PATH else None
+        self.profiler = FrameProfiler() if config.DEBUG else NullProfiler()
+        self._state_listeners = [self._on_state_change]
 
-        # Core game data
-        self.player = Player()
-        self.meta = EncounterMeta(encounter_index=0)
-
-        # Add starting items
-        self.player.add_item(HealingPotion())
-        self.player.add_item(StaminaPotion())
+        # Core game data and the initial state machine
+        self.player, self.meta, self.machine = new_session(self.screen, self.rng)
+        self._attach_machine()
 
-        #
-        # Create the initial state machine
-        # The machine will hold all shared resources that states need to access.
-        #
-        initial_state = ExploreState(self.player, self.meta, self.screen)
-        self.machine = StateMachine(initial_state)
+    def _attach_machine(self):
+        """Wire the current state machine back to the game."""
         # Give the state machine a reference back to the game
         # so that states can call `self.machine.game.end_game()` etc.
         self.machine.game = self
+        for callback in self._state_listeners:
+            self.machine.add_listener(callback)
+
+    def add_state_listener(self, callback):
+        """
+        Call `callback(prev_state, new_state)` after every state transition,
+        including those of the machines created by restarts and loads.
+        """
+        self._state_listeners.append(callback)
+        self.machine.add_listener(callback)
+
+    def _on_state_change(self, _prev_state, new_state):
+        """Autosave after every won battle."""
+        if isinstance(new_state, VictoryState) and config.AUTOSAVE_PATH:
+            self.save(config.AUTOSAVE_PATH)
+
+    def save(self, path):
+        """Write a snapshot of the current session to `path`."""
+        snapshot.save(path, self.player, self.meta, self.machine)
+
+    def load(self, path):
+        """
+        Replace the current session with the snapshot at `path`.
+
+        Raises:
+            OSError: If the file cannot be read.
+            snapshot.SnapshotError: If it is not a valid snapshot.
+        """
+        self.player, self.meta, self.machine = snapshot.load(path, self.screen, self.rng)
+        self._attach_machine()
+        # A recording only replays from a fresh session.
+        self.recorder = None
 
     def run(self):
         """Runs the main game loop."""
+        profiler = self.profiler
         while self.running:
-            signals = process_events()
+            profiler.start_frame(self.machine.current)
+            # Turn-based: sleep until input or a timed change is due, and
+            # only run at the fixed frame rate while something animates.
+            timeout = self.machine.idle_timeout() if config.IDLE_WAIT else None
+            signals = process_events(timeout or 0)
+            profiler.lap("process_events")
             raw_events = signals["raw_events"]
+            if self.recorder:
+                self.recorder.record(raw_events)
 
             if signals["quit"]:
                 self.running = False
@@ -56,14 +126,36 @@ class Game:
                 self.restart_game()
                 continue  # Skip the rest of the loop to re-init
 
+            overlay_hidden = profiler.handle_events(raw_events)
+            if (not config.DIRTY_RECTS or overlay_hidden
+                    or any(e.type in REDRAW_EVENTS for e in raw_events)):
+                self.machine.invalidate()
+
             # The machine delegates updates and rendering to the active state.
             self.machine.handle_events(raw_events)
+            profiler.lap("handle_events")
             self.machine.update(signals)
-            self.machine.render(self.screen)
+            profiler.lap("update")
+            dirty_rects = self.machine.render(self.screen)
+            profiler.lap("render")
 
-            pygame.display.flip()
-            self.clock.tick(config.FPS)
+            overlay = profiler.draw(self.screen, self.clock.get_fps())
+            if overlay:
+                dirty_rects = [*dirty_rects, overlay]
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+            profiler.lap("display")
+            profiler.end_frame()
+            if timeout is None:
+                self.clock.tick(config.FPS)
+            else:
+                self.clock.tick()
 
+        if self.recorder:
+            self.recorder.save(config.REPLAY_RECORD_PATH)
+        if profiler.enabled and config.PROFILE_PATH:
+            profiler.export(config.PROFILE_PATH)
+        UI.text_cache.clear()  # Fonts die with pygame.quit()
         pygame.quit()
 
     def end_game(self):
@@ -71,8 +163,6 @@ class Game:
         self.running = False
 
     def restart_game(self):
-        """Resets the game to its initial state."""
-        # This is a simple (but effective) way to restart.
-        # A more robust implementation might involve serializing/deserializing
-        # the player and meta state to avoid a full re-initialization.
-        self.__init__()
+        """Starts a new session; the random streams carry on where they were."""
+        self.player, self.meta, self.machine = new_session(self.screen, self.rng)
+        self._attach_machine()
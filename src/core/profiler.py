@@ -0,0 +1,272 @@
+"""
+profiler.py
+Frame-time instrumentation of the game loop.
+
+`FrameProfiler` times every frame of `Game.run` in phases (input polling,
+state event handling, update, render, display update) and files each
+frame under the class of the state that was active when it began. The
+last `config.PROFILE_WINDOW` frames are kept, from which it reports
+percentiles, draws an overlay (F3 toggles it) and exports per-state
+histograms as JSON. `NullProfiler` is the no-op stand-in used when
+`config.DEBUG` is off.
+
+`process_events` includes the time the loop sleeps waiting for input, so
+"busy" frame time, the figure shown and exported as `frame`, leaves that
+phase out.
+
+`CProfileWindow` takes the profiler's place in the loop to run cProfile
+over a window of frames, and `AllocationTracker` reports tracemalloc
+allocation changes at state transitions; `src/main.py` wires both to
+command-line flags.
+"""
+from __future__ import annotations
+
+import cProfile
+import json
+import math
+import os
+import sys
+import tracemalloc
+from collections import deque
+from time import perf_counter
+
+import pygame
+
+from src import config
+from .ui import UI
+
+PHASES = ("process_events", "handle_events", "update", "render", "display")
+HISTOGRAM_EDGES_MS = (0.5, 1, 2, 4, 8, 16, 33, 66, 133)
+OVERLAY_KEY = pygame.K_F3  # pylint: disable=no-member
+
+
+def percentile(values: list[float], q: float) -> float:
+    """The `q`-th percentile (0-100) of `values` by nearest rank; 0.0 if empty."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def histogram(values_ms: list[float]) -> list[int]:
+    """Counts of `values_ms` per HISTOGRAM_EDGES_MS bucket, plus one for anything above."""
+    counts = [0] * (len(HISTOGRAM_EDGES_MS) + 1)
+    for value in values_ms:
+        for i, edge in enumerate(HISTOGRAM_EDGES_MS):
+            if value <= edge:
+                counts[i] += 1
+                break
+        else:
+            counts[-1] += 1
+    return counts
+
+
+class FrameProfiler:
+    """Per-phase frame timings of the most recent frames, by state."""
+
+    def __init__(self, window: int | None = None):
+        """
+        Args:
+            window: Frames kept for statistics; `config.PROFILE_WINDOW` if omitted.
+        """
+        self.frames: deque = deque(maxlen=config.PROFILE_WINDOW if window is None else window)
+        self.visible = False
+        self._state = ""
+        self._phases: dict[str, float] = {}
+        self._last = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """True if frames are being recorded."""
+        return True
+
+    def start_frame(self, state) -> None:
+        """Begin timing a frame spent in `state`."""
+        self._state = type(state).__name__
+        self._phases = {}
+        self._last = perf_counter()
+
+    def lap(self, phase: str) -> None:
+        """Charge the time since the previous lap (or the frame start) to `phase`."""
+        now = perf_counter()
+        self._phases[phase] = now - self._last
+        self._last = now
+
+    def end_frame(self) -> None:
+        """Record the frame; phases that did not run count as zero."""
+        phases = self._phases
+        self.frames.append((self._state, tuple(phases.get(phase, 0.0) for phase in PHASES)))
+
+    def handle_events(self, raw_events) -> bool:
+        """Toggle the overlay on F3; True if it was hidden, so the screen needs a redraw."""
+        for event in raw_events:
+            if event.type == pygame.KEYDOWN and event.key == OVERLAY_KEY:  # pylint: disable=no-member
+                self.visible = not self.visible
+                if not self.visible:
+                    return True
+        return False
+
+    def samples(self, state: str | None = None) -> dict[str, list[float]]:
+        """
+        Milliseconds per phase, plus `frame` (busy time: every phase but
+        `process_events`), over the kept frames of `state` (all if None).
+        """
+        result = {phase: [] for phase in (*PHASES, "frame")}
+        for frame_state, phases in self.frames:
+            if state is not None and frame_state != state:
+                continue
+            for phase, seconds in zip(PHASES, phases):
+                result[phase].append(seconds * 1000)
+            result["frame"].append(sum(phases[1:]) * 1000)
+        return result
+
+    def summary(self) -> dict:
+        """Frame count and p50/p99/max milliseconds per phase, for every state."""
+        states = sorted({state for state, _ in self.frames})
+        return {
+            state: {
+                "frames": len(samples["frame"]),
+                **{phase: {"p50": percentile(values, 50), "p99": percentile(values, 99),
+                           "max": max(values, default=0.0)}
+                   for phase, values in samples.items()},
+            }
+            for state, samples in ((state, self.samples(state)) for state in states)
+        }
+
+    def export(self, path: str) -> None:
+        """Write the summary and per-state, per-phase histograms to `path` as JSON."""
+        data = {
+            "window": self.frames.maxlen,
+            "histogram_edges_ms": list(HISTOGRAM_EDGES_MS),
+            "summary": self.summary(),
+            "histograms": {
+                state: {phase: histogram(values)
+                        for phase, values in self.samples(state).items()}
+                for state in sorted({state for state, _ in self.frames})
+            },
+        }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def draw(self, screen: pygame.Surface, fps: float) -> pygame.Rect | None:
+        """
+        Draw the overlay (FPS, busy frame p50/p99, text cache hit rate) in
+        the top-right corner if it is visible; returns the rect it covers.
+        """
+        if not self.visible:
+            return None
+        frame_ms = self.samples()["frame"]
+        lines = (
+            f"FPS {fps:5.1f}",
+            f"frame p50 {percentile(frame_ms, 50):5.2f} ms",
+            f"frame p99 {percentile(frame_ms, 99):5.2f} ms",
+            f"text cache {UI.text_cache.hit_rate:6.1%}",
+        )
+        font_size = config.SMALL_FONT_SIZE - 4
+        line_height = font_size - 4
+        rect = pygame.Rect(0, 0, 190, 8 + line_height * len(lines))
+        rect.topright = (screen.get_width() - 5, 5)
+        screen.fill((0, 0, 0), rect)
+        for i, line in enumerate(lines):
+            UI.display_text(screen, line, (rect.x + 6, rect.y + 4 + i * line_height),
+                            font_size=font_size, color=config.UI_ACCENT_COLOR)
+        return rect
+
+
+class NullProfiler(FrameProfiler):
+    """A profiler that records nothing, so the game loop needs no checks."""
+
+    def __init__(self):
+        super().__init__(window=0)
+
+    @property
+    def enabled(self) -> bool:
+        return False
+
+    def start_frame(self, state) -> None:
+        """Do nothing."""
+
+    def lap(self, phase: str) -> None:
+        """Do nothing."""
+
+    def end_frame(self) -> None:
+        """Do nothing."""
+
+    def handle_events(self, raw_events) -> bool:
+        return False
+
+    def draw(self, screen, fps) -> None:
+        return None
+
+
+class CProfileWindow(NullProfiler):
+    """
+    Runs cProfile over `count` frames of the game loop, from frame `start`
+    on, and writes the pstats dump to `path` once the window has passed.
+    """
+
+    def __init__(self, count: int, path: str, start: int = 0):
+        super().__init__()
+        self.count = count
+        self.path = path
+        self.start = start
+        self.frame = 0
+        self.done = False
+        self._profile = cProfile.Profile()
+
+    def start_frame(self, state) -> None:
+        """Start profiling at the first frame of the window."""
+        if self.frame == self.start and not self.done:
+            self._profile.enable()
+
+    def end_frame(self) -> None:
+        """Count the frame; the last one of the window writes the dump."""
+        self.frame += 1
+        if self.frame == self.start + self.count:
+            self.finish()
+
+    def finish(self) -> bool:
+        """
+        Stop profiling and write the dump, unless that happened already or
+        the window never opened. Returns True if a dump exists at `path`.
+        """
+        if not self.done and self.frame > self.start:
+            self._profile.disable()
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self._profile.dump_stats(self.path)
+            self.done = True
+        return self.done
+
+
+class AllocationTracker:
+    """
+    A state listener (see `Game.add_state_listener`) that prints the
+    `limit` source lines whose traced allocations grew or shrank the most
+    since the previous transition. Starts tracemalloc if it is not running.
+    """
+
+    def __init__(self, limit: int = 10, stream=None):
+        self.limit = limit
+        self.stream = stream
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._last = self._snapshot()
+
+    @staticmethod
+    def _snapshot() -> tracemalloc.Snapshot:
+        return tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        ))
+
+    def __call__(self, prev_state, new_state) -> None:
+        snapshot = self._snapshot()
+        stream = self.stream or sys.stdout
+        current, peak = tracemalloc.get_traced_memory()
+        print(f"[tracemalloc] {type(prev_state).__name__} -> {type(new_state).__name__}: "
+              f"{current / 1024:.0f} KiB traced, peak {peak / 1024:.0f} KiB", file=stream)
+        for stat in snapshot.compare_to(self._last, "lineno")[:self.limit]:
+            print(f"  {stat}", file=stream)
+        self._last = snapshot
@@ -0,0 +1,239 @@
+"""
+replay.py
+Record a session's input and replay it headlessly.
+
+With the RNG seed fixed, a session is fully determined by the key presses
+of each frame, so that is all a recording holds:
+
+    magic  b"RPGR"   4 bytes
+    version          1 byte   (`FORMAT_VERSION`)
+    seed, frames     varints
+    inputs           repeated: frame delta, event count, event codes (varints)
+
+An event code is the pygame key of a KEYDOWN, or `QUIT_CODE` for a quit.
+Frames without key presses cost nothing, so an hour of play is typically
+a few kilobytes.
+
+`replay()` feeds the recorded frames through a fresh session as fast as
+the CPU allows, rendering only every `render_every`-th frame (or never).
+"""
+from __future__ import annotations
+
+import os
+import time
+import warnings
+from dataclasses import dataclass, field
+
+import pygame
+
+from .. import config
+from ..rng import RNGService
+from .events import signals_from_events
+
+# pylint: disable=no-member
+
+MAGIC = b"RPGR"
+FORMAT_VERSION = 1
+QUIT_CODE = 0
+
+
+class ReplayError(ValueError):
+    """Raised for data that is not a recording this version can read."""
+
+
+def _write_varint(buf: bytearray, value: int) -> None:
+    while value >= 0x80:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _read_varint(data: bytes, pos: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        if pos >= len(data):
+            raise ReplayError("truncated recording")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+@dataclass
+class Recording:
+    """The seed and per-frame input codes of one session."""
+    seed: int
+    frames: int = 0
+    inputs: list[tuple[int, tuple[int, ...]]] = field(default_factory=list)
+
+    def to_bytes(self) -> bytes:
+        """Encode in the compact on-disk format."""
+        buf = bytearray(MAGIC)
+        buf.append(FORMAT_VERSION)
+        _write_varint(buf, self.seed)
+        _write_varint(buf, self.frames)
+        last = 0
+        for frame, codes in self.inputs:
+            _write_varint(buf, frame - last)
+            _write_varint(buf, len(codes))
+            for code in codes:
+                _write_varint(buf, code)
+            last = frame
+        return bytes(buf)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Recording":
+        """
+        Decode data produced by `to_bytes`.
+
+        Raises:
+            ReplayError: If the data is not a recording or is truncated.
+        """
+        if data[:4] != MAGIC or len(data) < 5:
+            raise ReplayError("not a replay recording")
+        if data[4] > FORMAT_VERSION:
+            raise ReplayError(f"recording version {data[4]} is newer than {FORMAT_VERSION}")
+        seed, pos = _read_varint(data, 5)
+        frames, pos = _read_varint(data, pos)
+        recording = cls(seed, frames)
+        frame = 0
+        while pos < len(data):
+            delta, pos = _read_varint(data, pos)
+            count, pos = _read_varint(data, pos)
+            codes = []
+            for _ in range(count):
+                code, pos = _read_varint(data, pos)
+                codes.append(code)
+            frame += delta
+            recording.inputs.append((frame, tuple(codes)))
+        return recording
+
+
+class Recorder:
+    """Collects the input of a running game, one `record()` call per frame."""
+
+    def __init__(self, seed: int):
+        self.recording = Recording(seed)
+
+    def record(self, raw_events: list) -> None:
+        """Note this frame's key presses and quit requests."""
+        codes = tuple(QUIT_CODE if event.type == pygame.QUIT else event.key
+                      for event in raw_events
+                      if event.type in (pygame.QUIT, pygame.KEYDOWN))
+        if codes:
+            self.recording.inputs.append((self.recording.frames, codes))
+        self.recording.frames += 1
+
+    def save(self, path: str) -> None:
+        """Write the recording so far to `path`, creating parent directories."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "wb") as stream:
+            stream.write(self.recording.to_bytes())
+
+
+def load(path: str) -> Recording:
+    """Read a recording written by `Recorder.save`."""
+    with open(path, "rb") as stream:
+        return Recording.from_bytes(stream.read())
+
+
+def events_for(codes) -> list:
+    """Rebuild the pygame events of one recorded frame."""
+    return [pygame.event.Event(pygame.QUIT) if code == QUIT_CODE
+            else pygame.event.Event(pygame.KEYDOWN, key=code, mod=0, unicode="", scancode=0)
+            for code in codes]
+
+
+class _ReplayHost:
+    """Stands in for `Game` as `machine.game` during a replay."""
+
+    def __init__(self, screen, rng: RNGService):
+        # pylint: disable=import-outside-toplevel
+        from .game import new_session
+        self._new_session = new_session
+        self.screen = screen
+        self.rng = rng
+        self.running = True
+        self.machine = None
+        self.restart_game()
+
+    def restart_game(self):
+        """Starts a new session, as `Game.restart_game` does."""
+        self.player, self.meta, self.machine = self._new_session(self.screen, self.rng)
+        self.machine.game = self
+
+    def end_game(self):
+        """Stops the replay, as `Game.end_game` does."""
+        self.running = False
+
+
+@dataclass
+class ReplayResult:
+    """Where a replayed session ended up."""
+    frames: int
+    seconds: float
+    player: object
+    meta: object
+    machine: object
+
+    @property
+    def state(self) -> str:
+        """Name of the state the session ended in."""
+        return type(self.machine.current).__name__
+
+    def summary(self) -> dict:
+        """Key facts about the final session state, for logs and CI diffs."""
+        return {
+            "frames": self.frames,
+            "state": self.state,
+            "health": self.player.health,
+            "xp": self.player.xp,
+            "gold": self.player.gold,
+            "encounter_index": self.meta.encounter_index,
+            "battles_won": self.meta.battles_won,
+        }
+
+
+def replay(recording: Recording, render_every: int = 0) -> ReplayResult:
+    """
+    Play `recording` through a fresh session without a window, mirroring
+    one iteration of `Game.run` per recorded frame.
+
+    Args:
+        recording: The session to replay.
+        render_every: Render every n-th frame to an off-screen surface;
+            0 skips rendering entirely.
+
+    Returns:
+        A `ReplayResult` with the final player, metadata and state machine.
+    """
+    screen = None
+    if render_every:
+        pygame.font.init()
+        screen = pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+    host = _ReplayHost(screen, RNGService(recording.seed))
+    inputs = dict(recording.inputs)
+    start = time.perf_counter()
+    frame = 0
+
+    with warnings.catch_warnings():
+        # ShopState times its messages with pygame.time, which warns when
+        # pygame has not been initialised; timing is irrelevant here.
+        warnings.filterwarnings("ignore", message=r"pygame\.init\(\) has not been called")
+        while frame < recording.frames and host.running:
+            raw_events = events_for(inputs.get(frame, ()))
+            signals = signals_from_events(raw_events)
+            if signals["quit"]:
+                host.running = False
+            host.machine.handle_events(raw_events)
+            host.machine.update(signals)
+            if render_every and frame % render_every == 0:
+                host.machine.render(screen)
+            frame += 1
+
+    return ReplayResult(frame, time.perf_counter() - start,
+                        host.player, host.meta, host.machine)
@@ -0,0 +1,476 @@
+"""
+snapshot.py
+Compact, versioned binary snapshots of a game session.
+
+A snapshot file is a small header followed by one msgpack-style tagged
+value (optionally zlib-compressed):
+
+    magic  b"RPGS"   4 bytes
+    version          1 byte   (`FORMAT_VERSION`)
+    flags            1 byte   (`FLAG_ZLIB`)
+    body             map of sections: player, meta, enemy, state, rng
+
+The body is written section by section through `SnapshotWriter`, so a
+save never builds more than one section in memory. Objects are stored as
+plain data (numbers, strings, class names) and rebuilt on load; nothing
+is pickled.
+"""
+from __future__ import annotations
+
+import os
+import struct
+import zlib
+from typing import BinaryIO
+
+from .. import config
+from ..entities import Player
+from ..entities.archetypes import spawn_enemy
+from ..entities.status import (BleedStatus, PoisonStatus, RegenerationStatus, StatusSet,
+                               StunStatus)
+from ..items.items import ItemMeta
+from ..rng import RNGService, get_service
+from ..states.battle import BattleState
+from ..states.explore import ExploreState
+from ..states.game_over import GameOverState
+from ..states.shop import ShopState
+from ..states.victory import VictoryState
+from ..utils import EncounterMeta
+from .battle_log import BattleLog
+from .state_machine import StateMachine
+
+MAGIC = b"RPGS"
+FORMAT_VERSION = 2  # 2: inventory stored as {class name: quantity}
+FLAG_ZLIB = 0x01
+_HEADER = struct.Struct("<4sBB")
+
+STATUS_TYPES = {cls.__name__: cls for cls in
+                (PoisonStatus, BleedStatus, StunStatus, RegenerationStatus)}
+ITEM_TYPES = {cls.__name__: cls for cls in ItemMeta.registry.values() if cls.can_store}
+
+# Per-state attributes that are not derived from player/meta and must be
+# restored after the state is entered.
+STATE_FIELDS = {
+    "ExploreState": ("log", "encounter_chance", "consecutive_turns"),
+    "BattleState": ("battle_log", "player_turn", "ticked_this_turn"),
+    "VictoryState": ("last_battle_log",),
+    "GameOverState": ("battle_log",),
+    "ShopState": (),
+}
+
+
+class SnapshotError(ValueError):
+    """Raised for data that is not a snapshot this version can read."""
+
+
+# --------------------------------------------------------------------------
+# Tagged encoding (a msgpack subset: nil, bool, int, float, str, bin, array, map)
+# --------------------------------------------------------------------------
+_B = struct.Struct(">B")
+_H = struct.Struct(">H")
+_I = struct.Struct(">I")
+_Q = struct.Struct(">Q")
+_b = struct.Struct(">b")
+_h = struct.Struct(">h")
+_i = struct.Struct(">i")
+_q = struct.Struct(">q")
+_d = struct.Struct(">d")
+
+
+def _pack_header(buf: bytearray, length: int, fix: int, fix_max: int, tags: tuple) -> None:
+    """Append a length-prefixed container/string header."""
+    if length < fix_max:
+        buf.append(fix | length)
+    elif tags[0] is not None and length < 0x100:
+        buf.append(tags[0])
+        buf.append(length)
+    elif length < 0x10000:
+        buf.append(tags[1])
+        buf += _H.pack(length)
+    else:
+        buf.append(tags[2])
+        buf += _I.pack(length)
+
+
+def _pack_int(value: int, buf: bytearray) -> None:
+    if 0 <= value < 0x80:
+        buf.append(value)
+    elif -32 <= value < 0:
+        buf.append(value & 0xFF)
+    elif value >= 0:
+        for tag, fmt, limit in ((0xCC, _B, 0x100), (0xCD, _H, 0x10000),
+                                (0xCE, _I, 0x100000000), (0xCF, _Q, 1 << 64)):
+            if value < limit:
+                buf.append(tag)
+                buf += fmt.pack(value)
+                return
+        raise SnapshotError(f"integer too large: {value}")
+    else:
+        for tag, fmt, limit in ((0xD0, _b, 1 << 7), (0xD1, _h, 1 << 15),
+                                (0xD2, _i, 1 << 31), (0xD3, _q, 1 << 63)):
+            if value >= -limit:
+                buf.append(tag)
+                buf += fmt.pack(value)
+                return
+        raise SnapshotError(f"integer too small: {value}")
+
+
+def pack(value, buf: bytearray | None = None) -> bytearray:
+    """Encode `value` onto `buf` (a new bytearray if omitted) and return it."""
+    if buf is None:
+        buf = bytearray()
+    if value is None:
+        buf.append(0xC0)
+    elif value is True:
+        buf.append(0xC3)
+    elif value is False:
+        buf.append(0xC2)
+    elif isinstance(value, int):
+        _pack_int(value, buf)
+    elif isinstance(value, float):
+        buf.append(0xCB)
+        buf += _d.pack(value)
+    elif isinstance(value, str):
+        data = value.encode("utf-8")
+        _pack_header(buf, len(data), 0xA0, 32, (0xD9, 0xDA, 0xDB))
+        buf += data
+    elif isinstance(value, (bytes, bytearray)):
+        _pack_header(buf, len(value), 0, 0, (0xC4, 0xC5, 0xC6))
+        buf += value
+    elif isinstance(value, (list, tuple)):
+        _pack_header(buf, len(value), 0x90, 16, (None, 0xDC, 0xDD))
+        for item in value:
+            pack(item, buf)
+    elif isinstance(value, dict):
+        _pack_header(buf, len(value), 0x80, 16, (None, 0xDE, 0xDF))
+        for key, item in value.items():
+            pack(key, buf)
+            pack(item, buf)
+    else:
+        raise SnapshotError(f"cannot encode {type(value).__name__}")
+    return buf
+
+
+class _Unpacker:  # pylint: disable=too-few-public-methods
+    """Decodes values produced by `pack` from a bytes buffer."""
+
+    _FIXED = {
+        0xCC: _B, 0xCD: _H, 0xCE: _I, 0xCF: _Q,
+        0xD0: _b, 0xD1: _h, 0xD2: _i, 0xD3: _q, 0xCB: _d,
+    }
+    _LENGTHS = {0xC4: _B, 0xC5: _H, 0xC6: _I, 0xD9: _B, 0xDA: _H, 0xDB: _I,
+                0xDC: _H, 0xDD: _I, 0xDE: _H, 0xDF: _I}
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def _take(self, size: int) -> memoryview:
+        end = self.pos + size
+        if end > len(self.data):
+            raise SnapshotError("truncated snapshot")
+        chunk = self.data[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def _unpack_fmt(self, fmt: struct.Struct):
+        return fmt.unpack(self._take(fmt.size))[0]
+
+    def unpack(self):  # pylint: disable=too-many-return-statements
+        """Decode and return the next value."""
+        tag = self._take(1)[0]
+        if tag < 0x80:
+            return tag
+        if tag >= 0xE0:
+            return tag - 0x100
+        if tag < 0x90:
+            return self._map(tag & 0x0F)
+        if tag < 0xA0:
+            return self._array(tag & 0x0F)
+        if tag < 0xC0:
+            return str(self._take(tag & 0x1F), "utf-8")
+        if tag == 0xC0:
+            return None
+        if tag in (0xC2, 0xC3):
+            return tag == 0xC3
+        if tag in self._FIXED:
+            return self._unpack_fmt(self._FIXED[tag])
+        if tag not in self._LENGTHS:
+            raise SnapshotError(f"unknown tag 0x{tag:02x}")
+        length = self._unpack_fmt(self._LENGTHS[tag])
+        if tag <= 0xC6:
+            return bytes(self._take(length))
+        if tag <= 0xDB:
+            return str(self._take(length), "utf-8")
+        if tag <= 0xDD:
+            return self._array(length)
+        return self._map(length)
+
+    def _array(self, length: int) -> list:
+        return [self.unpack() for _ in range(length)]
+
+    def _map(self, length: int) -> dict:
+        result = {}
+        for _ in range(length):
+            key = self.unpack()
+            result[key] = self.unpack()
+        return result
+
+
+def unpack(data: bytes):
+    """Decode a single value encoded by `pack`."""
+    return _Unpacker(data).unpack()
+
+
+# --------------------------------------------------------------------------
+# Streaming writer / reader
+# --------------------------------------------------------------------------
+class SnapshotWriter:
+    """
+    Writes a snapshot header and then values to a binary stream as they
+    are produced. Use as a context manager, or call `close()` to flush the
+    compressor; the underlying stream is left open.
+    """
+
+    def __init__(self, stream: BinaryIO, compress: bool = False):
+        self.stream = stream
+        self._zlib = zlib.compressobj(level=6) if compress else None
+        self._buf = bytearray()
+        stream.write(_HEADER.pack(MAGIC, FORMAT_VERSION, FLAG_ZLIB if compress else 0))
+
+    def _emit(self) -> None:
+        data = bytes(self._buf) if self._zlib is None else self._zlib.compress(self._buf)
+        if data:
+            self.stream.write(data)
+        self._buf.clear()
+
+    def begin_map(self, length: int) -> None:
+        """Start a map of `length` pairs; follow with key, value, ... writes."""
+        _pack_header(self._buf, length, 0x80, 16, (None, 0xDE, 0xDF))
+
+    def write(self, value) -> None:
+        """Encode `value` and pass it on to the stream."""
+        pack(value, self._buf)
+        self._emit()
+
+    def close(self) -> None:
+        """Flush any buffered compressed data."""
+        if self._buf:
+            self._emit()
+        if self._zlib is not None:
+            self.stream.write(self._zlib.flush())
+            self._zlib = None
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_snapshot(data: bytes):
+    """
+    Validate the header of `data` and decode its body.
+
+    Raises:
+        SnapshotError: If the data is not a snapshot, was written by a newer
+            format version or is corrupt.
+    """
+    if len(data) < _HEADER.size:
+        raise SnapshotError("truncated snapshot header")
+    magic, version, flags = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise SnapshotError("not a snapshot file")
+    if version > FORMAT_VERSION:
+        raise SnapshotError(f"snapshot version {version} is newer than {FORMAT_VERSION}")
+    body = data[_HEADER.size:]
+    if flags & FLAG_ZLIB:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as exc:
+            raise SnapshotError(f"corrupt snapshot: {exc}") from exc
+    return unpack(body)
+
+
+# --------------------------------------------------------------------------
+# Game objects <-> plain data
+# --------------------------------------------------------------------------
+def _entity_data(entity) -> dict:
+    """Combat fields shared by the player and enemies."""
+    return {
+        "health": entity.health,
+        "max_health": getattr(entity, "_max_health", entity.max_health),
+        "stamina": entity.stamina,
+        "block": entity.block_active,
+        "stunned": entity.stunned,
+        "statuses": [(type(s).__name__, s.duration) for s in entity.statuses],
+        "cooldowns": entity.cooldowns,
+    }
+
+
+def _apply_entity(entity, data: dict) -> None:
+    entity.max_health = data["max_health"]
+    entity.health = data["health"]
+    entity.stamina = data["stamina"]
+    entity.block_active = data["block"]
+    entity.stunned = data["stunned"]
+    entity.statuses = StatusSet(STATUS_TYPES[name](duration) for name, duration in data["statuses"])
+    entity.cooldowns = dict(data["cooldowns"])
+
+
+def _player_data(player: Player) -> dict:
+    data = _entity_data(player)
+    state = player.state
+    data.update({
+        "damage_mult": player.damage_mult,
+        "max_hp_mult": player.max_hp_mult,
+        "inventory": {type(item).__name__: qty for item, qty, _ in state.inventory.grouped()},
+        "power_strike_bonus": state.power_strike_bonus,
+        "xp": state.xp,
+        "gold": state.gold,
+        "damage_boost_lvl": state.damage_boost_lvl,
+        "hp_boost_lvl": state.hp_boost_lvl,
+    })
+    return data
+
+
+def _apply_player(player: Player, data: dict) -> None:
+    _apply_entity(player, data)
+    player.damage_mult = data["damage_mult"]
+    player.max_hp_mult = data["max_hp_mult"]
+    state = player.state
+    state.inventory.clear()
+    stacks = data["inventory"]
+    if isinstance(stacks, list):  # version 1: one class name per item
+        stacks = [(name, 1) for name in stacks]
+    else:
+        stacks = stacks.items()
+    for name, qty in stacks:
+        state.inventory.add(ITEM_TYPES[name](), qty)
+    state.power_strike_bonus = data["power_strike_bonus"]
+    state.xp = data["xp"]
+    state.gold = data["gold"]
+    state.damage_boost_lvl = data["damage_boost_lvl"]
+    state.hp_boost_lvl = data["hp_boost_lvl"]
+
+
+def _field_data(value):
+    """Plain data for a state field; logs are saved as their message list."""
+    return list(value) if isinstance(value, BattleLog) else value
+
+
+def capture(player, meta, machine, rng: RNGService | None = None) -> dict:
+    """
+    Return the sections of a snapshot of the given session. `rng` defaults
+    to the service the current state draws from.
+    """
+    state = machine.current
+    if rng is None:
+        rng = getattr(state, "rng", None) or get_service()
+    name = type(state).__name__
+    if name not in STATE_FIELDS:
+        raise SnapshotError(f"cannot snapshot state {name}")
+    enemy = getattr(state, "enemy", None)
+    return {
+        "player": _player_data(player),
+        "meta": {"encounter_index": meta.encounter_index, "fled": meta.fled,
+                 "turns": meta.turns, "battles_won": meta.battles_won},
+        "enemy": None if enemy is None else
+                 dict(_entity_data(enemy), encounter_index=enemy.encounter_index),
+        "state": dict({field: _field_data(getattr(state, field))
+                       for field in STATE_FIELDS[name]}, name=name),
+        "rng": rng.getstate(),
+    }
+
+
+def _build_state(name: str, player, meta, enemy, screen, rng):  # pylint: disable=too-many-arguments
+    """Construct (but do not enter) the FSM state named `name`."""
+    if name == "ExploreState":
+        return ExploreState(player, meta, screen, rng)
+    if name == "ShopState":
+        return ShopState(player, meta, screen, rng)
+    if name == "VictoryState":
+        return VictoryState(player, meta, screen, BattleLog(), rng)
+    if name == "GameOverState":
+        return GameOverState(player, meta, screen, BattleLog(), rng)
+    if name == "BattleState":
+        if enemy is None:
+            raise SnapshotError("battle snapshot without an enemy")
+        return BattleState(player, enemy, meta, screen, rng)
+    raise SnapshotError(f"unknown state {name!r}")
+
+
+def restore(data: dict, screen, rng: RNGService | None = None
+            ) -> tuple[Player, EncounterMeta, StateMachine]:
+    """
+    Rebuild a session from snapshot sections. The saved random streams are
+    restored into `rng` (a new service if omitted).
+
+    Returns:
+        `(player, meta, machine)` like `new_session`.
+    """
+    if rng is None:
+        rng = RNGService()
+    try:
+        rng.setstate(data["rng"])
+        player = Player()
+        meta = EncounterMeta(**data["meta"])
+        enemy_data = data["enemy"]
+        enemy = None if enemy_data is None else spawn_enemy(enemy_data["encounter_index"])
+        state_data = data["state"]
+        state = _build_state(state_data["name"], player, meta, enemy, screen, rng)
+        machine = StateMachine(state)
+
+        # `enter()` resets combatants, so saved values are applied afterwards.
+        _apply_player(player, data["player"])
+        if enemy is not None:
+            _apply_entity(enemy, enemy_data)
+        for field in STATE_FIELDS[state_data["name"]]:
+            current = getattr(state, field)
+            if isinstance(current, BattleLog):
+                # Refill in place: the battle's event subscribers write to it.
+                current.clear()
+                current.extend(state_data[field])
+            else:
+                setattr(state, field, state_data[field])
+    except SnapshotError:
+        raise
+    except (KeyError, TypeError, ValueError, struct.error) as exc:
+        raise SnapshotError(f"malformed snapshot: {exc!r}") from exc
+    return player, meta, machine
+
+
+def write_snapshot(stream: BinaryIO, player, meta, machine,
+                   compress: bool | None = None) -> None:
+    """
+    Stream a snapshot of the session to `stream`, zlib-compressed if
+    `compress` (default `config.SNAPSHOT_COMPRESS`).
+    """
+    if compress is None:
+        compress = config.SNAPSHOT_COMPRESS
+    sections = capture(player, meta, machine)
+    with SnapshotWriter(stream, compress) as writer:
+        writer.begin_map(len(sections))
+        for key, value in sections.items():
+            writer.write(key)
+            writer.write(value)
+
+
+def save(path: str, player, meta, machine, compress: bool | None = None) -> None:
+    """
+    Write a snapshot to `path`, creating parent directories as needed.
+    The file is replaced atomically so a crash never leaves half a save.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as stream:
+        write_snapshot(stream, player, meta, machine, compress)
+    os.replace(tmp_path, path)
+
+
+def load(path: str, screen, rng: RNGService | None = None
+         ) -> tuple[Player, EncounterMeta, StateMachine]:
+    """Read the snapshot at `path` and rebuild its session."""
+    with open(path, "rb") as stream:
+        return restore(read_snapshot(stream.read()), screen, rng)
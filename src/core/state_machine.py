@@ -2,7 +2,10 @@
 state_machine.py
 Provides a robust finite-state machine (FSM) for managing game states.
 """
-from typing import Optional
+from typing import Callable, Optional
+
+from src import config
+from .dirty import DirtyTracker
 
 
 class BaseState:
@@ -13,6 +16,7 @@ class BaseState:
 
     def __init__(self):
         self.machine: Optional["StateMachine"] = None
+        self.dirty = DirtyTracker()
 
     def enter(self, prev_state: "BaseState", **kwargs) -> None:
         """
@@ -45,6 +49,31 @@ class BaseState:
         :param screen: The pygame screen surface.
         """
 
+    def dirty_regions(self) -> list:
+        """
+        Describe the screen as `(name, rect, value)` regions for
+        dirty-rectangle rendering. A region is redrawn only when its value
+        changes; anything outside every region is drawn once on entry.
+        Static screens can keep the default of no regions.
+        """
+        return []
+
+    def invalidate(self) -> None:
+        """Redraw the whole screen on the next frame."""
+        self.dirty.invalidate()
+
+    def wake_after_ms(self) -> Optional[int]:
+        """
+        Milliseconds until this state must update again without any input,
+        0 if it has work to do right now, or None if only input matters.
+        Lets the game loop sleep while waiting for a key press.
+        """
+        return None
+
+    def is_animating(self) -> bool:
+        """True while the state needs updates at the fixed frame rate."""
+        return False
+
 
 class StateMachine:
     """
@@ -54,8 +83,16 @@ class StateMachine:
     def __init__(self, initial_state: BaseState):
         self._state: Optional[BaseState] = None
         self.purchased_flags = {}
+        self._listeners: list[Callable[[Optional[BaseState], BaseState], None]] = []
         self.change(initial_state)
 
+    def add_listener(self, callback: Callable[[Optional[BaseState], BaseState], None]) -> None:
+        """
+        Call `callback(prev_state, new_state)` after every transition, once
+        the new state has been entered.
+        """
+        self._listeners.append(callback)
+
     def change(self, new_state: BaseState, **kwargs) -> None:
         """
         Transitions from the current state to a new one.
@@ -69,6 +106,8 @@ class StateMachine:
         new_state.machine = self
         self._state = new_state
         self._state.enter(prev_state, **kwargs)
+        for callback in self._listeners:
+            callback(prev_state, new_state)
 
     @property
     def current(self) -> Optional[BaseState]:
@@ -85,7 +124,35 @@ class StateMachine:
         if self._state:
             self._state.update(signals)
 
-    def render(self, screen) -> None:
-        """Delegates rendering to the current state."""
+    def invalidate(self) -> None:
+        """Forces the current state to redraw the whole screen."""
         if self._state:
+            self._state.invalidate()
+
+    def idle_timeout(self) -> Optional[int]:
+        """
+        How long the loop may block waiting for input, in milliseconds:
+        None while the current state is animating (run at the frame rate),
+        otherwise its `wake_after_ms()` capped at `config.IDLE_MAX_WAIT_MS`.
+        """
+        if not self._state or self._state.is_animating():
+            return None
+        wake = self._state.wake_after_ms()
+        if wake is None:
+            return config.IDLE_MAX_WAIT_MS
+        return min(max(wake, 0), config.IDLE_MAX_WAIT_MS)
+
+    def render(self, screen) -> list:
+        """
+        Delegates rendering to the current state, but only when one of its
+        dirty regions changed. Drawing is clipped to the changed area.
+        :return: The changed rectangles to pass to `pygame.display.update`.
+        """
+        if not self._state:
+            return []
+        rects = self._state.dirty.collect(self._state.dirty_regions(), screen.get_rect())
+        if rects:
+            screen.set_clip(rects[0].unionall(rects[1:]))
             self._state.render(screen)
+            screen.set_clip(None)
+        return rects
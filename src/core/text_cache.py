@@ -0,0 +1,72 @@
+"""
+text_cache.py
+Font registry and LRU cache of rendered text surfaces.
+
+Building a `pygame.font.Font` and rendering a string are by far the most
+expensive parts of drawing the HUD, yet nearly every label is identical
+from one frame to the next. `TextCache` keeps one Font per size and the
+most recently used rendered surfaces keyed by (text, size, color,
+antialias). Returned surfaces are shared and must not be drawn onto.
+"""
+from collections import OrderedDict
+
+import pygame
+
+from src import config
+
+
+class TextCache:
+    """Caches fonts by size and rendered text surfaces by content."""
+
+    def __init__(self, maxsize: int = config.TEXT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._fonts: dict[int, pygame.font.Font] = {}
+        self._surfaces: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size: int) -> pygame.font.Font:
+        """Return the shared default Font for `size`, creating it once."""
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def render(self, text: str, size: int, color, antialias: bool = True) -> pygame.Surface:
+        """Return the rendered surface for `text`, rendering only on a miss."""
+        key = (text, size, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(size).render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.maxsize:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of render() calls served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Counters for profiling overlays and benchmarks."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "entries": len(self._surfaces),
+            "fonts": len(self._fonts),
+        }
+
+    def clear(self) -> None:
+        """Drop all fonts and surfaces, e.g. after pygame.font.quit()."""
+        self._fonts.clear()
+        self._surfaces.clear()
+        self.hits = 0
+        self.misses = 0
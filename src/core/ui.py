@@ -8,6 +8,8 @@ import pygame
 
 from src import config
 from ..utils import HealthBarSpec, group_inventory
+from .assets import AssetManager
+from .text_cache import TextCache
 
 
 class UI:
@@ -17,6 +19,13 @@ class UI:
     """
 
     _last_message: str = ""
+    text_cache = TextCache()
+    assets = AssetManager()
+
+    @classmethod
+    def get_font(cls, font_size: int) -> pygame.font.Font:
+        """Return the shared font for `font_size` from the registry."""
+        return cls.text_cache.font(font_size)
 
     @staticmethod
     def render_inventory(screen, inventory, pos=(10, 10)):
@@ -57,24 +66,25 @@ class UI:
         font_size=config.DEFAULT_FONT_SIZE,
         color=config.TEXT_COLOR,
         center: bool = False,
-    ):
+    ) -> pygame.Rect:
         """
         Display text on the screen at the specified position.
 
         If `center` is True, `position` is treated as the center coordinate.
+        Rendered surfaces come from `UI.text_cache`. Returns the drawn rect.
         """
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(text, True, color)
+        text_surface = UI.text_cache.render(text, font_size, color)
         text_rect = text_surface.get_rect()
         if center:
             text_rect.center = position
         else:
             text_rect.topleft = position
         screen.blit(text_surface, text_rect)
+        return text_rect
 
     @staticmethod
-    def draw_health_bar(screen, spec: HealthBarSpec):
-        """Draws a health bar using a HealthBarSpec."""
+    def draw_health_bar(screen, spec: HealthBarSpec) -> pygame.Rect:
+        """Draws a health bar using a HealthBarSpec; returns the area drawn."""
         bar_width = config.HEALTH_BAR_WIDTH
         bar_height = config.HEALTH_BAR_HEIGHT
 
@@ -88,20 +98,21 @@ class UI:
         pygame.draw.rect(screen, spec.color, fill_rect)
         pygame.draw.rect(screen, config.TEXT_COLOR, outline_rect, 2)
 
-        UI.display_text(
+        label_rect = UI.display_text(
             screen,
             spec.label,
             (spec.x, spec.y - config.HEALTH_BAR_LABEL_Y_OFFSET),
             font_size=config.LARGE_FONT_SIZE,
             color=spec.color,
         )
-        UI.display_text(
+        value_rect = UI.display_text(
             screen,
             f"{spec.current} / {spec.max_val}",
             (spec.x + bar_width + config.HEALTH_BAR_TEXT_X_OFFSET, spec.y),
             font_size=config.MEDIUM_FONT_SIZE,
             color=config.TEXT_COLOR,
         )
+        return outline_rect.unionall((label_rect, value_rect))
     
     @staticmethod
     def format_skill_label(skill, keybind: str, remaining_cd: int) -> str:
@@ -112,16 +123,18 @@ class UI:
         return f"{keybind} {name} READY"
 
     @staticmethod
-    def render_skill_bar(screen, skills: list, cooldowns: dict, font, x: int, y: int):
+    def render_skill_bar(screen, skills: list, cooldowns: dict, font_size: int, x: int,
+                         y: int) -> pygame.Rect:
         """
         Render skill hot-key labels and remaining cool-downs.
 
         Example output:
         Q Shield Bash (2)   W Adrenaline Rush READY   E--   R--
-        Grey out text when CD > 0.
+        Grey out text when CD > 0. Returns the area drawn.
         """
         keys = ["Q", "W", "E", "R"]
         offset = 0
+        drawn = []
         for i, key in enumerate(keys):
             if i < len(skills):
                 skill = skills[i]
@@ -132,9 +145,11 @@ class UI:
                 label = f"{key}--"
                 color = config.TEXT_COLOR
 
-            text_surface = font.render(label, True, color)
-            screen.blit(text_surface, (x + offset, y))
-            offset += text_surface.get_width() + 10
+            text_rect = UI.display_text(screen, label, (x + offset, y),
+                                        font_size=font_size, color=color)
+            drawn.append(text_rect)
+            offset += text_rect.width + 10
+        return drawn[0].unionall(drawn[1:])
 
     @staticmethod
     def render_battle_screen(screen, battle_state):
@@ -173,9 +188,8 @@ class UI:
 
         # Skill bar
         y_offset = config.BATTLE_PLAYER_HEALTH_POS[1] + 70
-        small_font = pygame.font.Font(None, config.SMALL_FONT_SIZE)
         UI.render_skill_bar(screen, battle_state.player.skills,
-                            battle_state.player.cooldowns, small_font, 20,
+                            battle_state.player.cooldowns, config.SMALL_FONT_SIZE, 20,
                             y_offset)
 
 
@@ -224,6 +238,50 @@ class UI:
                 color=config.LOG_COLORS[i],
             )
 
+    @staticmethod
+    def inventory_signature(inventory) -> tuple:
+        """Hashable summary of the quick-slots drawn by render_inventory."""
+        return tuple((item.name, qty) for item, qty, _ in group_inventory(inventory)[:9])
+
+    @staticmethod
+    def log_signature(log) -> tuple:
+        """
+        Hashable summary of a message log: a `BattleLog`'s identity and
+        revision (no formatting needed), or the messages of a plain list.
+        """
+        revision = getattr(log, "revision", None)
+        if revision is None:
+            return tuple(log[-config.MAX_LOG_MESSAGES:])
+        return (id(log), revision)
+
+    @staticmethod
+    def battle_screen_regions(battle_state) -> list:
+        """
+        Dirty regions of the battle screen as full-width bands, each keyed
+        by the values drawn inside it (see `BaseState.dirty_regions`).
+        """
+        player, enemy = battle_state.player, battle_state.enemy
+        width = config.SCREEN_WIDTH
+        player_y = config.BATTLE_PLAYER_HEALTH_POS[1]
+        enemy_y = config.BATTLE_ENEMY_HEALTH_POS[1]
+        log_y = config.BATTLE_LOG_START_POS[1]
+        return [
+            ("header", pygame.Rect(0, 0, width, player_y + config.HEALTH_BAR_HEIGHT + 5),
+             (player.gold, player.health, battle_state.player_max_health)),
+            ("stamina", pygame.Rect(0, player_y + 35, width, 35),
+             (player.stamina, player.max_stamina,
+              _status_signature(player), _status_signature(enemy))),
+            ("skills", pygame.Rect(0, player_y + 68, width, 26),
+             tuple(player.cooldowns.get(skill.name, 0) for skill in player.skills)),
+            ("enemy", pygame.Rect(0, enemy_y - config.HEALTH_BAR_LABEL_Y_OFFSET, width,
+                                  config.HEALTH_BAR_LABEL_Y_OFFSET + config.HEALTH_BAR_HEIGHT + 5),
+             (enemy.name, enemy.health, battle_state.enemy_max_health)),
+            ("instructions", pygame.Rect(0, config.BATTLE_INSTRUCTIONS_POS[1] - 5, width, 35),
+             battle_state.player_turn),
+            ("log", pygame.Rect(0, log_y - 10, width, config.SCREEN_HEIGHT - log_y + 10),
+             (UI.log_signature(battle_state.battle_log), UI.inventory_signature(player.inventory))),
+        ]
+
     @staticmethod
     def render_explore_log(screen, log):
         """Renders the exploration log."""
@@ -253,44 +311,58 @@ def flash_message(screen: pygame.Surface, text: str,
     UI.display_text(screen, text, pos, font_size=config.LARGE_FONT_SIZE, color=color, center=True)
 
 
-def render_status_icons(surface: pygame.Surface, entity, pos: tuple[int, int]) -> None:
+STATUS_COLORS = {
+    "poison": (80, 200, 120),
+    "bleed": (200, 40, 40),
+    "stun": (255, 215, 0),
+    "regeneration": (50, 180, 255),
+}
+
+
+def _status_signature(entity) -> tuple:
+    """Hashable summary of the icons drawn by render_status_icons."""
+    return tuple((status.name, status.duration) for status in entity.statuses)
+
+
+def render_status_icons(surface: pygame.Surface, entity,
+                        pos: tuple[int, int]) -> pygame.Rect | None:
     """
-    Draw a 16×16 coloured square and a text label for each active status.
+    Draw an icon (one atlas cell, `config.ICON_SIZE` square) and a text
+    label for each active status.
     pos = (x, y) top-left anchor; icons and labels stack horizontally.
-    Uses entity.statuses; colour mapping hard-coded for now.
+    Icons come from `UI.assets` by `Status.icon_key`; statuses without
+    icon art get a square of their colour from STATUS_COLORS.
+    Returns the area drawn, or None without any statuses.
     """
-    colour_map = {
-        "poison": (80, 200, 120),
-        "bleed": (200, 40, 40),
-        "stun": (255, 215, 0),
-        "regeneration": (50, 180, 255),
-    }
-    icon_size = 16
+    icon_size = UI.assets.cell
     padding = 4  # Increased padding for text
     base_x, base_y = pos
     current_x = base_x
+    drawn = None
 
     for status in entity.statuses:
         # Draw the icon
-        colour = colour_map.get(status.name.lower(), (150, 150, 150))
-        rect = pygame.Rect(current_x, base_y, icon_size, icon_size)
-        pygame.draw.rect(surface, colour, rect)
+        colour = STATUS_COLORS.get(status.name.lower(), (150, 150, 150))
+        icon_rect = surface.blit(UI.assets.icon(status.icon_key, fallback=colour),
+                                 (current_x, base_y))
         current_x += icon_size + padding
 
         # Draw the text label
         label = f"{status.name.capitalize()} ({status.duration})"
-        UI.display_text(
+        text_rect = UI.display_text(
             surface,
             label,
             (current_x, base_y),
             font_size=config.SMALL_FONT_SIZE - 2,
             color=colour
         )
-        
+
         # Advance current_x by the width of the text plus padding
-        font = pygame.font.Font(None, config.SMALL_FONT_SIZE - 2)
-        text_width, _ = font.size(label)
-        current_x += text_width + padding * 3
+        current_x += text_rect.width + padding * 3
+        drawn = icon_rect.union(text_rect) if drawn is None else drawn.unionall(
+            (icon_rect, text_rect))
+
+    return drawn
 
 def render_battle_screen(*args, **kwargs):
     """
@@ -0,0 +1,279 @@
+"""
+widgets.py
+Retained-mode HUD widgets.
+
+A widget draws one HUD element (a health bar, the skill bar, the log ...)
+onto a surface of its own and keeps it. Every frame it asks its `bind`
+callable for the values it shows and only composes the surface again when
+they differ from the last frame; otherwise drawing it is a single blit.
+Widgets paint with the same helpers as the immediate-mode `UI` functions,
+so both look identical.
+"""
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Callable, Iterable
+
+import pygame
+
+from src import config
+from ..utils import HealthBarSpec, group_inventory
+from .ui import UI, render_status_icons
+
+Painter = Callable[[pygame.Surface, tuple[int, int], object], pygame.Rect | None]
+
+
+def union(rects: list[pygame.Rect], origin: tuple[int, int]) -> pygame.Rect:
+    """The area covered by `rects`; an empty rect at `origin` if there are none."""
+    if not rects:
+        return pygame.Rect(origin, (0, 0))
+    return rects[0].unionall(rects[1:])
+
+
+class Widget(ABC):
+    """
+    A HUD element at `pos` that shows the value returned by `bind()`.
+
+    `bind()` must return a snapshot that compares equal as long as the
+    widget would look the same (numbers, strings, tuples of those), not a
+    mutable container. Subclasses implement `paint(surface, origin, value)`,
+    drawing `value` as if the widget sat at `origin` and returning the area
+    drawn, and may narrow `extent`, the area relative to `pos` they can draw
+    into.
+    """
+
+    def __init__(self, pos: tuple[int, int], bind: Callable[[], object]):
+        self.pos = pos
+        self.bind = bind
+        self.extent = pygame.Rect(0, 0, config.SCREEN_WIDTH - pos[0],
+                                  config.SCREEN_HEIGHT - pos[1])
+        self.renders = 0
+        self._value = None
+        self._surface: pygame.Surface | None = None
+        self._offset = (0, 0)
+
+    @abstractmethod
+    def paint(self, surface: pygame.Surface, origin: tuple[int, int],
+              value) -> pygame.Rect | None:
+        """
+        Draw `value` onto `surface` with the widget's `pos` at `origin`.
+        Returns the area drawn, or None to have it found from the pixels.
+        """
+
+    def compose(self, value) -> tuple[pygame.Surface, tuple[int, int]]:
+        """A new surface showing `value`, and its offset from `pos`."""
+        extent = self.extent
+        layer = pygame.Surface(extent.size, pygame.SRCALPHA)  # pylint: disable=no-member
+        bounds = self.paint(layer, (-extent.x, -extent.y), value)
+        # Scanning for the bounding rect walks every pixel of the layer.
+        if bounds is None:
+            bounds = layer.get_bounding_rect()
+        else:
+            bounds = bounds.clip(layer.get_rect())
+        return (layer.subsurface(bounds).copy(),
+                (extent.x + bounds.x, extent.y + bounds.y))
+
+    def refresh(self) -> bool:
+        """Compose the surface again if the bound value changed; True if it did."""
+        value = self.bind()
+        if self._surface is not None and value == self._value:
+            return False
+        self._surface, self._offset = self.compose(value)
+        self._value = value
+        self.renders += 1
+        return True
+
+    def draw(self, screen: pygame.Surface) -> pygame.Rect:
+        """Blit the (possibly refreshed) surface; returns the covered rect."""
+        self.refresh()
+        return screen.blit(self._surface, (self.pos[0] + self._offset[0],
+                                           self.pos[1] + self._offset[1]))
+
+    def invalidate(self) -> None:
+        """Compose the surface again on the next draw."""
+        self._surface = None
+
+
+class Panel(Widget):
+    """A widget painted by a plain function, for one-off screen layouts."""
+
+    def __init__(self, pos: tuple[int, int], bind: Callable[[], object], painter: Painter):
+        super().__init__(pos, bind)
+        self.painter = painter
+
+    def paint(self, surface, origin, value) -> pygame.Rect | None:
+        return self.painter(surface, origin, value)
+
+
+class StaticLayer(Panel):
+    """
+    A state's static content (titles, key hints), painted once by
+    `painter(surface, origin, layout)` over the whole screen and blitted
+    as one cropped layer. It is painted again only when the screen size
+    or `layout()` changes.
+    """
+
+    def __init__(self, painter: Painter, layout: Callable[[], object] = lambda: None):
+        super().__init__((0, 0), lambda: (config.SCREEN_WIDTH, config.SCREEN_HEIGHT, layout()),
+                         painter)
+
+    def paint(self, surface, origin, value) -> pygame.Rect | None:
+        return super().paint(surface, origin, value[2])
+
+    def refresh(self) -> bool:
+        self.extent.size = (config.SCREEN_WIDTH, config.SCREEN_HEIGHT)
+        return super().refresh()
+
+
+class Label(Widget):
+    """
+    One line of text. `bind()` returns the text, or a `(text, color)`
+    pair when the color changes too.
+    """
+
+    def __init__(self, pos: tuple[int, int], bind: Callable[[], object],
+                 font_size: int = config.DEFAULT_FONT_SIZE, color=config.TEXT_COLOR):
+        super().__init__(pos, bind)
+        self.font_size = font_size
+        self.color = color
+
+    def _text(self, value) -> pygame.Surface:
+        text, color = value if isinstance(value, tuple) else (value, self.color)
+        return UI.text_cache.render(text, self.font_size, color)
+
+    def compose(self, value) -> tuple[pygame.Surface, tuple[int, int]]:
+        """The cached text surface itself; no layer is needed for one line."""
+        return self._text(value), (0, 0)
+
+    def paint(self, surface, origin, value) -> pygame.Rect:
+        return surface.blit(self._text(value), origin)
+
+
+class HealthBar(Widget):
+    """
+    Labelled health bar at `pos` (the bar's top-left corner). `bind()`
+    returns `(label, current, max_val)`.
+    """
+
+    def __init__(self, pos: tuple[int, int], bind: Callable[[], tuple], color):
+        super().__init__(pos, bind)
+        self.color = color
+        top = -config.HEALTH_BAR_LABEL_Y_OFFSET
+        self.extent = pygame.Rect(0, top, config.SCREEN_WIDTH - pos[0],
+                                  config.HEALTH_BAR_HEIGHT - 2 * top)
+
+    def paint(self, surface, origin, value) -> pygame.Rect:
+        label, current, max_val = value
+        spec = HealthBarSpec(*origin, current=current, max_val=max_val, color=self.color,
+                             label=label)
+        return UI.draw_health_bar(surface, spec)
+
+
+class SkillBar(Widget):
+    """
+    Skill hot-keys and cool-downs of `entity()`; redrawn only when a
+    cool-down ticks or the skills change.
+    """
+
+    def __init__(self, pos: tuple[int, int], entity: Callable[[], object],
+                 font_size: int = config.SMALL_FONT_SIZE):
+        super().__init__(pos, lambda: self.slots(entity()))
+        self.font_size = font_size
+        self.extent.height = 2 * font_size
+
+    @staticmethod
+    def slots(entity) -> tuple:
+        """`(skill, remaining cool-down)` for each of the entity's skills."""
+        cooldowns = entity.cooldowns
+        return tuple((skill, cooldowns.get(skill.name, 0)) for skill in entity.skills)
+
+    def paint(self, surface, origin, value) -> pygame.Rect:
+        skills = [skill for skill, _ in value]
+        cooldowns = {skill.name: cd for skill, cd in value}
+        return UI.render_skill_bar(surface, skills, cooldowns, self.font_size, *origin)
+
+
+class InventoryPanel(Widget):
+    """Quick-slot list of `inventory()`: each item, its count and description."""
+
+    def __init__(self, pos: tuple[int, int], inventory: Callable[[], Iterable]):
+        super().__init__(pos, lambda: self.rows(inventory()))
+
+    @staticmethod
+    def rows(inventory) -> tuple:
+        """`(name, qty, description)` of each quick-slot."""
+        return tuple((item.name, qty, item.description)
+                     for item, qty, _ in group_inventory(inventory)[:9])
+
+    def paint(self, surface, origin, value) -> pygame.Rect:
+        x, y = origin
+        drawn = []
+        for idx, (name, qty, description) in enumerate(value):
+            drawn.append(UI.display_text(surface, f"{idx + 1}. {name} x{qty}",
+                                         (x, y + idx * 40), font_size=config.SMALL_FONT_SIZE))
+            drawn.append(UI.display_text(surface, f"  {description}", (x, y + idx * 40 + 20),
+                                         font_size=config.SMALL_FONT_SIZE - 4,
+                                         color=config.UI_ACCENT_COLOR))
+        return union(drawn, origin)
+
+
+class LogPanel(Widget):
+    """
+    The newest messages of `log()`, newest first and fading with age.
+    Keyed on `UI.log_signature`, so a `BattleLog` is only formatted when
+    a message was added.
+    """
+
+    def __init__(self, pos: tuple[int, int], log: Callable[[], list],
+                 lines: int = config.MAX_LOG_MESSAGES):
+        super().__init__(pos, lambda: UI.log_signature(log()))
+        self.log = log
+        self.lines = lines
+
+    def paint(self, surface, origin, value) -> pygame.Rect:
+        x, y = origin
+        return union([UI.display_text(surface, msg, (x, y + i * config.BATTLE_LOG_LINE_SPACING),
+                                      font_size=config.MEDIUM_FONT_SIZE,
+                                      color=config.LOG_COLORS[i])
+                      for i, msg in enumerate(reversed(self.log()[-self.lines:]))], origin)
+
+
+class StatusIcons(Widget):
+    """Status icons of `entity()`, as drawn by `render_status_icons`."""
+
+    def __init__(self, pos: tuple[int, int], entity: Callable[[], object]):
+        super().__init__(pos, lambda: tuple((status.name, status.duration)
+                                            for status in entity().statuses))
+        self.entity = entity
+        self.extent.height = 2 * config.SMALL_FONT_SIZE
+
+    def paint(self, surface, origin, value) -> pygame.Rect:
+        return render_status_icons(surface, self.entity(), origin) or pygame.Rect(origin, (0, 0))
+
+
+class WidgetGroup:
+    """Widgets drawn together, in order."""
+
+    def __init__(self, widgets: Iterable[Widget] = ()):
+        self.widgets = list(widgets)
+
+    def add(self, widget: Widget) -> Widget:
+        """Append `widget` and return it."""
+        self.widgets.append(widget)
+        return widget
+
+    def draw(self, screen: pygame.Surface) -> None:
+        """Draw every widget."""
+        for widget in self.widgets:
+            widget.draw(screen)
+
+    def invalidate(self) -> None:
+        """Compose every widget again on the next draw."""
+        for widget in self.widgets:
+            widget.invalidate()
+
+    @property
+    def renders(self) -> int:
+        """Surfaces composed so far by all widgets."""
+        return sum(widget.renders for widget in self.widgets)
+
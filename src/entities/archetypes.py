@@ -0,0 +1,145 @@
+"""
+archetypes.py
+Precomputed enemy stats and rewards per encounter index, and a pool of
+reusable `Enemy` objects (see `src/pool.py`).
+
+An `EnemyArchetype` is everything about an enemy that depends only on its
+encounter index: name, max health, attack, skills and the XP/gold it is
+worth. `ArchetypeTable` computes them up to `config.ENEMY_TABLE_DEPTH`
+up front and extends itself lazily past that, so spawning is a list
+lookup. The table remembers the `config` values it was built from and
+rebuilds itself when a sweep or test changes them.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .. import config
+from ..abilities.base import Ability
+from ..abilities.enemy_abilities import EnemyAttackAbility, get_default_enemy_skills
+from ..pool import ObjectPool
+
+if TYPE_CHECKING:
+    from .enemy import Enemy
+
+
+@dataclass(frozen=True, slots=True)
+class EnemyArchetype:
+    """Stats and rewards of the enemy at one encounter index."""
+    encounter_index: int
+    name: str
+    max_health: int
+    attack: int
+    xp: int
+    gold: int
+    attack_ability: Ability
+    skills: tuple[Ability, ...]
+
+
+def _config_signature() -> tuple:
+    return (config.ENEMY_BASE_HEALTH, config.ENEMY_HEALTH_SCALING,
+            config.ENEMY_BASE_ATTACK, config.ENEMY_ATTACK_SCALING)
+
+
+class ArchetypeTable:
+    """Enemy archetypes by encounter index, computed once per config."""
+
+    def __init__(self, depth: int | None = None):
+        """
+        Args:
+            depth: Encounter indices to precompute; `config.ENEMY_TABLE_DEPTH`
+                if omitted. Deeper indices are added on first use.
+        """
+        self.depth = config.ENEMY_TABLE_DEPTH if depth is None else depth
+        self._signature: tuple | None = None
+        self._rows: list[EnemyArchetype] = []
+        # Abilities keep no per-user state (cool-downs live on the entity),
+        # so every enemy shares the same instances.
+        self._attack_ability = EnemyAttackAbility()
+        self._skills = tuple(get_default_enemy_skills())
+
+    def _build(self, index: int) -> EnemyArchetype:
+        level = index - 1
+        return EnemyArchetype(
+            encounter_index=index,
+            name=f"Enemy lvl {index}",
+            max_health=config.ENEMY_BASE_HEALTH + level * config.ENEMY_HEALTH_SCALING,
+            attack=config.ENEMY_BASE_ATTACK + level * config.ENEMY_ATTACK_SCALING,
+            xp=max(1, (index + 1) * 10),
+            gold=(index + 1) * 5,
+            attack_ability=self._attack_ability,
+            skills=self._skills,
+        )
+
+    def _extend(self, count: int) -> None:
+        rows = self._rows
+        for index in range(len(rows), count):
+            rows.append(self._build(index))
+
+    def __getitem__(self, index: int) -> EnemyArchetype:
+        signature = _config_signature()
+        if signature != self._signature:
+            self._signature = signature
+            self._rows = []
+            self._extend(self.depth)
+        if index < 0:
+            return self._build(index)  # never spawned by the game; not cached
+        if index >= len(self._rows):
+            self._extend(index + 1)
+        return self._rows[index]
+
+    def __len__(self) -> int:
+        """Number of indices computed so far."""
+        return len(self._rows)
+
+
+ARCHETYPES = ArchetypeTable()
+
+
+def get_archetype(encounter_index: int) -> EnemyArchetype:
+    """The archetype for `encounter_index` from the shared table."""
+    return ARCHETYPES[encounter_index]
+
+
+class EnemyPool(ObjectPool):
+    """
+    Pool of `Enemy` objects.
+
+    `acquire(index)` respawns a released enemy as the archetype for
+    `index` (full health, no statuses or cool-downs) instead of
+    constructing a new one. Only enemies this pool handed out are taken
+    back, so releasing an enemy built directly with `Enemy(...)` is a no-op.
+    """
+
+    def __init__(self, max_size: int = 16, name: str | None = None):
+        super().__init__(self._spawn, self._respawn, max_size, name)
+
+    def _spawn(self, encounter_index: int) -> Enemy:
+        from .enemy import Enemy  # pylint: disable=import-outside-toplevel
+        enemy = Enemy(encounter_index)
+        enemy.pool = self
+        return enemy
+
+    @staticmethod
+    def _respawn(enemy: Enemy, encounter_index: int) -> None:
+        enemy.respawn(get_archetype(encounter_index))
+
+    def release(self, enemy: Enemy) -> None:
+        """Take back `enemy` if it came from this pool and is not free already."""
+        if enemy.pool is self and enemy not in self._free:
+            super().release(enemy)
+
+
+ENEMY_POOL = EnemyPool(name="enemies")
+
+
+def spawn_enemy(encounter_index: int) -> Enemy:
+    """An enemy of `encounter_index` from the shared pool."""
+    return ENEMY_POOL.acquire(encounter_index)
+
+
+def release_enemy(enemy: Enemy) -> None:
+    """Hand a spawned enemy back to the shared pool once its battle is over."""
+    if enemy.pool is not None:
+        enemy.pool.release(enemy)
@@ -5,9 +5,9 @@ Base class for all entities in the game.
 from __future__ import annotations
 import abc
 from math import ceil
-from typing import List, Type
+from typing import Type
 from src import config
-from .status import Status
+from .status import Polarity, Status, StatusSet, tick_all
 
 
 # pylint: disable=cyclic-import
@@ -24,28 +24,29 @@ class Entity(abc.ABC):  # pylint: disable=too-many-instance-attributes
         self.max_stamina: int = config.MAX_STAMINA
         self.stamina: int = 1
         self.block_active: bool = False
-        self.statuses: List[Status] = []
+        self.statuses: StatusSet = StatusSet()
         self.stunned: bool = False
         self.cooldowns: dict[str, int] = {}
 
-    def apply_status(self, status: Status) -> None:
-        """Append a fresh Status and immediately call its on_apply hook."""
-        self.statuses.append(status)
-        status.on_apply(self)
+    def apply_status(self, status: Status) -> Status:
+        """
+        Apply a Status following its stacking rule; a newly added one gets
+        its on_apply hook called immediately. Returns the live status:
+        `status` itself if it was added, else the one it merged into.
+        """
+        live = self.statuses.add(status)
+        if live is status:
+            status.on_apply(self)
+        return live
 
     def tick_statuses(self, battle_state) -> None:
         """Tick each active Status at the start of the entity’s turn.
         Removes expired statuses."""
-        expired: list[Status] = []
-        for s in self.statuses:
-            if s.tick(self, battle_state):
-                expired.append(s)
-        for s in expired:
-            self.statuses.remove(s)
+        tick_all((self,), battle_state)
 
     def has_status(self, status_type: Type[Status]) -> bool:
         """Return True if an active status of given subclass exists."""
-        return any(isinstance(s, status_type) for s in self.statuses)
+        return self.statuses.has(status_type)
 
     def take_damage(self, raw_damage: int):
         """
@@ -80,17 +81,13 @@ class Entity(abc.ABC):  # pylint: disable=too-many-instance-attributes
 
     def clear_negative_statuses(self) -> int:
         """
-        Removes all statuses considered negative (e.g., poison, bleed, stun).
+        Removes all statuses with negative polarity (e.g., poison, bleed, stun).
         Returns the number of statuses cleared.
         """
-        negative_status_names = {"poison", "bleed", "stun"}
-        to_remove = [s for s in self.statuses if s.name in negative_status_names]
-        
-        for s in to_remove:
+        removed = self.statuses.pop_polarity(Polarity.NEGATIVE)
+        for s in removed:
             s.on_expire(self)
-            self.statuses.remove(s)
-            
-        return len(to_remove)
+        return len(removed)
 
     def tick_cooldowns(self):
         """Iterate over self.cooldowns and decrement every value > 0 by 1."""
@@ -2,27 +2,54 @@
 enemy.py
 Defines the enemy characters.
 """
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from .. import config
+from .archetypes import EnemyArchetype, get_archetype
 from .base import Entity
 from .mixins import ActionMixin
-from ..abilities.base import Ability
-from ..abilities.enemy_abilities import EnemyAttackAbility, get_default_enemy_skills
+
+if TYPE_CHECKING:
+    from .archetypes import EnemyPool
+
 
 class Enemy(Entity, ActionMixin):
-    """The enemy entity."""
+    """
+    The enemy entity. Its stats come from the precomputed archetype for
+    its encounter index (see `archetypes.py`).
+    """
+
+    pool: EnemyPool | None = None  # set on enemies handed out by an EnemyPool
 
     def __init__(self, encounter_index=1):
-        base_health = config.ENEMY_BASE_HEALTH + (encounter_index - 1) * config.ENEMY_HEALTH_SCALING
-        self.health = base_health
-        base_attack = config.ENEMY_BASE_ATTACK + (encounter_index - 1) * config.ENEMY_ATTACK_SCALING
+        archetype = get_archetype(encounter_index)
         super().__init__(
-            name=f"Enemy lvl {encounter_index}", health=self.health, attack=base_attack
+            name=archetype.name, health=archetype.max_health, attack=archetype.attack
         )
+        self.archetype = archetype
         self.encounter_index = encounter_index
 
-        # Abilities
-        self.attack_ability = EnemyAttackAbility()
-        self.skills: list[Ability] = get_default_enemy_skills()
+        # Abilities (stateless, shared by every enemy)
+        self.attack_ability = archetype.attack_ability
+        self.skills = archetype.skills
+
+    def respawn(self, archetype: EnemyArchetype) -> None:
+        """Turn this (pooled) enemy into a fresh one of `archetype`."""
+        self.archetype = archetype
+        self.encounter_index = archetype.encounter_index
+        self.name = archetype.name
+        self.max_health = self.health = archetype.max_health
+        self.attack = archetype.attack
+        self.attack_ability = archetype.attack_ability
+        self.skills = archetype.skills
+        self.max_stamina = config.MAX_STAMINA
+        self.stamina = 1
+        self.block_active = False
+        self.stunned = False
+        self.statuses.clear()
+        self.cooldowns.clear()
 
     def reset(self):
         """Resets the enemy's stats for a new encounter."""
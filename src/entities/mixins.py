@@ -6,14 +6,15 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from random import Random
     from .base import Entity
 
 
 class ActionMixin:
     """Mixin for common entity actions like attacking and defending."""
 
-    def attack_action(self, target: Entity) -> dict:
-        """Wrapper for the attack ability."""
+    def attack_action(self, target: Entity, rng: Random | None = None) -> dict:
+        """Wrapper for the attack ability; `rng` is passed on for its rolls."""
         if getattr(self, "stunned", False):
             # Cannot act while stunned; consume no stamina and return early
             return {"damage": 0, "crit": False, "miss": False, "stunned": True}
@@ -27,7 +28,7 @@ class ActionMixin:
         if hasattr(self, 'spend_stamina'):
             self.spend_stamina(1)
 
-        result = self.attack_ability.execute(self, target)
+        result = self.attack_ability.execute(self, target, rng=rng)
         return result
 
     def defend(self):
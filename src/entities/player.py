@@ -10,6 +10,7 @@ from src.abilities.player_abilities import (PlayerAttackAbility,
                                             PlayerDefendAbility, AdrenalineRushAbility, ShieldBashAbility)
 
 
+from ..items.inventory import Inventory
 from ..items.items import Item
 from .base import Entity
 from .mixins import ActionMixin
@@ -19,7 +20,7 @@ from .mixins import ActionMixin
 @dataclass
 class PlayerState:
     """A container for player-specific state."""
-    inventory: list[Item] = field(default_factory=list)
+    inventory: Inventory = field(default_factory=Inventory)
     power_strike_bonus: int = 0
     xp: int = 0
     gold: int = 0
@@ -87,23 +88,32 @@ class Player(Entity, ActionMixin):
 
     def add_item(self, item: Item):
         """Adds an item to the player's inventory."""
-        self.state.inventory.append(item)
+        self.state.inventory.add(item)
 
     def remove_item(self, item: Item):
-        """Removes an item from the player's inventory."""
-        if item in self.state.inventory:
-            self.state.inventory.remove(item)
+        """Removes an item like `item` from the player's inventory."""
+        self.state.inventory.remove(item)
+
+    def use_slot(self, slot: int) -> dict | None:
+        """
+        Uses one item from inventory slot `slot` (0-based, as shown in the
+        quick-slot list). Returns the result from the item's use() method.
+        """
+        inventory = self.state.inventory
+        if 0 <= slot < inventory.slot_count:
+            item, _ = inventory.slot(slot)
+            result = item.use(self)
+            inventory.take(slot)
+            return result
+        return None
 
     def use_item(self, index: int) -> dict | None:
         """
-        Uses an item from the inventory by its index.
+        Uses an item from the inventory by its index in the flat list view.
         Returns the result from the item's use() method.
         """
         if 0 <= index < len(self.state.inventory):
-            item = self.state.inventory[index]
-            result = item.use(self)
-            self.remove_item(item)
-            return result
+            return self.use_slot(self.state.inventory.slot_of_index(index))
         return None
 
     def gain_xp(self, amount: int):
@@ -1,11 +1,35 @@
 """Defines status effects that can be applied to entities."""
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Iterable, Iterator
 import math
 
+from src import config
+from src.utils import add_to_log
+
+
+class Polarity(Enum):
+    """Whether a status helps or harms its bearer (antidotes clear NEGATIVE)."""
+    POSITIVE = "positive"
+    NEGATIVE = "negative"
+
+
+class Stacking(Enum):
+    """What applying a status does when its type is already active."""
+    REFRESH = "refresh"  # keep one instance; duration becomes the longer of the two
+    EXTEND = "extend"    # keep one instance; durations add up
+    STACK = "stack"      # keep every instance; each ticks on its own
+
+
 class Status(ABC):
     """Abstract base class for status effects."""
     name: str = ""
     icon_key: str = ""
+    polarity: Polarity = Polarity.NEGATIVE
+    stacking: Stacking = Stacking.REFRESH
+    tick_order: int = 0  # lower ticks first each turn, e.g. damage before heals
 
     def __init__(self, duration: int):
         self.duration = duration
@@ -42,42 +66,82 @@ class Status(ABC):
     def __repr__(self) -> str:
         return f"{self.name}({self.duration})"
 
-class PoisonStatus(Status):
-    """Deals percentage-based damage each turn."""
-    name = "poison"
-    icon_key = "icons/poison"
-    PCT_DAMAGE = 0.06
+    @classmethod
+    def tick_batch(cls, pairs: list, battle_state, records: list) -> list:
+        """
+        Tick every `(entity, status)` pair of this type once. Log lines go
+        to `records` as `(template, entity_name, amount)` tuples so they
+        are only formatted if a log keeps them. Returns the expired pairs.
+        """
+        expired = []
+        for entity, status in pairs:
+            if status.tick(entity, battle_state):
+                expired.append((entity, status))
+        return expired
+
+
+class PeriodicStatus(Status):
+    """
+    A damage- or heal-over-time status: every turn it removes (NEGATIVE
+    polarity) or restores (POSITIVE) `FLAT` plus `PCT_OF_MAX` of the
+    bearer's max health, rounded up. Ticks of one type run as a batch
+    without per-status hook calls.
+    """
+    FLAT = 0
+    PCT_OF_MAX = 0.0
+    template = ""  # log line, formatted with the bearer's name and the amount
 
     def on_apply(self, entity) -> None:
         """No immediate effect on apply."""
 
     def on_turn_start(self, entity, battle_state) -> None:
-        damage = math.ceil(entity.max_health * self.PCT_DAMAGE)
-        entity.deal_true_damage(damage)
-
-        from src.utils import add_to_log
-        add_to_log(battle_state.battle_log, f"{entity.name} suffers {damage} from poison.")
+        records: list = []
+        type(self)._apply_ticks(((entity, self),), records)
+        _flush(records, battle_state.battle_log)
 
     def on_expire(self, entity) -> None:
         """No effect on expiration."""
 
-class BleedStatus(Status):
-    """Deals flat damage each turn."""
-    name = "bleed"
-    icon_key = "icons/bleed"
-    FLAT_DAMAGE = 4
+    @classmethod
+    def _apply_ticks(cls, pairs, records: list) -> None:
+        flat, pct, template = cls.FLAT, cls.PCT_OF_MAX, cls.template
+        harmful = cls.polarity is Polarity.NEGATIVE
+        for entity, _ in pairs:
+            amount = flat + math.ceil(entity.max_health * pct) if pct else flat
+            if harmful:
+                entity.deal_true_damage(amount)
+            else:
+                entity.heal(amount)
+            records.append((template, entity.name, amount))
 
-    def on_apply(self, entity) -> None:
-        """No immediate effect on apply."""
+    @classmethod
+    def tick_batch(cls, pairs: list, battle_state, records: list) -> list:
+        cls._apply_ticks(pairs, records)
+        expired = []
+        for entity, status in pairs:
+            status.duration -= 1
+            if status.duration <= 0:
+                status.on_expire(entity)
+                expired.append((entity, status))
+        return expired
 
-    def on_turn_start(self, entity, battle_state) -> None:
-        entity.deal_true_damage(self.FLAT_DAMAGE)
 
-        from src.utils import add_to_log
-        add_to_log(battle_state.battle_log, f"{entity.name} suffers {self.FLAT_DAMAGE} from bleeding.")
+class PoisonStatus(PeriodicStatus):
+    """Deals percentage-based damage each turn."""
+    name = "poison"
+    icon_key = "icons/poison"
+    PCT_DAMAGE = 0.06
+    PCT_OF_MAX = PCT_DAMAGE
+    template = "{} suffers {} from poison."
 
-    def on_expire(self, entity) -> None:
-        """No effect on expiration."""
+class BleedStatus(PeriodicStatus):
+    """Deals flat damage each turn."""
+    name = "bleed"
+    icon_key = "icons/bleed"
+    stacking = Stacking.STACK
+    FLAT_DAMAGE = 4
+    FLAT = FLAT_DAMAGE
+    template = "{} suffers {} from bleeding."
 
 class StunStatus(Status):
     """Prevents the entity from acting for a turn."""
@@ -93,26 +157,204 @@ class StunStatus(Status):
     def on_expire(self, entity) -> None:
         entity.stunned = False
 
-class RegenerationStatus(Status):
+class RegenerationStatus(PeriodicStatus):
     """Heals the entity for a flat amount each turn."""
     name = "regeneration"
     icon_key = "icons/regeneration"
+    polarity = Polarity.POSITIVE
+    stacking = Stacking.STACK
+    tick_order = 1
     FLAT_HEAL = 4
+    FLAT = FLAT_HEAL
+    template = "{} regenerates {} HP."
 
-    def on_apply(self, entity) -> None:
-        """No immediate effect on apply."""
 
-    def on_turn_start(self, entity, battle_state) -> None:
-        entity.heal(self.FLAT_HEAL)
-        
-        from src.utils import add_to_log
-        add_to_log(battle_state.battle_log, f"{entity.name} regenerates {self.FLAT_HEAL} HP.")
+def _flush(records: list, log, max_log: int = config.MAX_LOG_MESSAGES) -> None:
+    """
+    Pass tick records to `log`. The log keeps only its last `max_log`
+    lines, so only those records are ever handed over (and a `BattleLog`
+    formats them only when rendered).
+    """
+    if log is None:
+        return
+    for template, name, amount in records[-max_log:]:
+        add_to_log(log, template, name, amount, max_log=max_log)
+
+
+_STATE_LOG = object()  # tick_all default: log to battle_state.battle_log
+
+
+def tick_all(entities: Iterable, battle_state, log=_STATE_LOG) -> None:
+    """
+    Tick the statuses of every entity once, as one batch per status type
+    across all of them, then drop the expired ones. Types tick by
+    `tick_order`, then in the order first seen, so every entity sees the
+    same order whether it is ticked alone or in a crowd.
+
+    Args:
+        entities: The entities whose turn starts (one, or a population).
+        battle_state: Passed to status hooks; its `battle_log` is the
+            default log.
+        log: Where tick lines go; None skips formatting them entirely.
+    """
+    entities = list(entities)
+    batches: dict[type, list] = {}
+    for entity in entities:
+        for cls, group in entity.statuses._by_type.items():  # pylint: disable=protected-access
+            pairs = batches.get(cls)
+            if pairs is None:
+                pairs = batches[cls] = []
+            pairs.extend((entity, status) for status in group)
+
+    records: list = []
+    for cls in sorted(batches, key=lambda cls: cls.tick_order):
+        expired = cls.tick_batch(batches[cls], battle_state, records)
+        for entity in {id(entity): entity for entity, _ in expired}.values():
+            entity.statuses.prune(cls)
+
+    _flush(records, battle_state.battle_log if log is _STATE_LOG else log)
+
+
+_STATUS_BASES: dict[type, tuple[type, ...]] = {}
+
+
+def _status_bases(cls: type) -> tuple[type, ...]:
+    """`cls` and its Status ancestors, i.e. every type `has()` may ask for."""
+    bases = _STATUS_BASES.get(cls)
+    if bases is None:
+        bases = _STATUS_BASES[cls] = tuple(
+            base for base in cls.__mro__ if issubclass(base, Status))
+    return bases
+
+
+class StatusSet:
+    """
+    The active statuses of one entity, keyed by status type.
+
+    Every status is also counted under each Status class in its MRO, so
+    `has()` answers for base classes in O(1) as well. Applying a type that
+    is already active follows its `stacking` rule. Ticking happens in
+    `tick_all`, which prunes each expired type's group in a single pass.
+    Iteration yields statuses in the order their types were first applied.
+    """
+
+    __slots__ = ("_by_type", "_counts", "_size")
+
+    def __init__(self, statuses: Iterable[Status] = ()):
+        self._by_type: dict[type, list[Status]] = {}
+        self._counts: dict[type, int] = {}
+        self._size = 0
+        for status in statuses:
+            self.add(status)
+
+    def _index(self, status: Status, delta: int) -> None:
+        counts = self._counts
+        for base in _status_bases(type(status)):
+            count = counts.get(base, 0) + delta
+            if count:
+                counts[base] = count
+            else:
+                del counts[base]
+        self._size += delta
+
+    def add(self, status: Status) -> Status:
+        """
+        Apply `status` following its stacking rule. Returns the live
+        status: `status` itself if it was added, else the one it merged into.
+        """
+        group = self._by_type.get(type(status))
+        if group and status.stacking is not Stacking.STACK:
+            current = group[0]
+            if status.stacking is Stacking.EXTEND:
+                current.duration += status.duration
+            else:
+                current.duration = max(current.duration, status.duration)
+            return current
+        if group is None:
+            group = self._by_type[type(status)] = []
+        group.append(status)
+        self._index(status, 1)
+        return status
+
+    def has(self, status_type: type[Status]) -> bool:
+        """True if a status of `status_type` (or a subclass) is active."""
+        return status_type in self._counts
+
+    def get(self, status_type: type[Status]) -> Status | None:
+        """The oldest active status of `status_type` (or a subclass), if any."""
+        group = self._by_type.get(status_type)
+        if group:
+            return group[0]
+        if status_type in self._counts:
+            return next(s for s in self if isinstance(s, status_type))
+        return None
+
+    def remove(self, status: Status) -> bool:
+        """Remove this status instance. Returns False if it was not active."""
+        group = self._by_type.get(type(status))
+        if not group or not any(s is status for s in group):
+            return False
+        group[:] = [s for s in group if s is not status]
+        if not group:
+            del self._by_type[type(status)]
+        self._index(status, -1)
+        return True
+
+    def pop_polarity(self, polarity: Polarity) -> list[Status]:
+        """Remove and return every status of the given polarity."""
+        removed = []
+        for cls in [cls for cls in self._by_type if cls.polarity is polarity]:
+            for status in self._by_type.pop(cls):
+                self._index(status, -1)
+                removed.append(status)
+        return removed
+
+    def prune(self, status_type: type[Status]) -> list[Status]:
+        """Drop and return the expired statuses of exactly `status_type`."""
+        group = self._by_type.get(status_type)
+        if not group:
+            return []
+        kept, expired = [], []
+        for status in group:
+            (expired if status.is_expired() else kept).append(status)
+        if kept:
+            self._by_type[status_type] = kept
+        else:
+            del self._by_type[status_type]
+        for status in expired:
+            self._index(status, -1)
+        return expired
+
+    def clear(self) -> None:
+        """Remove every status without calling any hooks."""
+        self._by_type.clear()
+        self._counts.clear()
+        self._size = 0
+
+    def __iter__(self) -> Iterator[Status]:
+        for group in list(self._by_type.values()):
+            yield from group
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __contains__(self, status) -> bool:
+        return any(s is status for s in self._by_type.get(type(status), ()))
+
+    def __repr__(self) -> str:
+        return repr(list(self))
 
-    def on_expire(self, entity) -> None:
-        """No effect on expiration."""
 
 __all__ = [
+    "Polarity",
+    "Stacking",
+    "StatusSet",
     "Status",
+    "PeriodicStatus",
+    "tick_all",
     "PoisonStatus",
     "BleedStatus",
     "StunStatus",
@@ -1,5 +1,5 @@
 """Provides a clean public API for triggering and registering mini-events."""
 
-from .mini_events import trigger_random, register_event  # re-export
+from .mini_events import trigger_random, register_event, unregister_event  # re-export
 
-__all__ = ["trigger_random", "register_event"]
+__all__ = ["trigger_random", "register_event", "unregister_event"]
@@ -0,0 +1,126 @@
+"""
+bus.py
+A small in-process publish/subscribe bus for typed event records.
+
+Subscribers are callables that take a list of events. Each one chooses
+which event types it wants and how many events to receive per call
+(`batch_size`), so a log can react to every event while a file writer
+only wakes up every few hundred. Events still waiting in a batch are
+delivered by `flush()`.
+"""
+from __future__ import annotations
+
+from typing import Callable, Iterable, Sequence
+
+Handler = Callable[[Sequence[object]], None]
+
+
+class Subscription:
+    """One subscriber's filter, batch size and pending events."""
+
+    __slots__ = ("handler", "kinds", "batch_size", "pending")
+
+    def __init__(self, handler: Handler, kinds: tuple[type, ...] | None, batch_size: int):
+        self.handler = handler
+        self.kinds = kinds
+        self.batch_size = batch_size
+        self.pending: list = []
+
+    def wants(self, kind: type) -> bool:
+        """True if events of type `kind` go to this subscriber."""
+        return self.kinds is None or issubclass(kind, self.kinds)
+
+    def push(self, event) -> None:
+        """Queue `event`, delivering the batch once it is full."""
+        self.pending.append(event)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Deliver whatever is pending."""
+        if self.pending:
+            batch, self.pending = self.pending, []
+            self.handler(batch)
+
+
+class EventBus:
+    """
+    Routes published events to the subscribers that asked for their type.
+
+    Routes are resolved once per event type and cached, so `publish` is a
+    dict lookup plus one append per interested subscriber. `emit(kind,
+    *args)` goes one step further and does not even build events that no
+    subscriber wants.
+    """
+
+    def __init__(self):
+        self._subscriptions: list[Subscription] = []
+        self._routes: dict[type, list[Subscription]] = {}
+
+    @property
+    def active(self) -> bool:
+        """True if anything is subscribed."""
+        return bool(self._subscriptions)
+
+    def _route(self, kind: type) -> list[Subscription]:
+        route = self._routes.get(kind)
+        if route is None:
+            route = self._routes[kind] = [sub for sub in self._subscriptions
+                                          if sub.wants(kind)]
+        return route
+
+    def wants(self, kind: type) -> bool:
+        """True if some subscriber would receive events of type `kind`."""
+        return bool(self._route(kind))
+
+    def subscribe(self, handler: Handler, kinds: Iterable[type] | None = None,
+                  batch_size: int = 1) -> Subscription:
+        """
+        Call `handler` with lists of published events.
+
+        Args:
+            handler: Receives each batch as a list, in publish order.
+            kinds: Event types (subclasses included) to receive; all if omitted.
+            batch_size: Events per call; the rest wait for `flush()`.
+
+        Raises:
+            ValueError: If `batch_size` is not positive.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        subscription = Subscription(handler, None if kinds is None else tuple(kinds),
+                                    batch_size)
+        self._subscriptions.append(subscription)
+        self._routes.clear()
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Deliver the subscription's pending events and stop routing to it."""
+        subscription.flush()
+        self._subscriptions.remove(subscription)
+        self._routes.clear()
+
+    def publish(self, event) -> None:
+        """Hand `event` to every interested subscriber."""
+        self._deliver(self._route(type(event)), event)
+
+    def emit(self, kind: type, *args) -> None:
+        """Publish `kind(*args)`, building it only if a subscriber wants `kind`."""
+        route = self._routes.get(kind)
+        if route is None:
+            route = self._route(kind)
+        if route:
+            self._deliver(route, kind(*args))
+
+    @staticmethod
+    def _deliver(route: list[Subscription], event) -> None:
+        for subscription in route:
+            pending = subscription.pending
+            pending.append(event)
+            if len(pending) >= subscription.batch_size:
+                subscription.flush()
+
+    def flush(self) -> None:
+        """Deliver every subscriber's pending events."""
+        for subscription in self._subscriptions:
+            subscription.flush()
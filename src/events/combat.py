@@ -0,0 +1,229 @@
+"""
+combat.py
+Typed combat event records and the standard subscribers for them.
+
+`BattleEngine` publishes a record for every combat outcome on its
+`EventBus` (see `bus.py`). Records hold plain values (names, numbers), so
+they can be logged, aggregated or written to disk without touching live
+entities:
+
+* `LogWriter` renders them into the on-screen battle log,
+* `CombatMetrics` keeps running totals for balance analysis,
+* `JsonlRecorder` appends them to a JSON Lines file in large batches.
+"""
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from collections import Counter
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import IO, Sequence
+
+from src import utils
+
+from .bus import EventBus, Subscription
+
+
+@dataclass(slots=True)
+class CombatEvent:
+    """
+    Base class of combat event records. Treat records as read-only; they
+    are not frozen only because frozen dataclasses are slower to build.
+    """
+
+    def to_dict(self) -> dict:
+        """The record as a flat dictionary tagged with its type name."""
+        data = {"event": type(self).__name__}
+        for field in fields(self):
+            data[field.name] = getattr(self, field.name)
+        return data
+
+
+@dataclass(slots=True)
+class DamageDealt(CombatEvent):
+    """An attack or skill hit (or missed) its target."""
+    source: str
+    target: str
+    amount: int
+    crit: bool = False
+    miss: bool = False
+    skill: str | None = None  # None for a basic attack
+
+
+@dataclass(slots=True)
+class StatusApplied(CombatEvent):
+    """A status effect was put on a combatant."""
+    target: str
+    status: str
+    duration: int
+
+
+@dataclass(slots=True)
+class SkillUsed(CombatEvent):
+    """A combatant used one of its skills."""
+    actor: str
+    skill: str
+
+
+@dataclass(slots=True)
+class TurnEnded(CombatEvent):
+    """`actor` finished its turn; `turn` is the encounter's turn count after it."""
+    turn: int
+    actor: str
+
+
+@dataclass(slots=True)
+class RewardGranted(CombatEvent):
+    """The player received XP, gold or an item."""
+    xp: int
+    gold: int
+    item: str | None = None
+    source: str = "victory"  # "victory" or "drop"
+
+
+class Subscriber(ABC):
+    """
+    Base class of the standard subscribers: a callable taking a batch of
+    events, plus the event types and batch size it subscribes with.
+    """
+
+    kinds: tuple[type, ...] | None = None
+    batch_size = 1
+
+    def attach(self, bus: EventBus, batch_size: int | None = None) -> Subscription:
+        """Subscribe to `bus` with this subscriber's kinds and batch size."""
+        return bus.subscribe(self, self.kinds, batch_size or self.batch_size)
+
+    @abstractmethod
+    def __call__(self, events: Sequence[CombatEvent]) -> None:
+        """Handle a batch of events, oldest first."""
+
+
+class LogWriter(Subscriber):
+    """
+    Renders events into a battle log as they happen.
+
+    Messages are added as templates, so a `BattleLog` formats them only if
+    they are ever shown. Skill damage is not logged separately: the
+    `SkillUsed` line stands for it.
+    """
+
+    kinds = (DamageDealt, SkillUsed, RewardGranted)
+
+    def __init__(self, log):
+        self.log = log
+        add = getattr(log, "add", None)  # BattleLog; plain lists go through add_to_log
+        self._add = add if add is not None else partial(utils.add_to_log, log)
+
+    def __call__(self, events: Sequence[CombatEvent]) -> None:
+        add = self._add
+        for event in events:
+            kind = type(event)
+            if kind is DamageDealt:
+                if event.skill is not None:
+                    continue
+                if event.miss:
+                    add("{} missed!", event.source)
+                elif event.crit:
+                    add("Critical hit! {} deals {} damage.", event.source, event.amount)
+                else:
+                    add("{} deals {} damage.", event.source, event.amount)
+            elif kind is SkillUsed:
+                add("{} uses {}.", event.actor, event.skill)
+            elif kind is RewardGranted:
+                if event.source == "victory":
+                    add("You gain {} XP and {} gold.", event.xp, event.gold)
+                elif event.item is not None:
+                    add("The enemy dropped {}!", event.item)
+                else:
+                    add("The enemy dropped {} gold!", event.gold)
+
+
+class CombatMetrics(Subscriber):
+    """Running totals over every event it has seen, for balance analysis."""
+
+    batch_size = 64
+
+    def __init__(self):
+        self.damage: Counter = Counter()  # by source
+        self.hits: Counter = Counter()
+        self.crits: Counter = Counter()
+        self.misses: Counter = Counter()
+        self.skills: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.items: Counter = Counter()
+        self.turns = 0
+        self.xp = 0
+        self.gold = 0
+
+    def __call__(self, events: Sequence[CombatEvent]) -> None:
+        for event in events:
+            kind = type(event)
+            if kind is DamageDealt:
+                if event.miss:
+                    self.misses[event.source] += 1
+                    continue
+                self.hits[event.source] += 1
+                self.damage[event.source] += event.amount
+                if event.crit:
+                    self.crits[event.source] += 1
+            elif kind is TurnEnded:
+                self.turns += 1
+            elif kind is SkillUsed:
+                self.skills[event.skill] += 1
+            elif kind is StatusApplied:
+                self.statuses[event.status] += 1
+            elif kind is RewardGranted:
+                self.xp += event.xp
+                self.gold += event.gold
+                if event.item is not None:
+                    self.items[event.item] += 1
+
+    def summary(self) -> dict:
+        """The totals as plain data."""
+        return {
+            "turns": self.turns,
+            "damage": dict(self.damage),
+            "hits": dict(self.hits),
+            "crits": dict(self.crits),
+            "misses": dict(self.misses),
+            "skills": dict(self.skills),
+            "statuses": dict(self.statuses),
+            "xp": self.xp,
+            "gold": self.gold,
+            "items": dict(self.items),
+        }
+
+
+class JsonlRecorder(Subscriber):
+    """
+    Appends events to a JSON Lines stream, one object per line (see
+    `CombatEvent.to_dict`). Events arrive in batches of `batch_size`, and
+    each batch is a single write; `EventBus.flush()` writes the remainder.
+    """
+
+    batch_size = 256
+
+    def __init__(self, target: str | IO[str]):
+        """
+        Args:
+            target: A path, opened for appending on first write, or an open
+                text stream (not closed by `close`).
+        """
+        self._path = target if isinstance(target, str) else None
+        self._stream: IO[str] | None = None if self._path else target
+
+    def __call__(self, events: Sequence[CombatEvent]) -> None:
+        if self._stream is None:
+            self._stream = open(self._path, "a", encoding="utf-8")  # pylint: disable=consider-using-with
+        dumps = json.dumps
+        self._stream.write("".join(dumps(event.to_dict(), separators=(",", ":")) + "\n"
+                                   for event in events))
+        self._stream.flush()
+
+    def close(self) -> None:
+        """Close the file if this recorder opened it."""
+        if self._path and self._stream is not None:
+            self._stream.close()
+            self._stream = None
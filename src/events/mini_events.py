@@ -7,13 +7,15 @@ probability-based selection logic, and a runtime extension hook
 """
 from __future__ import annotations
 
-import random
 from abc import ABC, abstractmethod
-from random import Random, randint
-from typing import TYPE_CHECKING, Type
+from random import Random
+from typing import TYPE_CHECKING, Hashable, Type
 
-from src import utils, items
+from src import utils
+from src.content import ContentError, get_content
 from src.entities.status import PoisonStatus
+from src.rng import get_service
+from src.sampling import WeightedSampler
 
 
 if TYPE_CHECKING:  # avoid circulars
@@ -21,7 +23,22 @@ if TYPE_CHECKING:  # avoid circulars
     from src.core.battle_log import BattleLog
 
 class MiniEvent(ABC):
-    """Abstract mini-event invoked during exploration."""
+    """
+    Abstract mini-event invoked during exploration.
+
+    Subclasses must be constructible without arguments: `trigger_random`
+    calls `event_cls()` and then sets the instance's `rng` attribute to the
+    stream the event was drawn from, so `execute()` should roll through
+    `self.rng` rather than a stream captured in `__init__`.
+    """
+
+    def __init__(self, rng: Random | None = None):
+        """
+        Args:
+            rng: Random stream for the event's own rolls; defaults to the
+                 shared service's events stream. Settable afterwards.
+        """
+        self.rng = rng if rng is not None else get_service().events
 
     @classmethod
     @abstractmethod
@@ -42,23 +59,12 @@ class ItemFindEvent(MiniEvent):
 
     def execute(self, player: "Entity", meta: dict, log: "BattleLog") -> str:
         """Generates and awards a random item to the player."""
-        # Define loot table with items and their weights
-        loot_table = [
-            (items.HealingPotion, 0.5),
-            (items.Antidote, 0.2),
-            (items.GoldPile, 0.3)
-        ]
-        
-        # Unpack items and weights for random.choices
-        item_classes, weights = zip(*loot_table)
-        chosen_item_class = random.choices(item_classes, weights=weights, k=1)[0]
-        
-        # Instantiate the chosen item
-        if chosen_item_class is items.GoldPile:
-            loot = items.GoldPile(randint(5, 20))
-        else:
-            loot = chosen_item_class()
-            
+        loot = get_content().loot_table("item_find_event").draw(self.rng)
+        if loot is None:
+            message = "You search around but find nothing."
+            utils.add_to_log(log, message)
+            return message
+
         if not loot.can_store:
             loot.use(player)
             message = f"You found {loot.amount} gold!"
@@ -80,8 +86,8 @@ class TrapEvent(MiniEvent):
 
     def execute(self, player: "Entity", meta: dict, log: "BattleLog") -> str:
         """A 50/50 chance to take damage or get poisoned."""
-        if random.random() < 0.5:
-            damage = randint(5, 15)
+        if self.rng.random() < 0.5:
+            damage = self.rng.randint(5, 15)
             player.take_damage(damage)
             message = f"It's a trap! You took {damage} damage."
         else:
@@ -145,57 +151,87 @@ class GoldCacheEvent(MiniEvent):
 
     def execute(self, player: "Entity", meta: dict, log: "BattleLog") -> str:
         """You find a cache of gold."""
-        amount = randint(5, 30)
+        amount = self.rng.randint(5, 30)
         player.gain_gold(amount)
         message = f"You found a cache of {amount} gold!"
         utils.add_to_log(log, message)
         return message
 
-# Probability and selection logic
-EVENT_TABLE: list[tuple[type[MiniEvent], float]] = [
-    (ItemFindEvent, 0.35),
-    (TrapEvent, 0.25),
-    (FriendlyNPCEvent, 0.15),
-    (PuzzleEvent, 0.15),
-    (GoldCacheEvent, 0.10),
-]
-WEIGHT_SUM = sum(w for _, w in EVENT_TABLE)
+# Probability and selection logic. Weights come from the content file
+# (`config.CONTENT_PATH`), which names events by class.
+EVENT_TYPES: dict[str, type[MiniEvent]] = {
+    cls.__name__: cls
+    for cls in (ItemFindEvent, TrapEvent, FriendlyNPCEvent, PuzzleEvent, GoldCacheEvent)
+}
+
+
+def _event_sampler(rows: list[tuple[str, float]]) -> WeightedSampler[type[MiniEvent]]:
+    sampler = WeightedSampler()
+    for name, weight in rows:
+        if name not in EVENT_TYPES:
+            raise ContentError(f"content names unknown mini-event {name!r}")
+        sampler.add(EVENT_TYPES[name], weight)
+    return sampler
+
 
+_DEFAULT_EVENTS = _event_sampler(get_content().events)
+# Per-context tables (depth band, biome, ...); each replaces the default one.
+_CONTEXT_EVENTS: dict[Hashable, WeightedSampler[type[MiniEvent]]] = {
+    context: _event_sampler(rows) for context, rows in get_content().event_contexts.items()
+}
+EVENT_TABLE: list[tuple[type[MiniEvent], float]] = _DEFAULT_EVENTS.entries
 
-def choose_event(rng: Random | None = None) -> Type[MiniEvent]:
+
+def __getattr__(name: str):
+    if name == "WEIGHT_SUM":  # kept for callers of the old module global
+        return _DEFAULT_EVENTS.total
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def event_sampler(context: Hashable | None = None) -> WeightedSampler[type[MiniEvent]]:
+    """The event table used in `context`; the default table if it has none."""
+    if context is None:
+        return _DEFAULT_EVENTS
+    return _CONTEXT_EVENTS.get(context, _DEFAULT_EVENTS)
+
+
+def choose_event(rng: Random | None = None,
+                 context: Hashable | None = None) -> Type[MiniEvent]:
     """
     Select a mini-event class from the event table based on assigned weights.
-    Uses cumulative weight calculation for selection.
+    Uses an alias table, so the cost of a draw does not grow with the table.
 
     Args:
         rng: An optional `random.Random` instance for deterministic testing.
-             If None, the global `random` module is used.
+             If None, the shared service's events stream is used.
+        context: Optional context key (e.g. a depth band or biome) whose
+             table to draw from; unknown contexts use the default table.
 
     Returns:
         The selected `MiniEvent` subclass.
     """
     if rng is None:
-        rng = random
+        rng = get_service().events
+    return event_sampler(context).choice(rng)
 
-    roll = rng.uniform(0, WEIGHT_SUM)
-    cumulative_weight = 0.0
-    for event_class, weight in EVENT_TABLE:
-        cumulative_weight += weight
-        if roll < cumulative_weight:
-            return event_class
 
-    # Fallback in case of floating point inaccuracies, though unlikely.
-    return EVENT_TABLE[-1][0]
+def choose_events(n: int, rng: Random | None = None,
+                  context: Hashable | None = None) -> list[Type[MiniEvent]]:
+    """`n` independent `choose_event` draws in one call, for simulators."""
+    if rng is None:
+        rng = get_service().events
+    return event_sampler(context).sample(n, rng)
 
 
 def trigger_random(
-    player: "Entity", meta: dict, log: "BattleLog", rng: Random | None = None
+    player: "Entity", meta: dict, log: "BattleLog", rng: Random | None = None,
+    context: Hashable | None = None,
 ) -> str:
     """
     Select, instantiate, and execute a random mini-event.
 
     1. Chooses an event class using weighted probability.
-    2. Instantiates the chosen event.
+    2. Instantiates the chosen event and hands it `rng`.
     3. Calls its `roll()` method; if it returns False, the event does not trigger.
     4. If the roll passes, calls `execute()` and returns the resulting description.
 
@@ -204,17 +240,19 @@ def trigger_random(
         meta: Game metadata dictionary.
         log: The battle/event log.
         rng: An optional `random.Random` instance for deterministic testing.
-             If None, the global `random` module is used.
+             If None, the shared service's events stream is used.
+        context: Optional context key selecting a per-context event table.
 
     Returns:
         A description of the event that occurred, or an empty string if no
         event triggered.
     """
     if rng is None:
-        rng = random
+        rng = get_service().events
 
-    event_class = choose_event(rng)
+    event_class = choose_event(rng, context)
     event_instance = event_class()
+    event_instance.rng = rng
 
     if not event_instance.roll(rng):
         return ""
@@ -222,25 +260,51 @@ def trigger_random(
     return event_instance.execute(player, meta, log)
 
 
-def register_event(event_cls: type[MiniEvent], weight: float) -> None:
+def register_event(event_cls: type[MiniEvent], weight: float,
+                   context: Hashable | None = None) -> None:
     """
-    Dynamically add a MiniEvent subclass to the EVENT_TABLE.
+    Add a MiniEvent subclass to the event table, or change its weight.
+    The sampler is rebuilt lazily on the next draw.
 
     Args:
-        event_cls: Concrete subclass to register.
+        event_cls: Concrete subclass to register; it must be constructible
+            without arguments (see `MiniEvent`).
         weight: Probability weight to assign.
+        context: Register into this context's table (created empty if
+            needed) instead of the default one.
     """
     if not issubclass(event_cls, MiniEvent):
         raise TypeError("Must register a MiniEvent subclass.")
-    EVENT_TABLE.append((event_cls, weight))
-    global WEIGHT_SUM  # pylint: disable=global-statement
-    WEIGHT_SUM += weight
+    if context is None:
+        sampler = _DEFAULT_EVENTS
+    else:
+        sampler = _CONTEXT_EVENTS.setdefault(context, WeightedSampler())
+    sampler.add(event_cls, weight)
+
+
+def unregister_event(event_cls: type[MiniEvent], context: Hashable | None = None) -> bool:
+    """
+    Remove a MiniEvent subclass from the default table, or from `context`'s.
+    A context left without events is dropped, so it uses the default table
+    again. Returns False if the class was not registered there.
+    """
+    if context is None:
+        return _DEFAULT_EVENTS.remove(event_cls)
+    sampler = _CONTEXT_EVENTS.get(context)
+    if sampler is None or not sampler.remove(event_cls):
+        return False
+    if not sampler:
+        del _CONTEXT_EVENTS[context]
+    return True
 
 
 __all__ = [
     "trigger_random",
     "choose_event",
+    "choose_events",
+    "event_sampler",
     "register_event",
+    "unregister_event",
     "MiniEvent",
     "ItemFindEvent",
     "TrapEvent",
@@ -1,6 +1,8 @@
 """
 Initializes the items package.
 """
-from .items import Item, StaminaPotion, HealingPotion, GoldPile, Antidote
+from .items import Item, ItemMeta, StaminaPotion, HealingPotion, GoldPile, Antidote, get_item
+from .inventory import Inventory
 
-__all__ = ["Item", "StaminaPotion", "HealingPotion", "GoldPile", "Antidote"]
+__all__ = ["Item", "ItemMeta", "StaminaPotion", "HealingPotion", "GoldPile", "Antidote",
+           "get_item", "Inventory"]
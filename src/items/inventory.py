@@ -0,0 +1,181 @@
+"""
+inventory.py
+Counted, slot-ordered item storage.
+"""
+from __future__ import annotations
+
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .items import Item
+
+
+class _Stack:
+    """
+    One slot: the item definition and how many of it there are. Flyweight
+    items are all the same object, so only items with state of their own
+    keep their instances.
+    """
+
+    __slots__ = ("item", "count", "instances")
+
+    def __init__(self, item: Item):
+        self.item = item
+        self.count = 0
+        self.instances: list[Item] | None = None if item.flyweight else []
+
+    def push(self, item: Item) -> None:
+        self.count += 1
+        if self.instances is not None:
+            self.instances.append(item)
+
+    def pop(self) -> Item:
+        self.count -= 1
+        if self.instances is not None:
+            return self.instances.pop()
+        return self.item
+
+    def items(self) -> Iterator[Item]:
+        if self.instances is not None:
+            return iter(self.instances)
+        return repeat(self.item, self.count)
+
+
+class Inventory:
+    """
+    Items stacked by name. Each stack occupies one slot; slots keep the
+    order in which their first item arrived and disappear when emptied.
+
+    A stack holds an item definition plus a count, so adding, removing,
+    counting and using by slot are all O(1) and cost no allocation for
+    flyweight items. The class also behaves like the flat item list it
+    replaces (iteration, `len`, indexing, slicing), which is O(n) and meant
+    for legacy callers only.
+    """
+
+    def __init__(self, items: "list[Item] | tuple" = ()):
+        self._stacks: dict[str, _Stack] = {}
+        self._slots: list[str] = []
+        self._size = 0
+        for item in items:
+            self.add(item)
+
+    # ------------------------------------------------------------------ stacks
+    def add(self, item: Item, quantity: int = 1) -> None:
+        """
+        Put `quantity` of `item` on the stack for its name, opening a new
+        slot if needed. Quantities above one are for flyweight items only.
+        """
+        stack = self._stacks.get(item.name)
+        if stack is None:
+            stack = self._stacks[item.name] = _Stack(item)
+            self._slots.append(item.name)
+        if quantity == 1:
+            stack.push(item)
+        else:
+            if stack.instances is not None:
+                raise ValueError(f"{item.name} items carry state; add them one by one")
+            stack.count += quantity
+        self._size += quantity
+
+    def remove(self, item: Item) -> bool:
+        """Remove one item named like `item`. Returns False if there is none."""
+        return self._pop(item.name) is not None
+
+    def count(self, name: str) -> int:
+        """Number of items called `name`."""
+        stack = self._stacks.get(name)
+        return stack.count if stack else 0
+
+    def clear(self) -> None:
+        """Remove every item."""
+        self._stacks.clear()
+        self._slots.clear()
+        self._size = 0
+
+    def _pop(self, name: str) -> Item | None:
+        stack = self._stacks.get(name)
+        if stack is None:
+            return None
+        item = stack.pop()
+        self._size -= 1
+        if not stack.count:
+            del self._stacks[name]
+            self._slots.remove(name)  # a handful of slots at most
+        return item
+
+    # ------------------------------------------------------------------- slots
+    @property
+    def slot_count(self) -> int:
+        """Number of occupied slots."""
+        return len(self._slots)
+
+    def slot(self, index: int) -> tuple[Item, int]:
+        """The item definition and quantity in slot `index`."""
+        stack = self._stacks[self._slots[index]]
+        return stack.item, stack.count
+
+    def take(self, index: int) -> Item:
+        """Remove and return one item from slot `index`."""
+        return self._pop(self._slots[index])
+
+    def grouped(self) -> list[tuple[Item, int, int]]:
+        """
+        `(item, quantity, first_index)` per slot, the same shape as
+        `utils.group_inventory`, where `first_index` is the position of the
+        slot's first item in the flat list view.
+        """
+        result = []
+        first_index = 0
+        for name in self._slots:
+            stack = self._stacks[name]
+            result.append((stack.item, stack.count, first_index))
+            first_index += stack.count
+        return result
+
+    def slot_of_index(self, index: int) -> int:
+        """The slot holding position `index` of the flat list view."""
+        if index < 0:
+            index += self._size
+        for slot, name in enumerate(self._slots):
+            index -= self._stacks[name].count
+            if index < 0:
+                return slot
+        raise IndexError("inventory index out of range")
+
+    # ------------------------------------------------------- list-like view
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self) -> Iterator[Item]:
+        for name in self._slots:
+            yield from self._stacks[name].items()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        slot = self.slot_of_index(index)
+        stack = self._stacks[self._slots[slot]]
+        if stack.instances is None:
+            return stack.item
+        if index < 0:
+            index += self._size
+        for name in self._slots[:slot]:
+            index -= self._stacks[name].count
+        return stack.instances[index]
+
+    def __contains__(self, item) -> bool:
+        stack = self._stacks.get(getattr(item, "name", None))
+        if stack is None:
+            return False
+        if stack.instances is None:
+            return stack.item is item
+        return any(entry is item for entry in stack.instances)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{name} x{self._stacks[name].count}" for name in self._slots)
+        return f"Inventory({counts})"
@@ -1,9 +1,15 @@
 """
 items.py
 Defines all items in the game.
+
+Items without per-instance state are flyweights: `HealingPotion()` always
+returns the same immutable, slot-less definition, so inventories and
+simulations can hold thousands of them for free. Items that do carry
+state (`GoldPile.amount`) set `flyweight = False` and declare `__slots__`
+for exactly that state.
 """
 from __future__ import annotations
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
 from typing import TYPE_CHECKING
 from src import config
 
@@ -12,15 +18,45 @@ if TYPE_CHECKING:
     from ..entities.player import Player
 
 
-class Item(ABC):
+class ItemMeta(ABCMeta):
+    """
+    Metaclass for items: registers every concrete item class under its
+    display name and hands out one shared instance of flyweight classes.
+    """
+
+    registry: dict[str, type] = {}
+
+    def __init__(cls, cls_name, bases, namespace):
+        super().__init__(cls_name, bases, namespace)
+        cls._shared = None
+        if "name" in namespace and not cls.__abstractmethods__:
+            ItemMeta.registry[namespace["name"]] = cls
+
+    def __call__(cls, *args, **kwargs):
+        if cls.flyweight and not args and not kwargs:
+            if cls._shared is None:
+                cls._shared = super().__call__()
+            return cls._shared
+        return super().__call__(*args, **kwargs)
+
+
+class Item(metaclass=ItemMeta):
     """Abstract base class for items."""
 
+    __slots__ = ()
+    name: str = ""
     can_store: bool = True
+    flyweight: bool = True
+
+    @property
+    def cost(self) -> int:
+        """Shop price, read from `config` so overrides take effect."""
+        return 0
 
-    def __init__(self, name: str, cost: int, description: str = ""):
-        self.name = name
-        self.cost = cost
-        self.description = description
+    @property
+    def description(self) -> str:
+        """One-line description for the inventory list."""
+        return ""
 
     def __repr__(self) -> str:
         return f"{self.name} (Cost: {self.cost})"
@@ -35,18 +71,30 @@ class Item(ABC):
         raise NotImplementedError
 
 
+def get_item(name: str) -> Item:
+    """
+    The item called `name` (e.g. "Healing Potion"): the shared definition
+    for flyweights, a default instance otherwise.
+
+    Raises:
+        KeyError: If no item has that name.
+    """
+    return ItemMeta.registry[name]()
+
+
 class HealingPotion(Item):
     """An item that restores HP."""
 
-    def __init__(self):
-        super().__init__(
-            name="Healing Potion",
-            cost=config.HEALING_POTION_COST,
-            description=f"Heals for {config.HEALING_POTION_HEAL_AMOUNT} HP."
-        )
+    __slots__ = ()
+    name = "Healing Potion"
 
-    def __repr__(self) -> str:
-        return f"{self.name} (Cost: {self.cost})"
+    @property
+    def cost(self) -> int:
+        return config.HEALING_POTION_COST
+
+    @property
+    def description(self) -> str:
+        return f"Heals for {config.HEALING_POTION_HEAL_AMOUNT} HP."
 
     def use(self, entity: Entity) -> dict:
         """Heal the entity."""
@@ -58,15 +106,16 @@ class HealingPotion(Item):
 class StaminaPotion(Item):
     """A potion that restores stamina."""
 
-    def __init__(self):
-        super().__init__(
-            name="Stamina Potion",
-            cost=config.STAMINA_POTION_COST,
-            description=f"Gains {config.STAMINA_POTION_STAMINA_GAIN} stamina."
-        )
+    __slots__ = ()
+    name = "Stamina Potion"
 
-    def __repr__(self) -> str:
-        return f"{self.name} (Cost: {self.cost})"
+    @property
+    def cost(self) -> int:
+        return config.STAMINA_POTION_COST
+
+    @property
+    def description(self) -> str:
+        return f"Gains {config.STAMINA_POTION_STAMINA_GAIN} stamina."
 
     def use(self, entity: Entity) -> dict:
         """Add stamina to the entity."""
@@ -83,16 +132,17 @@ class GoldPile(Item):
     On pickup, it directly adds to the player's gold instead of being an inventory item.
     """
 
+    __slots__ = ("amount",)
+    name = "Gold Pile"  # Gold piles aren't bought, they are found.
     can_store: bool = False
-    amount: int = 10
+    flyweight = False
 
     def __init__(self, amount: int = 10):
         self.amount = amount
-        super().__init__(
-            name="Gold Pile",
-            cost=0,  # Gold piles aren't bought, they are found.
-            description=f"A pouch containing {self.amount} gold coins."
-        )
+
+    @property
+    def description(self) -> str:
+        return f"A pouch containing {self.amount} gold coins."
 
     def __repr__(self) -> str:
         return f"Gold Pile ({self.amount})"
@@ -107,12 +157,16 @@ class GoldPile(Item):
 class Antidote(Item):
     """An item that cures negative status effects."""
 
-    def __init__(self):
-        super().__init__(
-            name="Antidote",
-            cost=config.ANTIDOTE_COST,
-            description="Cures poison and other ailments."
-        )
+    __slots__ = ()
+    name = "Antidote"
+
+    @property
+    def cost(self) -> int:
+        return config.ANTIDOTE_COST
+
+    @property
+    def description(self) -> str:
+        return "Cures poison and other ailments."
 
     def use(self, entity: Entity) -> dict:
         """Cures all negative statuses."""
@@ -120,6 +174,6 @@ class Antidote(Item):
         if cleared_count > 0:
             msg = f"Used {self.name}, curing all negative effects."
             return {"message": msg, "value": cleared_count}
-        
+
         msg = f"Used {self.name}, but there was nothing to cure."
         return {"message": msg, "value": 0}
@@ -1,13 +1,95 @@
 """
 main.py
 Main entry point for the game.
+
+Example:
+    python -m src.main
+    python -m src.main --profile                      # cProfile the whole session
+    python -m src.main --profile-frames 300 --profile-start 60
+    python -m src.main --tracemalloc 15               # allocation changes per transition
+    python -m src.main --headless --seed 7            # no window (dummy SDL video driver)
+
+Every option is off by default and nothing is installed for an option
+that is not given. Profiles are written as pstats dumps (`--profile-out`)
+and summarised on stdout by cumulative time.
 """
+from __future__ import annotations
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+
 from .core.game import Game
+from .core.profiler import AllocationTracker, CProfileWindow
+
+DEFAULT_PROFILE_PATH = "saves/session.prof"
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(description="Turn-based pygame adventure.")
+    parser.add_argument("--seed", type=int, default=None,
+                        help="Seed every random stream (default: random).")
+    parser.add_argument("--headless", action="store_true",
+                        help="Run without a window using SDL's dummy video driver.")
+    window = parser.add_mutually_exclusive_group()
+    window.add_argument("--profile", action="store_true",
+                        help="Profile the whole session with cProfile.")
+    window.add_argument("--profile-frames", type=int, default=0, metavar="N",
+                        help="Profile only N frames of the game loop.")
+    parser.add_argument("--profile-start", type=int, default=0, metavar="K",
+                        help="First frame profiled by --profile-frames (default: 0).")
+    parser.add_argument("--profile-out", default=DEFAULT_PROFILE_PATH, metavar="PATH",
+                        help=f"Where to write the pstats dump (default: {DEFAULT_PROFILE_PATH}).")
+    parser.add_argument("--tracemalloc", type=int, nargs="?", const=10, default=0, metavar="N",
+                        help="Print the top N (default: 10) allocation changes at every "
+                             "state transition.")
+    args = parser.parse_args(argv)
+    if args.profile_frames < 0 or args.profile_start < 0 or args.tracemalloc < 0:
+        parser.error("frame counts and --tracemalloc must not be negative")
+    return args
 
-def main():
+
+def print_profile(path: str, limit: int = 25) -> None:
+    """Summarise the pstats dump at `path` by cumulative time."""
+    print(f"Profile written to {path}")
+    pstats.Stats(path).sort_stats("cumulative").print_stats(limit)
+
+
+def main(argv: list[str] | None = None) -> None:
     """Initialises and runs the game."""
-    game = Game()
-    game.run()
+    args = parse_args(argv)
+    if args.headless:
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    game = Game(seed=args.seed)
+    if args.tracemalloc:
+        game.add_state_listener(AllocationTracker(args.tracemalloc))
+    frames = None
+    if args.profile_frames:
+        frames = game.profiler = CProfileWindow(args.profile_frames, args.profile_out,
+                                                args.profile_start)
+
+    # The dumps are written even when the session is interrupted (Ctrl-C),
+    # which is the only way to end a --headless run.
+    if args.profile:
+        profile = cProfile.Profile()
+        try:
+            profile.runcall(game.run)
+        finally:
+            os.makedirs(os.path.dirname(args.profile_out) or ".", exist_ok=True)
+            profile.dump_stats(args.profile_out)
+            print_profile(args.profile_out)
+    else:
+        try:
+            game.run()
+        finally:
+            if frames is not None and frames.finish():
+                print_profile(args.profile_out)
+
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+pool.py
+Free-list object pools with hit-rate statistics.
+
+A pool hands out released objects again instead of allocating new ones,
+which keeps short-lived game objects such as enemies from churning the
+allocator and the cyclic garbage collector in long runs and simulations.
+Every named pool is registered so `pool_stats()` can report how often
+acquisitions were served from the free list.
+"""
+from __future__ import annotations
+
+from typing import Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+_POOLS: dict[str, "ObjectPool"] = {}
+
+
+class ObjectPool(Generic[T]):
+    """
+    Objects built by `factory(*args)` and recycled by `reset(obj, *args)`.
+
+    `acquire(*args)` pops a released object and resets it with the same
+    arguments the factory would have received, or builds a new one when
+    the free list is empty. `release(obj)` keeps up to `max_size` objects;
+    the caller must drop its own references and release each object once.
+    """
+
+    def __init__(self, factory: Callable[..., T], reset: Callable[..., None],
+                 max_size: int = 64, name: str | None = None):
+        """
+        Args:
+            factory: Builds a new object from the `acquire` arguments.
+            reset: Reinitialises a released object from the `acquire` arguments.
+            max_size: Most objects kept for reuse; extra releases are dropped.
+            name: Registers the pool for `pool_stats()` under this name.
+        """
+        self.factory = factory
+        self.reset = reset
+        self.max_size = max_size
+        self.name = name
+        self._free: list[T] = []
+        self.hits = 0
+        self.misses = 0
+        self.dropped = 0
+        if name is not None:
+            _POOLS[name] = self
+
+    def acquire(self, *args) -> T:
+        """A ready object for `args`: a recycled one if any are free."""
+        if self._free:
+            obj = self._free.pop()
+            self.reset(obj, *args)
+            self.hits += 1
+            return obj
+        self.misses += 1
+        return self.factory(*args)
+
+    def release(self, obj: T) -> None:
+        """Keep `obj` for reuse, unless the pool is full."""
+        if len(self._free) < self.max_size:
+            self._free.append(obj)
+        else:
+            self.dropped += 1
+
+    def clear(self) -> None:
+        """Forget every free object and reset the statistics."""
+        self._free.clear()
+        self.hits = self.misses = self.dropped = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of acquisitions served from the free list (0.0 before any)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict:
+        """Counters of the pool as plain data."""
+        return {"hits": self.hits, "misses": self.misses, "dropped": self.dropped,
+                "free": len(self._free), "hit_rate": self.hit_rate}
+
+    def __len__(self) -> int:
+        """Number of objects waiting for reuse."""
+        return len(self._free)
+
+
+def pool_stats() -> dict[str, dict]:
+    """`stats()` of every named pool, by name."""
+    return {name: pool.stats() for name, pool in _POOLS.items()}
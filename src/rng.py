@@ -0,0 +1,139 @@
+"""
+rng.py
+Seeded random-number service with independent named streams.
+
+Every random decision in the game draws from one of four streams:
+
+    combat  attack rolls (miss, crit, damage variation) and flee attempts
+    loot    item finds and enemy drops
+    events  mini-event and encounter rolls while exploring
+    ai      enemy decisions
+
+Each stream is seeded from the service seed and its name, so an extra draw
+in one stream (say, a new loot roll) never shifts the others, and two
+services with the same seed replay the same game. Streams are `Stream`
+objects: drop-in `random.Random` instances whose whole state is a single
+64-bit counter, which keeps snapshots and replays tiny.
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+
+STREAMS = ("combat", "loot", "events", "ai")
+
+_MASK64 = (1 << 64) - 1
+_GOLDEN = 0x9E3779B97F4A7C15
+
+
+def derive_seed(*parts) -> int:
+    """Stable 63-bit seed from arbitrary parts, independent of PYTHONHASHSEED."""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "big") >> 1
+
+
+class Stream(random.Random):
+    """
+    SplitMix64 generator behind the `random.Random` interface.
+
+    Only `random()` and `getrandbits()` are implemented here; `randint`,
+    `choice`, `choices`, `uniform` etc. are inherited and build on them.
+    """
+
+    def __init__(self, seed: int | None = None):  # pylint: disable=super-init-not-called
+        self._state = 0
+        self.gauss_next = None
+        self.seed(seed)
+
+    def seed(self, a=None, version=2) -> None:  # pylint: disable=arguments-differ,unused-argument
+        """Reset the stream; `None` seeds from the operating system."""
+        if a is None:
+            a = int.from_bytes(os.urandom(8), "big")
+        elif not isinstance(a, int):
+            a = derive_seed(a)
+        self._state = a & _MASK64
+        self.gauss_next = None
+
+    def _next64(self) -> int:
+        self._state = z = (self._state + _GOLDEN) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def random(self) -> float:
+        """Next float in [0.0, 1.0)."""
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        """Next integer with `k` random bits."""
+        if k <= 64:
+            return self._next64() >> (64 - k) if k else 0
+        value, bits = 0, 0
+        while bits < k:
+            value = (value << 64) | self._next64()
+            bits += 64
+        return value >> (bits - k)
+
+    def getstate(self) -> tuple:
+        return (self._state, self.gauss_next)
+
+    def setstate(self, state) -> None:
+        self._state, self.gauss_next = state
+
+
+class RNGService:
+    """
+    The game's source of randomness: one `Stream` per name in `STREAMS`,
+    available as attributes (`rng.combat`, `rng.loot`, ...).
+    """
+
+    def __init__(self, seed: int | None = None):
+        if seed is None:
+            seed = derive_seed(os.urandom(16))
+        self.seed = seed
+        for name in STREAMS:
+            setattr(self, name, Stream(derive_seed(seed, name)))
+
+    def stream(self, name: str) -> Stream:
+        """Return the stream called `name`."""
+        if name not in STREAMS:
+            raise KeyError(f"Unknown RNG stream {name!r}")
+        return getattr(self, name)
+
+    def getstate(self) -> dict:
+        """Seed and per-stream state, as plain integers."""
+        return {"seed": self.seed,
+                "streams": {name: list(self.stream(name).getstate()) for name in STREAMS}}
+
+    def setstate(self, state: dict) -> None:
+        """Restore a state returned by `getstate()`."""
+        self.seed = state["seed"]
+        for name, stream_state in state["streams"].items():
+            self.stream(name).setstate(tuple(stream_state))
+
+    def __repr__(self) -> str:
+        return f"RNGService(seed={self.seed})"
+
+
+_service: RNGService | None = None
+
+
+def get_service() -> RNGService:
+    """
+    The process-wide fallback service, used wherever no RNG was injected.
+    Created unseeded on first use.
+    """
+    global _service  # pylint: disable=global-statement
+    if _service is None:
+        _service = RNGService()
+    return _service
+
+
+def set_service(service: RNGService) -> None:
+    """Replace the process-wide fallback service (e.g. with a seeded one)."""
+    global _service  # pylint: disable=global-statement
+    _service = service
+
+
+__all__ = ["STREAMS", "Stream", "RNGService", "derive_seed", "get_service", "set_service"]
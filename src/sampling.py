@@ -0,0 +1,167 @@
+"""
+sampling.py
+Constant-time weighted sampling with Walker/Vose alias tables.
+
+`AliasTable` is the fixed index sampler; `WeightedSampler` wraps it in a
+table of outcomes that can grow and shrink at runtime.
+"""
+from __future__ import annotations
+
+from random import Random
+from typing import Generic, Hashable, Iterator, Sequence, TypeVar
+
+T = TypeVar("T", bound=Hashable)
+
+
+class AliasTable:
+    """
+    Samples index `i` with probability `weights[i] / sum(weights)` in O(1)
+    per draw, after an O(n) build.
+
+    Each of the n columns holds a threshold `prob[i]` and an `alias[i]`: a
+    draw picks a column uniformly and returns `i` below the threshold, the
+    alias above it. One `rng.random()` call supplies both choices.
+    """
+
+    __slots__ = ("prob", "alias")
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        Raises:
+            ValueError: If `weights` is empty, has a negative entry or sums to 0.
+        """
+        if not weights:
+            raise ValueError("alias table needs at least one weight")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("alias table weights must be non-negative")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("alias table weights must not all be zero")
+
+        n = len(weights)
+        scaled = [weight * n / total for weight in weights]
+        prob = [1.0] * n
+        alias = list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            prob[low] = scaled[low]
+            alias[low] = high
+            scaled[high] -= 1.0 - scaled[low]
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Leftovers are 1.0 up to rounding error; they keep prob 1.0.
+        self.prob = prob
+        self.alias = alias
+
+    @classmethod
+    def from_columns(cls, prob: list[float], alias: list[int]) -> "AliasTable":
+        """Rebuild a table from the `prob`/`alias` columns of a compiled one."""
+        table = cls.__new__(cls)
+        table.prob = prob
+        table.alias = alias
+        return table
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def sample(self, rng: Random) -> int:
+        """Draw one index."""
+        column = rng.random() * len(self.prob)
+        index = int(column)
+        return index if column - index < self.prob[index] else self.alias[index]
+
+
+class WeightedSampler(Generic[T]):
+    """
+    A mutable weighted table of outcomes with O(1) draws.
+
+    `add` and `remove` only mark the table stale; the alias table is
+    rebuilt on the next draw, so registering dozens of outcomes in a row
+    costs one O(n) build. `entries` is the live `(outcome, weight)` list;
+    appending to it directly is noticed too, but edit weights through
+    `add`/`remove`.
+    """
+
+    def __init__(self, entries: "Sequence[tuple[T, float]]" = ()):
+        self.entries: list[tuple[T, float]] = []
+        self._table: AliasTable | None = None
+        self._outcomes: list[T] = []
+        for outcome, weight in entries:
+            self.add(outcome, weight)
+
+    def add(self, outcome: T, weight: float) -> None:
+        """
+        Add `outcome` with `weight`, or replace its weight if present.
+
+        Raises:
+            ValueError: If `weight` is negative.
+        """
+        if weight < 0:
+            raise ValueError("weights must be non-negative")
+        for index, (existing, _) in enumerate(self.entries):
+            if existing == outcome:
+                self.entries[index] = (outcome, weight)
+                break
+        else:
+            self.entries.append((outcome, weight))
+        self._table = None
+
+    def remove(self, outcome: T) -> bool:
+        """Drop `outcome`. Returns False if it was not in the table."""
+        for index, (existing, _) in enumerate(self.entries):
+            if existing == outcome:
+                del self.entries[index]
+                self._table = None
+                return True
+        return False
+
+    @property
+    def total(self) -> float:
+        """Sum of all weights."""
+        return sum(weight for _, weight in self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self) -> Iterator[tuple[T, float]]:
+        return iter(self.entries)
+
+    def __contains__(self, outcome) -> bool:
+        return any(existing == outcome for existing, _ in self.entries)
+
+    def _alias(self) -> AliasTable:
+        table = self._table
+        if table is None or len(table) != len(self.entries):
+            table = self._table = AliasTable([weight for _, weight in self.entries])
+            self._outcomes = [outcome for outcome, _ in self.entries]
+        return table
+
+    def choice(self, rng: Random) -> T:
+        """
+        Draw one outcome.
+
+        Raises:
+            ValueError: If the table is empty or all weights are zero.
+        """
+        index = self._alias().sample(rng)
+        return self._outcomes[index]
+
+    def sample(self, n: int, rng: Random) -> list[T]:
+        """
+        Draw `n` outcomes independently (with replacement), in one call.
+
+        Raises:
+            ValueError: If the table is empty or all weights are zero.
+        """
+        table = self._alias()
+        outcomes, prob, alias = self._outcomes, table.prob, table.alias
+        size = len(prob)
+        draw = rng.random
+        result = []
+        append = result.append
+        for _ in range(n):
+            column = draw() * size
+            index = int(column)
+            append(outcomes[index if column - index < prob[index] else alias[index]])
+        return result
@@ -0,0 +1,9 @@
+"""
+Headless simulation helpers.
+
+Everything in this package runs without a display or `pygame.init()`, so
+fights can be resolved in bulk for balance checks and server-side validation.
+"""
+from .battle import BattleEngine, BattleResult, default_policy, simulate_battle
+
+__all__ = ["BattleEngine", "BattleResult", "default_policy", "simulate_battle"]
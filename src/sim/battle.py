@@ -0,0 +1,352 @@
+"""
+battle.py
+Headless combat rules for a single Player-vs-Enemy encounter.
+
+`BattleEngine` owns every rule that used to live inside `BattleState`
+(attacks, defending, skills, items, statuses, cool-downs, fleeing and
+rewards) but knows nothing about screens, state machines or frames.
+`BattleState` layers input handling, transitions and rendering on top of
+it, while `simulate_battle` drives it in a tight loop for balance checks.
+"""
+# pylint: disable=too-many-instance-attributes
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable
+
+from .. import config
+from ..content import get_content
+from ..core.battle_log import BattleLog, NullLog
+from ..entities.status import StunStatus
+from ..events.bus import EventBus
+from ..events.combat import (DamageDealt, LogWriter, RewardGranted, SkillUsed, StatusApplied,
+                             TurnEnded)
+from ..rng import RNGService, get_service
+from ..utils import EncounterMeta, add_to_log, handle_item_use
+
+
+class BattleEngine:
+    """
+    Resolves turns of a single battle without any display dependency.
+
+    Outcomes (damage, skills, statuses, turns, rewards) are published as
+    records from `src.events.combat` on `self.bus`; the battle log is one
+    subscriber of it. Events are only built while something is subscribed.
+    """
+
+    def __init__(self, player, enemy, encounter_meta: EncounterMeta,  # pylint: disable=too-many-arguments
+                 rng: RNGService | None = None, log: BattleLog | None = None,
+                 bus: EventBus | None = None):
+        self.player = player
+        self.enemy = enemy
+        self.meta = encounter_meta
+        self.rng = rng if rng is not None else get_service()
+        self.player_turn = True
+        self.battle_log = log if log is not None else BattleLog()
+        self.ticked_this_turn = False
+        self.bus = bus if bus is not None else EventBus()
+        if getattr(self.battle_log, "enabled", True):
+            LogWriter(self.battle_log).attach(self.bus)
+
+    def emit(self, kind: type, *args) -> None:
+        """Publish `kind(*args)` on the bus if a subscriber wants that kind."""
+        self.bus.emit(kind, *args)
+
+    def _use_skill(self, skill, actor, target) -> None:
+        """Execute `skill` and publish what it did."""
+        result = skill.execute(actor, target, self) or {}
+        if "damage" in result:
+            self.emit(DamageDealt, actor.name, target.name, result["damage"],
+                      False, False, skill.name)
+        if result.get("stun"):
+            self.emit(StatusApplied, target.name, StunStatus.name, 1)
+        self.emit(SkillUsed, actor.name, skill.name)
+
+    def start(self) -> None:
+        """Reset both combatants and announce the encounter."""
+        self.player.battle_reset()
+        self.enemy.reset()
+        add_to_log(self.battle_log, "A wild {} appears!", self.enemy.name)
+
+    @property
+    def player_max_health(self):
+        """Returns the player's maximum health."""
+        return self.player.max_health
+
+    @property
+    def enemy_max_health(self):
+        """Returns the enemy's maximum health."""
+        return self.enemy.max_health
+
+    def begin_turn(self) -> None:
+        """Tick statuses and cool-downs of the acting entity once per turn."""
+        if self.ticked_this_turn:
+            return
+        actor = self.player if self.player_turn else self.enemy
+        actor.tick_statuses(self)
+        actor.tick_cooldowns()
+        self.ticked_this_turn = True
+
+    def _end_turn(self, counted: bool = True) -> None:
+        """Pass the turn to the other combatant; `counted` turns advance `meta.turns`."""
+        actor = self.player if self.player_turn else self.enemy
+        if counted:
+            self.meta.turns += 1
+        self.player_turn = not self.player_turn
+        self.ticked_this_turn = False
+        self.emit(TurnEnded, self.meta.turns, actor.name)
+
+    def player_action(self, action='attack'):
+        """
+        Executes a player action (attack, heal, or defend).
+        Returns the action message for logging.
+        """
+        if self._check_stun_and_flip(self.player, "Player"):
+            return
+        if self.player_turn:
+            if action == 'attack':
+                result = self.player.attack_action(self.enemy, self.rng.combat)
+                if result.get("no_stamina"):
+                    add_to_log(self.battle_log, "Too tired to attack!")
+                    return  # Don't flip turn
+                self.emit(DamageDealt, self.player.name, self.enemy.name, result["damage"],
+                          result["crit"], result["miss"])
+            elif action == 'heal':
+                if not self.player.has_potion():
+                    add_to_log(self.battle_log, "No potions left!")
+                    return  # Don't flip turn
+                heal_amount = self.player.use_potion()
+                if heal_amount > 0:
+                    potion_count = self.player.inventory.count("Healing Potion")
+                    add_to_log(self.battle_log, "Player uses potion for {} HP! ({} left)",
+                               heal_amount, potion_count)
+                else:
+                    add_to_log(self.battle_log, "No potions left!")
+            elif action == 'defend':
+                self.player.defend()
+                add_to_log(self.battle_log,
+                           "Player braces for the next attack, gaining 1 stamina.")
+            self._end_turn()
+
+    def player_skill(self, key: str) -> bool:
+        """
+        Use the player's skill bound to `key` ('q', 'w', 'e' or 'r').
+        Returns True if the skill fired and the turn passed to the enemy.
+        """
+        skill = self.player.get_skill_for_key(key)
+        if skill and self.player.ability_ready(skill.name):
+            self._use_skill(skill, self.player, self.enemy)
+            self._end_turn()
+            return True
+        add_to_log(self.battle_log, "Skill is on cool-down!")
+        return False
+
+    def player_item(self, key) -> bool:
+        """
+        Use the inventory item bound to number `key`.
+        Returns True if an item was used and the turn passed to the enemy.
+        """
+        result = handle_item_use(self.player, key, lambda msg: add_to_log(self.battle_log, msg))
+        if result.get("success"):
+            self._end_turn(counted=False)
+            return True
+        return False
+
+    def enemy_action(self):
+        """Executes the enemy's action and returns the message."""
+        if self._check_stun_and_flip(self.enemy, self.enemy.name):
+            return
+        if self.player_turn:
+            return
+
+        # C. Enemy AI skill usage
+        ready_skills = [s for s in self.enemy.skills if self.enemy.ability_ready(s.name)]
+        skill_to_use = None
+        if ready_skills:
+            for skill in ready_skills:
+                if skill.name == "Shield Bash" and self.player.has_status(StunStatus):
+                    continue
+                skill_to_use = skill
+                break  # Use the first available skill
+
+        if skill_to_use:
+            self._use_skill(skill_to_use, self.enemy, self.player)
+            self._end_turn()
+            return
+
+        # AI: Decide whether to defend
+        should_defend = (
+            self.enemy.stamina == 0 or
+            (self.enemy.health < self.enemy.max_health * 0.35 and self.rng.ai.random() < 0.25)
+        )
+
+        if should_defend:
+            self.enemy.defend()
+            add_to_log(self.battle_log, "{} is defending!", self.enemy.name)
+        else:
+            # Attack action
+            result = self.enemy.attack_action(self.player, self.rng.combat)
+            self.emit(DamageDealt, self.enemy.name, self.player.name, result["damage"],
+                      result["crit"], result["miss"])
+        self._end_turn()
+
+    def _check_stun_and_flip(self, actor, name: str) -> bool:
+        """Return True if actor is stunned and the turn was skipped."""
+        if actor.has_status(StunStatus):
+            add_to_log(self.battle_log, "{} is stunned and cannot act!", name)
+            # do not consume stamina; simply end turn
+            self._end_turn()
+            return True
+        return False
+
+    def flee(self) -> bool:
+        """
+        Roll a flee attempt. On success the encounter metadata is reset and
+        True is returned; on failure the turn passes to the enemy.
+        """
+        if self.rng.combat.random() <= config.FLEE_SUCCESS_PROB:
+            add_to_log(self.battle_log, "Fled successfully!")
+            self.meta.reset()  # Reset encounter metadata
+            self.bus.flush()
+            return True
+        add_to_log(self.battle_log, "Flee failed!")
+        self._end_turn(counted=False)
+        return False
+
+    def resolve(self) -> str | None:
+        """
+        Apply end-of-battle bookkeeping if either side has fallen.
+        Returns "victory", "defeat" or None while the fight continues.
+        """
+        if not self.enemy.is_alive():
+            self._handle_victory()
+            self.bus.flush()
+            return "victory"
+        if not self.player.is_alive():
+            add_to_log(self.battle_log, "Player has been defeated!")
+            self.bus.flush()
+            return "defeat"
+        return None
+
+    def _handle_victory(self):
+        """Handles the logic for when the player wins a battle."""
+        archetype = self.enemy.archetype
+        xp_award, gold_award = archetype.xp, archetype.gold
+        self.player.gain_xp(xp_award)
+        self.player.gain_gold(gold_award)
+        self.meta.battles_won += 1
+        self.meta.encounter_index += 1
+        add_to_log(self.battle_log, "You have defeated the {}!", self.enemy.name)
+        self.emit(RewardGranted, xp_award, gold_award)
+
+        drop = get_content().loot_table("enemy_drop").draw(self.rng.loot)
+        if drop is None:
+            return
+        if not drop.can_store:
+            drop.use(self.player)
+            self.emit(RewardGranted, 0, drop.amount, None, "drop")
+        else:
+            self.player.add_item(drop)
+            self.emit(RewardGranted, 0, 0, drop.name, "drop")
+
+
+@dataclass
+class BattleResult:
+    """Outcome of a headless battle."""
+    outcome: str  # "victory", "defeat", "fled" or "timeout"
+    turns: int
+    player_health: int
+    enemy_health: int
+
+
+Policy = Callable[[BattleEngine], str]
+SKILL_KEYS = ("q", "w", "e", "r")
+
+
+def default_policy(battle: BattleEngine) -> str:
+    """
+    A simple greedy player: bash whenever ready, attack while stamina lasts,
+    rush for stamina when empty and otherwise defend.
+
+    Returns one of "attack", "defend", "flee" or a skill key ("q".."r").
+    """
+    player = battle.player
+    if player.ability_ready("Shield Bash"):
+        return "q"
+    if player.stamina >= 1:
+        return "attack"
+    if player.ability_ready("Adrenaline Rush"):
+        return "w"
+    return "defend"
+
+
+def simulate_battle(
+    player,
+    enemy,
+    meta: EncounterMeta | None = None,
+    policy: Policy = default_policy,
+    max_turns: int = 500,
+    rng: RNGService | None = None,
+    log: BattleLog | None = None,
+    bus: EventBus | None = None,
+) -> BattleResult:
+    """
+    Fight `player` against `enemy` to completion without a display.
+
+    Each loop iteration is exactly one turn: the actor's statuses and
+    cool-downs tick, then the player's `policy` or the enemy AI acts.
+
+    Args:
+        player: The player entity; its health, inventory and rewards are
+            mutated just as in the real game.
+        enemy: The enemy entity.
+        meta: Encounter metadata; a fresh one is created if omitted.
+        policy: Callable choosing the player's action each turn.
+        max_turns: Safety cap after which the battle is declared a timeout.
+        rng: Random streams for the fight; the shared service if omitted.
+        log: Where battle messages go; dropped (`NullLog`) if omitted.
+        bus: Event bus to publish combat events on, e.g. with a
+            `CombatMetrics` attached; events are flushed when the fight ends.
+
+    Returns:
+        A `BattleResult` describing how the fight ended.
+    """
+    if meta is None:
+        meta = EncounterMeta(encounter_index=enemy.encounter_index)
+    battle = BattleEngine(player, enemy, meta, rng, log if log is not None else NullLog(), bus)
+    battle.start()
+
+    outcome = None
+    for _ in range(max_turns):
+        battle.begin_turn()
+        outcome = battle.resolve()
+        if outcome:
+            break
+
+        if battle.player_turn:
+            action = policy(battle)
+            if action == "flee":
+                if battle.flee():
+                    outcome = "fled"
+                    break
+            elif action in SKILL_KEYS:
+                battle.player_skill(action)
+            else:
+                battle.player_action(action)
+        else:
+            battle.enemy_action()
+
+        outcome = battle.resolve()
+        if outcome:
+            break
+    else:
+        outcome = "timeout"
+        battle.bus.flush()
+
+    return BattleResult(
+        outcome=outcome,
+        turns=meta.turns,
+        player_health=player.health,
+        enemy_health=enemy.health,
+    )
+
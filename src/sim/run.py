@@ -0,0 +1,184 @@
+"""
+run.py
+Headless simulation of a complete run: explore → battle → shop → explore
+until the player dies or a step budget is exhausted.
+
+Unlike `simulate_battle`, this drives the real `StateMachine` and game
+states with synthetic input signals, so every rule of the full loop
+(encounter chance, loot, mini-events, rewards, shop prices) is exercised
+exactly as in the game, just without a display.
+"""
+from __future__ import annotations
+
+import contextlib
+import warnings
+from dataclasses import asdict, dataclass
+
+import pygame
+
+from .. import config
+from ..core.events import empty_signals
+from ..core.game import new_session
+from ..rng import RNGService
+from ..states.battle import BattleState
+from ..states.explore import ExploreState
+from ..states.game_over import GameOverState
+from ..states.shop import ShopState
+from ..states.victory import VictoryState
+from ..utils import group_inventory
+from .battle import default_policy
+
+# pylint: disable=no-member
+
+HEAL_BELOW_PCT = 0.35
+SHOP_POTION_TARGET = 3
+
+
+@dataclass
+class RunResult:
+    """Summary of one simulated run."""
+    seed: int
+    steps: int
+    died: bool
+    battles_won: int
+    encounter_index: int
+    xp: int
+    gold: int
+    damage_boost_lvl: int
+    hp_boost_lvl: int
+    potions: int
+
+    def as_row(self) -> dict:
+        """Flatten into a dictionary suitable for a CSV row."""
+        return asdict(self)
+
+
+@contextlib.contextmanager
+def config_overrides(overrides: dict | None):
+    """
+    Temporarily set attributes of `src.config`, restoring them on exit.
+
+    Raises:
+        KeyError: If an override names a setting `config` does not define.
+    """
+    overrides = overrides or {}
+    unknown = [name for name in overrides if not hasattr(config, name)]
+    if unknown:
+        raise KeyError(f"Unknown config settings: {', '.join(unknown)}")
+    previous = {name: getattr(config, name) for name in overrides}
+    try:
+        for name, value in overrides.items():
+            setattr(config, name, value)
+        yield
+    finally:
+        for name, value in previous.items():
+            setattr(config, name, value)
+
+
+def _signals(**flags) -> dict:
+    """An empty signals dictionary with `flags` applied."""
+    signals = empty_signals()
+    signals.update(flags)
+    return signals
+
+
+def _potion_key(player) -> int | None:
+    """The number key of the player's healing potion slot, if any."""
+    for slot, (item, _, _) in enumerate(group_inventory(player.inventory)[:9]):
+        if item.name == "Healing Potion":
+            return pygame.K_1 + slot
+    return None
+
+
+def _needs_healing(player) -> bool:
+    return player.health < player.max_health * HEAL_BELOW_PCT
+
+
+def _explore_signals(state: ExploreState) -> dict:
+    """Drink a potion when badly hurt, otherwise take a step."""
+    key = _potion_key(state.player) if _needs_healing(state.player) else None
+    if key is not None:
+        return _signals(number_keys=[key])
+    return _signals(explore=True)
+
+
+def _battle_signals(state: BattleState) -> dict:
+    """
+    Follow `default_policy`, drinking a potion when badly hurt, or trying
+    to flee when badly hurt without one.
+    """
+    if not state.player_turn:
+        return _signals()
+    if _needs_healing(state.player):
+        key = _potion_key(state.player)
+        if key is None:
+            return _signals(flee=True)
+        return _signals(number_keys=[key])
+    action = default_policy(state)
+    if action in ("q", "w", "e", "r"):
+        return _signals(**{f"skill_{action}": True})
+    return _signals(**{action: True})
+
+
+def _go_shopping(state: ShopState) -> None:
+    """Buy every affordable boost, top up potions, then leave."""
+    player = state.player
+    for key, currency in (("3", "xp"), ("4", "xp")):
+        while getattr(player, currency) >= state.items[key]["cost"]:
+            state.update(_signals(number_keys=[ord(key)]))
+    potions = player.inventory.count("Healing Potion")
+    while potions < SHOP_POTION_TARGET and player.gold >= state.items["1"]["cost"]:
+        state.update(_signals(number_keys=[ord("1")]))
+        potions += 1
+    state.update(_signals(quit_shop=True))
+
+
+def simulate_run(seed: int, max_steps: int = 2_000) -> RunResult:
+    """
+    Play one full run headlessly with a fixed, greedy policy.
+
+    Args:
+        seed: Seed for the run's `RNGService`.
+        max_steps: Maximum number of exploration steps before stopping.
+
+    Returns:
+        A `RunResult` describing where the run ended.
+    """
+    player, meta, machine = new_session(None, RNGService(seed))
+    steps = 0
+
+    with warnings.catch_warnings():
+        # ShopState times its messages with pygame.time, which warns when
+        # pygame has not been initialised; timing is irrelevant here.
+        warnings.filterwarnings("ignore", message=r"pygame\.init\(\) has not been called")
+        while steps < max_steps:
+            state = machine.current
+            if isinstance(state, GameOverState):
+                break
+            if isinstance(state, ExploreState):
+                signals = _explore_signals(state)
+                steps += 1
+            elif isinstance(state, BattleState):
+                signals = _battle_signals(state)
+            elif isinstance(state, VictoryState):
+                machine.handle_events([pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)])
+                continue
+            elif isinstance(state, ShopState):
+                _go_shopping(state)
+                continue
+            else:
+                raise RuntimeError(f"Unexpected state {type(state).__name__}")
+            machine.update(signals)
+
+    return RunResult(
+        seed=seed,
+        steps=steps,
+        died=not player.is_alive(),
+        battles_won=meta.battles_won,
+        encounter_index=meta.encounter_index,
+        xp=player.xp,
+        gold=player.gold,
+        damage_boost_lvl=player.state.damage_boost_lvl,
+        hp_boost_lvl=player.state.hp_boost_lvl,
+        potions=player.inventory.count("Healing Potion"),
+    )
@@ -0,0 +1,378 @@
+"""
+vectorized.py
+Batched Monte Carlo combat simulator built on NumPy.
+
+`simulate_batch` resolves N independent Player-vs-Enemy fights at once,
+holding every combatant's health, stamina, block flag, cool-downs and
+status durations in arrays. Each step is one turn for every live fight,
+applying the same rules as `BattleEngine` driven by `default_policy`:
+
+* `PlayerAttackAbility.execute` – miss, crit and damage variation rolls.
+* `EnemyAttackAbility.execute` – flat damage.
+* `Entity.take_damage` – a held block halves (rounded up) and is consumed.
+* `ShieldBashAbility` / `AdrenalineRushAbility` – damage + stun and
+  +2 stamina with their cool-downs, including the enemy AI's skill order.
+* `PoisonStatus`, `BleedStatus`, `RegenerationStatus` and `StunStatus`.
+
+Statuses tick in the fixed order poison, bleed, regeneration rather than in
+the order they were applied; this only matters when regeneration would
+overheal on the same turn.
+
+NumPy is only needed by this module, so it is not re-exported from
+`src.sim`. Run `python -m src.sim.vectorized --help` for a quick sweep.
+"""
+# pylint: disable=too-many-locals,too-many-statements,too-many-arguments
+from __future__ import annotations
+
+import argparse
+import math
+import time
+from dataclasses import dataclass
+
+import numpy as np
+
+from .. import config
+from ..entities.status import BleedStatus, PoisonStatus, RegenerationStatus
+
+VICTORY = 1
+DEFEAT = -1
+TIMEOUT = 0
+
+SHIELD_BASH_COOLDOWN = 3
+SHIELD_BASH_DAMAGE = 0.75
+ADRENALINE_RUSH_COOLDOWN = 4
+ADRENALINE_RUSH_STAMINA = 2
+ENEMY_LOW_HEALTH_PCT = 0.35
+ENEMY_LOW_HEALTH_DEFEND_CHANCE = 0.25
+
+_STATUS_KEYS = ("poison", "bleed", "regeneration", "stun")
+
+
+@dataclass
+class BatchResult:
+    """Per-fight outcomes of a batch, indexed by fight number."""
+    encounter_index: int
+    outcome: np.ndarray       # VICTORY, DEFEAT or TIMEOUT
+    turns: np.ndarray         # turns taken, as counted by EncounterMeta.turns
+    player_health: np.ndarray
+    enemy_health: np.ndarray
+
+    @property
+    def fights(self) -> int:
+        """Number of fights in the batch."""
+        return int(self.outcome.size)
+
+    @property
+    def win_rate(self) -> float:
+        """Fraction of fights the player won."""
+        return float(np.mean(self.outcome == VICTORY))
+
+    def summary(self, percentiles=(10, 50, 90)) -> dict:
+        """
+        Collapse the batch into summary statistics.
+
+        Turn counts are reported over all finished fights; remaining player
+        HP is reported over victories only.
+        """
+        finished = self.outcome != TIMEOUT
+        won = self.outcome == VICTORY
+        summary = {
+            "encounter_index": self.encounter_index,
+            "fights": self.fights,
+            "win_rate": self.win_rate,
+            "defeat_rate": float(np.mean(self.outcome == DEFEAT)),
+            "timeout_rate": float(np.mean(~finished)),
+        }
+        summary.update(_distribution("turns", self.turns[finished], percentiles))
+        summary.update(_distribution("player_hp", self.player_health[won], percentiles))
+        return summary
+
+
+def _distribution(prefix: str, values: np.ndarray, percentiles) -> dict:
+    """Mean and percentiles of `values`, NaN when empty."""
+    if values.size == 0:
+        stats = {f"{prefix}_mean": math.nan}
+        stats.update({f"{prefix}_p{p}": math.nan for p in percentiles})
+        return stats
+    stats = {f"{prefix}_mean": float(values.mean())}
+    for p, value in zip(percentiles, np.percentile(values, percentiles)):
+        stats[f"{prefix}_p{p}"] = float(value)
+    return stats
+
+
+class _Side:  # pylint: disable=too-many-instance-attributes,too-few-public-methods
+    """Struct-of-arrays state for one side of every live fight."""
+
+    def __init__(self, n: int, health: int, max_health: int, attack: int,
+                 stamina: int, statuses: dict | None):
+        self.hp = np.full(n, health, dtype=np.int64)
+        self.max_hp = max_health
+        self.attack = attack
+        self.stamina = np.full(n, stamina, dtype=np.int64)
+        self.block = np.zeros(n, dtype=bool)
+        self.bash_cd = np.zeros(n, dtype=np.int64)
+        self.rush_cd = np.zeros(n, dtype=np.int64)
+        statuses = statuses or {}
+        unknown = set(statuses) - set(_STATUS_KEYS)
+        if unknown:
+            raise ValueError(f"Unknown statuses: {sorted(unknown)}")
+        self.status = {
+            key: np.full(n, statuses.get(key, 0), dtype=np.int64) for key in _STATUS_KEYS
+        }
+
+    def compact(self, keep: np.ndarray) -> None:
+        """Drop finished fights, keeping rows where `keep` is True."""
+        for name in ("hp", "stamina", "block", "bash_cd", "rush_cd"):
+            setattr(self, name, getattr(self, name)[keep])
+        for key in _STATUS_KEYS:
+            self.status[key] = self.status[key][keep]
+
+    def tick(self, acting: np.ndarray) -> None:
+        """Status effects and cool-downs at the start of this side's turn."""
+        poison = acting & (self.status["poison"] > 0)
+        self.hp -= poison * math.ceil(self.max_hp * PoisonStatus.PCT_DAMAGE)
+        np.maximum(self.hp, 0, out=self.hp)
+
+        bleed = acting & (self.status["bleed"] > 0)
+        self.hp -= bleed * BleedStatus.FLAT_DAMAGE
+        np.maximum(self.hp, 0, out=self.hp)
+
+        regen = acting & (self.status["regeneration"] > 0)
+        self.hp += regen * RegenerationStatus.FLAT_HEAL
+        np.minimum(self.hp, self.max_hp, out=self.hp)
+
+        for key in _STATUS_KEYS:
+            duration = self.status[key]
+            duration -= acting & (duration > 0)
+        self.bash_cd -= acting & (self.bash_cd > 0)
+        self.rush_cd -= acting & (self.rush_cd > 0)
+
+    def take_damage(self, mask: np.ndarray, raw: np.ndarray | int) -> None:
+        """Vectorised `Entity.take_damage` for rows in `mask`."""
+        blocked = mask & self.block
+        raw = np.broadcast_to(np.asarray(raw, dtype=np.float64), self.hp.shape)
+        final = np.where(blocked, np.ceil(raw * (1 - config.DEFEND_BLOCK)), raw)
+        self.hp -= np.where(mask, final, 0).astype(np.int64)
+        np.maximum(self.hp, 0, out=self.hp)
+        self.block &= ~blocked
+
+    def defend(self, mask: np.ndarray) -> None:
+        """Raise block and gain one stamina."""
+        self.block |= mask
+        self.stamina += mask
+        np.minimum(self.stamina, config.MAX_STAMINA, out=self.stamina)
+
+    def shield_bash(self, mask: np.ndarray, target: "_Side") -> None:
+        """75% damage plus a one-turn stun, 3-turn cool-down."""
+        target.take_damage(mask, int(self.attack * SHIELD_BASH_DAMAGE))
+        stun = target.status["stun"]
+        stun[mask] = np.maximum(stun[mask], 1)
+        self.bash_cd[mask] = SHIELD_BASH_COOLDOWN
+
+    def adrenaline_rush(self, mask: np.ndarray) -> None:
+        """+2 stamina, 4-turn cool-down."""
+        self.stamina += mask * ADRENALINE_RUSH_STAMINA
+        np.minimum(self.stamina, config.MAX_STAMINA, out=self.stamina)
+        self.rush_cd[mask] = ADRENALINE_RUSH_COOLDOWN
+
+
+def simulate_batch(
+    n: int,
+    encounter_index: int = 1,
+    *,
+    damage_boost_lvl: int = 0,
+    hp_boost_lvl: int = 0,
+    power_strike_bonus: int = 0,
+    player_health: int | None = None,
+    player_stamina: int = 1,
+    player_statuses: dict[str, int] | None = None,
+    enemy_statuses: dict[str, int] | None = None,
+    max_turns: int = 500,
+    seed: int | np.random.Generator | None = None,
+) -> BatchResult:
+    """
+    Resolve `n` independent fights against an enemy of `encounter_index`.
+
+    Constants are read from `config` at call time, so a sweep can patch
+    e.g. `config.ENEMY_HEALTH_SCALING` between calls.
+
+    Args:
+        n: Number of fights.
+        encounter_index: Enemy level, as passed to `Enemy(encounter_index)`.
+        damage_boost_lvl: Purchased damage boosts (each adds DAMAGE_BOOST_PCT).
+        hp_boost_lvl: Purchased max-HP boosts (each adds MAX_HP_BOOST_PCT).
+        power_strike_bonus: Flat bonus added to the player's attack.
+        player_health: Starting HP; defaults to full health.
+        player_stamina: Starting stamina (a fresh Player has 1).
+        player_statuses / enemy_statuses: Initial status durations keyed by
+            "poison", "bleed", "regeneration" or "stun".
+        max_turns: Turns after which an unfinished fight is a TIMEOUT.
+        seed: Seed or `numpy.random.Generator` for reproducible batches.
+
+    Returns:
+        A `BatchResult` with one entry per fight.
+    """
+    rng = np.random.default_rng(seed)
+
+    p_max = int(config.PLAYER_BASE_HEALTH * (1.0 + hp_boost_lvl * config.MAX_HP_BOOST_PCT))
+    p_attack = config.PLAYER_BASE_ATTACK
+    player = _Side(
+        n, p_max if player_health is None else min(player_health, p_max), p_max,
+        p_attack, min(player_stamina, config.MAX_STAMINA), player_statuses,
+    )
+    e_max = config.ENEMY_BASE_HEALTH + (encounter_index - 1) * config.ENEMY_HEALTH_SCALING
+    e_attack = config.ENEMY_BASE_ATTACK + (encounter_index - 1) * config.ENEMY_ATTACK_SCALING
+    enemy = _Side(n, e_max, e_max, e_attack, 1, enemy_statuses)
+
+    damage_mult = 1.0 + damage_boost_lvl * config.DAMAGE_BOOST_PCT
+    base_damage = (p_attack + power_strike_bonus) * damage_mult
+    low, high = config.PLAYER_DMG_VARIATION
+
+    outcome = np.full(n, TIMEOUT, dtype=np.int8)
+    turns_out = np.zeros(n, dtype=np.int64)
+    player_hp_out = np.zeros(n, dtype=np.int64)
+    enemy_hp_out = np.zeros(n, dtype=np.int64)
+
+    ids = np.arange(n)
+    turns = np.zeros(n, dtype=np.int64)
+
+    def finish(done: np.ndarray, code: int) -> None:
+        rows = ids[done]
+        outcome[rows] = code
+        turns_out[rows] = turns[done]
+        player_hp_out[rows] = player.hp[done]
+        enemy_hp_out[rows] = enemy.hp[done]
+
+    def resolve() -> np.ndarray:
+        """Record finished fights; returns the mask of those still live."""
+        won = enemy.hp <= 0
+        lost = ~won & (player.hp <= 0)
+        finish(won, VICTORY)
+        finish(lost, DEFEAT)
+        return ~(won | lost)
+
+    live = np.ones(n, dtype=bool)
+    for step in range(max_turns):
+        if not live.any():
+            break
+        # Drop finished rows once they make up a quarter of the arrays.
+        if live.sum() < 0.75 * live.size:
+            player.compact(live)
+            enemy.compact(live)
+            ids, turns, live = ids[live], turns[live], live[live]
+
+        player_turn = step % 2 == 0
+        (player if player_turn else enemy).tick(live)
+        live &= resolve()
+
+        if player_turn:
+            _player_step(player, enemy, live, rng, base_damage, low, high)
+        else:
+            _enemy_step(enemy, player, live, rng)
+        turns += live
+
+        live &= resolve()
+
+    # Anything still live ran out of turns and stays a TIMEOUT.
+    rows = ids[live]
+    turns_out[rows] = turns[live]
+    player_hp_out[rows] = player.hp[live]
+    enemy_hp_out[rows] = enemy.hp[live]
+
+    return BatchResult(encounter_index, outcome, turns_out, player_hp_out, enemy_hp_out)
+
+
+def _player_step(player: _Side, enemy: _Side, live: np.ndarray, rng,
+                 base_damage: float, low: float, high: float) -> None:
+    """One player turn following `default_policy`."""
+    stunned = player.status["stun"] > 0
+
+    bash = live & (player.bash_cd == 0)
+    attack = live & ~bash & (player.stamina >= 1)
+    rush = live & ~bash & ~attack & (player.rush_cd == 0)
+    defend = live & ~bash & ~attack & ~rush
+
+    # Skills bypass the stun check; attack and defend are skipped when stunned.
+    attack &= ~stunned
+    defend &= ~stunned
+
+    player.shield_bash(bash, enemy)
+    player.adrenaline_rush(rush)
+
+    size = live.size
+    hit = rng.random(size) >= config.PLAYER_MISS_CHANCE
+    crit = rng.random(size) < config.PLAYER_CRIT_CHANCE
+    damage = base_damage * rng.uniform(low, high, size)
+    damage = np.where(crit, damage * config.PLAYER_CRIT_MULTIPLIER, damage)
+    player.stamina -= attack
+    enemy.take_damage(attack & hit, np.round(damage))
+
+    player.defend(defend)
+
+
+def _enemy_step(enemy: _Side, player: _Side, live: np.ndarray, rng) -> None:
+    """One enemy turn following `BattleEngine.enemy_action`."""
+    acting = live & ~(enemy.status["stun"] > 0)
+
+    bash = acting & (enemy.bash_cd == 0) & ~(player.status["stun"] > 0)
+    rush = acting & ~bash & (enemy.rush_cd == 0)
+    basic = acting & ~bash & ~rush
+
+    low_health = enemy.hp < enemy.max_hp * ENEMY_LOW_HEALTH_PCT
+    nervous = rng.random(live.size) < ENEMY_LOW_HEALTH_DEFEND_CHANCE
+    defend = basic & ((enemy.stamina == 0) | (low_health & nervous))
+    attack = basic & ~defend
+
+    enemy.shield_bash(bash, player)
+    enemy.adrenaline_rush(rush)
+    enemy.defend(defend)
+    enemy.stamina -= attack
+    player.take_damage(attack, round(enemy.attack))
+
+
+def sweep(encounter_indices, n: int, seed: int | None = None, **kwargs) -> list[dict]:
+    """
+    Run `simulate_batch` for each encounter index and return one summary
+    row per index. Extra keyword arguments are forwarded to `simulate_batch`.
+    """
+    rng = np.random.default_rng(seed)
+    return [
+        simulate_batch(n, index, seed=rng, **kwargs).summary()
+        for index in encounter_indices
+    ]
+
+
+def _parse_range(text: str) -> range:
+    """Parse "3" or "0-20" into an inclusive range."""
+    first, _, last = text.partition("-")
+    return range(int(first), int(last or first) + 1)
+
+
+def main(argv=None) -> None:
+    """Command-line entry point printing a win-rate table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--encounters", type=_parse_range, default=range(0, 11),
+                        help="Encounter index or inclusive range, e.g. 0-20.")
+    parser.add_argument("--fights", type=int, default=100_000,
+                        help="Fights per encounter index.")
+    parser.add_argument("--damage-boost", type=int, default=0)
+    parser.add_argument("--hp-boost", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = sweep(args.encounters, args.fights, seed=args.seed,
+                 damage_boost_lvl=args.damage_boost, hp_boost_lvl=args.hp_boost)
+    elapsed = time.perf_counter() - start
+
+    print(f"{'enc':>4} {'win%':>7} {'turns p50':>10} {'turns p90':>10} {'hp p50':>8}")
+    for row in rows:
+        print(f"{row['encounter_index']:>4} {row['win_rate']:>7.1%} "
+              f"{row['turns_p50']:>10.0f} {row['turns_p90']:>10.0f} "
+              f"{row['player_hp_p50']:>8.0f}")
+    total = args.fights * len(rows)
+    print(f"{total:,} fights in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
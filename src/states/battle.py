@@ -1,154 +1,68 @@
 """BattleState: turn-based combat state with status-effect integration."""
 # pylint: disable=too-many-instance-attributes, attribute-defined-outside-init
 # pylint: disable=cyclic-import
-import random
-
 from .. import config
 from ..core.state_machine import BaseState
-from ..core.ui import render_battle_screen
-from ..entities.status import StunStatus  # status helpers
-from ..items.items import HealingPotion
-from ..utils import add_to_log, EncounterMeta, handle_item_use
+from ..core.ui import UI
+from ..core.widgets import (HealthBar, InventoryPanel, Label, LogPanel, SkillBar,
+                            StatusIcons, WidgetGroup)
+from ..entities.archetypes import release_enemy
+from ..sim.battle import BattleEngine
+from ..utils import EncounterMeta
+
 
+class BattleState(BaseState, BattleEngine):
+    """
+    Manages the state of a single battle encounter.
 
-class BattleState(BaseState):
-    """Manages the state of a single battle encounter."""
+    Combat rules live in `BattleEngine`; this class maps input signals onto
+    them, performs state transitions and renders the battle screen.
+    """
 
-    def __init__(self, player, enemy, encounter_meta: EncounterMeta, screen):
-        super().__init__()
-        self.player = player
-        self.enemy = enemy
-        self.meta = encounter_meta
+    def __init__(self, player, enemy, encounter_meta: EncounterMeta, screen, rng=None):
+        BaseState.__init__(self)
+        BattleEngine.__init__(self, player, enemy, encounter_meta, rng)
         self.screen = screen
-        self.player_turn = True
-        self.battle_log = []
-        self.ticked_this_turn = False
+        self.hud = None  # built on first render; headless battles never need it
+
+    def _build_hud(self) -> WidgetGroup:
+        """Widgets of the battle screen, laid out like `UI.render_battle_screen`."""
+        player_x, player_y = config.BATTLE_PLAYER_HEALTH_POS
+        return WidgetGroup([
+            InventoryPanel((config.SCREEN_WIDTH - 250, config.SCREEN_HEIGHT - 210),
+                           lambda: self.player.inventory),
+            HealthBar(config.BATTLE_PLAYER_HEALTH_POS,
+                      lambda: ("Player", self.player.health, self.player_max_health),
+                      config.PLAYER_HEALTH_COLOR),
+            HealthBar(config.BATTLE_ENEMY_HEALTH_POS,
+                      lambda: (self.enemy.name, self.enemy.health, self.enemy_max_health),
+                      config.ENEMY_HEALTH_COLOR),
+            Label((player_x, player_y + 40),
+                  lambda: f"STA: {self.player.stamina}/{self.player.max_stamina}"),
+            SkillBar((20, player_y + 70), lambda: self.player),
+            Label(config.BATTLE_GOLD_POS, lambda: f"Gold: {self.player.gold}",
+                  font_size=config.LARGE_FONT_SIZE),
+            Label(config.BATTLE_INSTRUCTIONS_POS,
+                  lambda: (("(A)ttack    (D)efend    (F)lee", config.UI_ACCENT_COLOR)
+                           if self.player_turn
+                           else ("Enemy's turn...", config.ENEMY_TURN_COLOR)),
+                  font_size=config.MEDIUM_FONT_SIZE),
+            LogPanel(config.BATTLE_LOG_START_POS, lambda: self.battle_log),
+            StatusIcons((50, 100), lambda: self.player),
+            StatusIcons((500, 100), lambda: self.enemy),
+        ])
 
     def enter(self, prev_state, **kwargs):
         """Reset entities and prepare for battle."""
-        self.player.battle_reset()
-        self.enemy.reset()
-        add_to_log(self.battle_log, f"A wild {self.enemy.name} appears!")
-
-    @property
-    def player_max_health(self):
-        """Returns the player's maximum health."""
-        return self.player.max_health
-
-    @property
-    def enemy_max_health(self):
-        """Returns the enemy's maximum health."""
-        return self.enemy.max_health
-
-    def player_action(self, action='attack'):
-        """
-        Executes a player action (attack, heal, or defend).
-        Returns the action message for logging.
-        """
-        if self._check_stun_and_flip(self.player, "Player"):
-            return
-        msg = ""  # Default message if no action is taken
-        if self.player_turn:
-            if action == 'attack':
-                result = self.player.attack_action(self.enemy)
-                if result.get("no_stamina"):
-                    add_to_log(self.battle_log, "Too tired to attack!")
-                    return  # Don't flip turn
-                damage, crit, miss = result["damage"], result["crit"], result["miss"]
-                if miss:
-                    msg = "Player missed!"
-                elif crit:
-                    msg = f"Critical hit! Player deals {damage} damage."
-                else:
-                    msg = f"Player deals {damage} damage."
-            elif action == 'heal':
-                if not self.player.has_potion():
-                    add_to_log(self.battle_log, "No potions left!")
-                    return  # Don't flip turn
-                heal_amount = self.player.use_potion()
-                if heal_amount > 0:
-                    potion_count = sum(1 for item in self.player.inventory
-                                     if isinstance(item, HealingPotion))
-                    msg = f"Player uses potion for {heal_amount} HP! ({potion_count} left)"
-                else:
-                    msg = "No potions left!"
-            elif action == 'defend':
-                self.player.defend()
-                msg = "Player braces for the next attack, gaining 1 stamina."
-            add_to_log(self.battle_log, msg)
-            self.meta.turns += 1
-            self.player_turn = False
-            self.ticked_this_turn = False
-
-    def enemy_action(self):
-        """Executes the enemy's action and returns the message."""
-        if self._check_stun_and_flip(self.enemy, self.enemy.name):
-            return
-        if self.player_turn:
-            return
+        self.start()
 
-        # C. Enemy AI skill usage
-        ready_skills = [s for s in self.enemy.skills if self.enemy.ability_ready(s.name)]
-        skill_to_use = None
-        if ready_skills:
-            for skill in ready_skills:
-                if skill.name == "Shield Bash" and any(
-                    isinstance(st, StunStatus) for st in self.player.statuses
-                ):
-                    continue
-                skill_to_use = skill
-                break  # Use the first available skill
-
-        if skill_to_use:
-            skill_to_use.execute(self.enemy, self.player, self)
-            add_to_log(self.battle_log, f"{self.enemy.name} uses {skill_to_use.name}.")
-            self.meta.turns += 1
-            self.player_turn = True
-            self.ticked_this_turn = False
-            return
-
-        # AI: Decide whether to defend
-        should_defend = (
-            self.enemy.stamina == 0 or
-            (self.enemy.health < self.enemy.max_health * 0.35 and random.random() < 0.25)
-        )
-
-        if should_defend:
-            self.enemy.defend()
-            add_to_log(self.battle_log, f"{self.enemy.name} is defending!")
-        else:
-            # Attack action
-            result = self.enemy.attack_action(self.player)
-            damage, crit, miss = result["damage"], result["crit"], result["miss"]
-            if miss:
-                msg = f"{self.enemy.name} missed!"
-            elif crit:
-                msg = f"Critical hit! {self.enemy.name} deals {damage} damage."
-            else:
-                msg = f"{self.enemy.name} deals {damage} damage."
-            add_to_log(self.battle_log, msg)
-        self.meta.turns += 1
-        self.player_turn = True
-        self.ticked_this_turn = False
-
-    def _check_stun_and_flip(self, actor, name: str) -> bool:
-        """Return True if actor is stunned and the turn was skipped."""
-        if actor.has_status(StunStatus):
-            add_to_log(self.battle_log, f"{name} is stunned and cannot act!")
-            # do not consume stamina; simply end turn
-            self.player_turn = not self.player_turn
-            self.ticked_this_turn = False
-            self.meta.turns += 1
-            return True
-        return False
+    def exit(self, next_state):
+        """Hand a pooled enemy back once the battle is over."""
+        release_enemy(self.enemy)
 
     def update(self, signals: dict) -> None:
         """Runs one frame of battle logic."""
-        if not self.ticked_this_turn:
-            actor = self.player if self.player_turn else self.enemy
-            actor.tick_statuses(self)
-            actor.tick_cooldowns()
-            self.ticked_this_turn = True
+        self.begin_turn()
 
         # Tick active status effects for the acting entity
         if not self.player_turn and self.enemy.is_alive():
@@ -173,21 +87,9 @@ class BattleState(BaseState):
         elif signals.get("defend"):
             action_taken = 'defend'
         elif skill_key:
-            skill = self.player.get_skill_for_key(skill_key)
-            if skill and self.player.ability_ready(skill.name):
-                skill.execute(self.player, self.enemy, self)
-                add_to_log(self.battle_log, f"Player uses {skill.name}.")
-                self.meta.turns += 1
-                self.player_turn = False
-                self.ticked_this_turn = False
-            else:
-                add_to_log(self.battle_log, "Skill is on cool-down!")
+            self.player_skill(skill_key)
         elif signals.get("number_keys"):
-            key = signals["number_keys"][0]
-            result = handle_item_use(self.player, key, lambda msg: add_to_log(self.battle_log, msg))
-            if result.get("success"):
-                self.player_turn = False
-                self.ticked_this_turn = False
+            self.player_item(signals["number_keys"][0])
 
         if action_taken:
             self.player_action(action_taken)
@@ -200,57 +102,38 @@ class BattleState(BaseState):
         from .game_over import GameOverState
         from .victory import VictoryState
 
-        if not self.enemy.is_alive():
-            self._handle_victory()
+        outcome = self.resolve()
+        if outcome == "victory":
             self.machine.change(
-                VictoryState(self.player, self.meta, self.screen, self.battle_log)
+                VictoryState(self.player, self.meta, self.screen, self.battle_log, self.rng)
             )
-        elif not self.player.is_alive():
-            add_to_log(self.battle_log, "Player has been defeated!")
+        elif outcome == "defeat":
             self.machine.change(
-                GameOverState(self.player, self.meta, self.screen, self.battle_log)
+                GameOverState(self.player, self.meta, self.screen, self.battle_log, self.rng)
             )
 
-    def _handle_victory(self):
-        """Handles the logic for when the player wins a battle."""
-        xp_award = max(1, (self.enemy.encounter_index + 1) * 10)
-        gold_award = (self.enemy.encounter_index + 1) * 5
-        self.player.gain_xp(xp_award)
-        self.player.gain_gold(gold_award)
-        self.meta.battles_won += 1
-        self.meta.encounter_index += 1
-        add_to_log(self.battle_log, f"You have defeated the {self.enemy.name}!")
-        log_msg = f"You gain {xp_award} XP and {gold_award} gold."
-        add_to_log(self.battle_log, log_msg)
-
-        if random.random() < 0.10:
-            potion = HealingPotion()
-            self.player.add_item(potion)
-            add_to_log(self.battle_log, f"The enemy dropped {potion.name}!")
-
     def _attempt_flee(self) -> None:
         """Handles the player's attempt to flee from battle."""
         # pylint: disable=import-outside-toplevel
         from .explore import ExploreState
 
-        if random.random() <= config.FLEE_SUCCESS_PROB:
-            add_to_log(self.battle_log, "Fled successfully!")
-            self.meta.reset()  # Reset encounter metadata
-            self.machine.change(ExploreState(self.player, self.meta, self.screen))
-        else:
-            add_to_log(self.battle_log, "Flee failed!")
-            self.player_turn = False
-            self.ticked_this_turn = False
+        if self.flee():
+            self.machine.change(ExploreState(self.player, self.meta, self.screen, self.rng))
 
-    def render(self, screen) -> None:
-        """Renders the battle screen."""
-        render_battle_screen(screen, self)
+    def wake_after_ms(self):
+        """
+        The enemy acts on the update after the player's move, so there is
+        work to do right away whenever it is not the player's turn.
+        """
+        return None if self.player_turn else 0
 
-        # After main battle screen is drawn, overlay status icons
-        self._render_status_icons(screen)
+    def dirty_regions(self) -> list:
+        """Screen bands of the battle HUD keyed by the values they show."""
+        return UI.battle_screen_regions(self)
 
-    def _render_status_icons(self, screen):
-        """Renders status icons for both player and enemy."""
-        from ..core.ui import render_status_icons  # pylint: disable=import-outside-toplevel
-        render_status_icons(screen, self.player, (50, 100))
-        render_status_icons(screen, self.enemy, (500, 100))
+    def render(self, screen) -> None:
+        """Renders the battle screen from its retained HUD widgets."""
+        if self.hud is None:
+            self.hud = self._build_hud()
+        screen.fill(config.BG_COLOR)
+        self.hud.draw(screen)
@@ -1,16 +1,19 @@
 """Handles the exploration state of the game."""
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=cyclic-import
-import random
-from random import randint
+import pygame
 
 from .. import config
-from ..config import BASE_ENCOUNTER_CHANCE, ENCOUNTER_INCREMENT, ITEM_FIND_CHANCE
+from ..content import get_content
+from ..core.battle_log import BattleLog
 from ..core.state_machine import BaseState
 from ..core.ui import UI
+from ..core.widgets import (HealthBar, InventoryPanel, Label, LogPanel, StaticLayer,
+                            WidgetGroup)
 from ..events import trigger_random
-from ..items import HealingPotion, GoldPile
-from ..utils import HealthBarSpec, handle_item_use, add_to_log
+from ..items import GoldPile
+from ..rng import get_service
+from ..utils import handle_item_use, add_to_log
 
 
 class ExploreState(BaseState):  # pylint: disable=too-many-instance-attributes
@@ -19,22 +22,35 @@ class ExploreState(BaseState):  # pylint: disable=too-many-instance-attributes
     or trigger encounters.
     """
 
-    def __init__(self, player, meta, screen):
+    def __init__(self, player, meta, screen, rng=None):
         """
         Initializes the exploration state.
 
         Args:
             player: The player character instance.
+            rng: The session's RNG service; the shared one if omitted.
         """
         super().__init__()
         self.player = player
         self.meta = meta
         self.screen = screen
-        self.log = []
-        self.base_chance = BASE_ENCOUNTER_CHANCE
-        self.step = ENCOUNTER_INCREMENT
+        self.rng = rng if rng is not None else get_service()
+        self.log = BattleLog()
+        self.base_chance = config.BASE_ENCOUNTER_CHANCE
+        self.step = config.ENCOUNTER_INCREMENT
         self.consecutive_turns = 0
         self.encounter_chance = self.base_chance
+        self.hud = WidgetGroup([
+            StaticLayer(self._paint_static),
+            InventoryPanel((config.SCREEN_WIDTH - 250, config.SCREEN_HEIGHT - 210),
+                           lambda: self.player.inventory),
+            HealthBar(config.EXPLORE_PLAYER_HEALTH_POS,
+                      lambda: ("Player", self.player.health, self.player.max_health),
+                      config.PLAYER_HEALTH_COLOR),
+            Label(config.EXPLORE_GOLD_POS, lambda: f"Gold: {self.player.gold}",
+                  font_size=config.LARGE_FONT_SIZE),
+            LogPanel(config.EXPLORE_LOG_POS, lambda: self.log),
+        ])
 
         add_to_log(self.log, "You are exploring the area.")
 
@@ -66,7 +82,7 @@ class ExploreState(BaseState):  # pylint: disable=too-many-instance-attributes
         Triggers encounters or item discoveries.
         """
         # pylint: disable=import-outside-toplevel
-        from ..entities import Enemy
+        from ..entities.archetypes import spawn_enemy
         from .battle import BattleState
         
         class _DummyBattle:
@@ -80,22 +96,22 @@ class ExploreState(BaseState):  # pylint: disable=too-many-instance-attributes
         self.player.regenerate_stamina() # This is now handled by the ActionMixin
 
         # Mini-event check
-        if random.random() < config.MINI_EVENT_BASE_CHANCE:
-            desc = trigger_random(self.player, self.meta, self.log)
+        if self.rng.events.random() < config.MINI_EVENT_BASE_CHANCE:
+            desc = trigger_random(self.player, self.meta, self.log, rng=self.rng.events)
             if desc:  # empty string means chosen event declined to trigger
                 return  # mini-event consumes the turn
 
         # Check for encounter
-        if random.random() < self.encounter_chance:
+        if self.rng.events.random() < self.encounter_chance:
             self.encounter_chance = self.base_chance
             add_to_log(self.log, "An enemy approaches!")
-            enemy = Enemy(encounter_index=self.meta.encounter_index)
-            battle_state = BattleState(self.player, enemy, self.meta, self.screen)
+            enemy = spawn_enemy(self.meta.encounter_index)
+            battle_state = BattleState(self.player, enemy, self.meta, self.screen, self.rng)
             self.machine.change(battle_state)
             return
 
         # Check for finding an item
-        if random.random() < ITEM_FIND_CHANCE:
+        if self.rng.loot.random() < config.ITEM_FIND_CHANCE:
             self._find_item()
         else:
             add_to_log(self.log, "You find nothing of interest.")
@@ -105,60 +121,38 @@ class ExploreState(BaseState):  # pylint: disable=too-many-instance-attributes
 
     def _find_item(self) -> None:
         """Generates and awards a random item to the player."""
-        loot = random.choice([HealingPotion(), GoldPile(randint(5, 20))])
-        if not loot.can_store:
+        loot = get_content().loot_table("explore_find").draw(self.rng.loot)
+        if loot is None:
+            add_to_log(self.log, "You find nothing of interest.")
+        elif not loot.can_store:
             loot.use(self.player)
-            add_to_log(self.log, f"You found {loot.amount} gold!")
+            add_to_log(self.log, "You found {} gold!", loot.amount)
         else:
             self.player.add_item(loot)
-            add_to_log(self.log, f"You found a {loot.name}.")
+            add_to_log(self.log, "You found a {}.", loot.name)
+
+    def dirty_regions(self) -> list:
+        """Header (health, gold) and log/inventory bands of the explore screen."""
+        width = config.SCREEN_WIDTH
+        log_y = config.EXPLORE_LOG_POS[1]
+        return [
+            ("header", pygame.Rect(0, 0, width, config.EXPLORE_INSTRUCTIONS_POS[1] - 5),
+             (self.player.gold, self.player.health, self.player.max_health)),
+            ("log", pygame.Rect(0, log_y - 10, width, config.SCREEN_HEIGHT - log_y + 10),
+             (UI.log_signature(self.log),
+              UI.inventory_signature(self.player.inventory))),
+        ]
+
+    @staticmethod
+    def _paint_static(surface, origin, _layout) -> pygame.Rect:
+        """Draws the key hint."""
+        x, y = config.EXPLORE_INSTRUCTIONS_POS
+        return UI.display_text(surface, "(E)xplore", (origin[0] + x, origin[1] + y),
+                               font_size=config.MEDIUM_FONT_SIZE)
 
     def render(self, screen):
         """
-        Renders the exploration state.
+        Renders the exploration state from its retained HUD widgets.
         """
         screen.fill(config.BG_COLOR)
-
-        inventory_pos = (config.SCREEN_WIDTH - 250, config.SCREEN_HEIGHT - 210)
-        UI.render_inventory(screen, self.player.inventory, pos=inventory_pos)
-
-        # Display player health
-        player_health_spec = HealthBarSpec(
-            *config.EXPLORE_PLAYER_HEALTH_POS,
-            current=self.player.health,
-            max_val=self.player.max_health,
-            color=config.PLAYER_HEALTH_COLOR,
-            label="Player"
-        )
-        UI.draw_health_bar(screen, player_health_spec)
-
-        # Gold display
-        UI.display_text(
-            screen,
-            f"Gold: {self.player.gold}",
-            config.EXPLORE_GOLD_POS,
-            font_size=config.LARGE_FONT_SIZE,
-            color=config.TEXT_COLOR
-        )
-
-        # Display instructions
-        instructions = ["(E)xplore"]
-        UI.display_text(
-            screen,
-            " ".join(instructions),
-            config.EXPLORE_INSTRUCTIONS_POS,
-            font_size=config.MEDIUM_FONT_SIZE,
-            color=config.TEXT_COLOR
-        )
-
-        # Display log messages
-        for i, msg in enumerate(reversed(self.log[-config.MAX_LOG_MESSAGES:])):
-            log_y = (config.EXPLORE_LOG_POS[1] +
-                     (i * config.BATTLE_LOG_LINE_SPACING))
-            UI.display_text(
-                screen,
-                msg,
-                (config.EXPLORE_LOG_POS[0], log_y),
-                font_size=config.MEDIUM_FONT_SIZE,
-                color=config.LOG_COLORS[i],
-            )
+        self.hud.draw(screen)
@@ -3,6 +3,7 @@
 import pygame
 
 from src import config
+from src.core.battle_log import BattleLog
 from src.core.state_machine import BaseState
 from src.core.ui import UI
 
@@ -10,7 +11,7 @@ from src.core.ui import UI
 class GameOverState(BaseState):
     """Represents the state when the game is over."""
 
-    def __init__(self, player, meta, screen, last_battle_log=None):
+    def __init__(self, player, meta, screen, last_battle_log=None, rng=None):
         """
         Initializes the game over state.
         Args:
@@ -18,12 +19,14 @@ class GameOverState(BaseState):
             meta: The encounter metadata.
             screen: The screen to render to.
             last_battle_log: The log from the last battle.
+            rng: The session's RNG service.
         """
         super().__init__()
         self.player = player
         self.meta = meta
         self.screen = screen
-        self.battle_log = last_battle_log or []
+        self.battle_log = last_battle_log if last_battle_log is not None else BattleLog()
+        self.rng = rng
 
     def handle_events(self, events):
         """
@@ -9,6 +9,7 @@ import pygame
 from src import config
 from src.core.state_machine import BaseState
 from src.core.ui import UI
+from src.core.widgets import InventoryPanel, Label, Panel, StaticLayer, WidgetGroup, union
 from src.items.items import HealingPotion, StaminaPotion
 from src.utils import scaled_cost
 
@@ -18,15 +19,26 @@ class ShopState(BaseState):
     Manages the shop state, allowing the player to purchase items and upgrades.
     """
 
-    def __init__(self, player, meta, screen):
+    def __init__(self, player, meta, screen, rng=None):
         super().__init__()
         self.player = player
         self.meta = meta
         self.screen = screen
+        self.rng = rng
         self.purchase_message = ""
         self.message_timer = 0
         self.items = OrderedDict()
         self._build_inventory()
+        self.hud = WidgetGroup([
+            StaticLayer(self._paint_static, layout=lambda: len(self.items)),
+            Label((10, 10), lambda: (f"HP  {self.player.health} / {self.player.max_health}    "
+                                     f"Gold  {self.player.gold} G    "
+                                     f"XP  {self.player.xp}")),
+            InventoryPanel((10, 40), lambda: self.player.inventory),
+            Panel((config.SHOP_MENU_START_X, config.SHOP_MENU_START_Y),
+                  self._menu_rows, self._paint_menu),
+            Label((350, 500), lambda: self.purchase_message, color=(255, 255, 0)),
+        ])
 
     def enter(self, prev_state, **kwargs):
         """Display a welcome message when entering the shop."""
@@ -98,16 +110,26 @@ class ShopState(BaseState):
         self.purchase_message = message
         self.message_timer = pygame.time.get_ticks()
 
+    def _message_age(self) -> int:
+        """Milliseconds since the purchase message was shown."""
+        return pygame.time.get_ticks() - self.message_timer
+
+    def wake_after_ms(self):
+        """Wake up when the purchase message is due to disappear."""
+        if not self.purchase_message:
+            return None
+        return max(0, config.SHOP_MESSAGE_MS + 1 - self._message_age())
+
     def update(self, signals: dict) -> None:
         """Update shop logic based on input signals."""
         # pylint: disable=import-outside-toplevel
         from .explore import ExploreState
 
-        if self.purchase_message and pygame.time.get_ticks() - self.message_timer > 1500:
+        if self.purchase_message and self._message_age() > config.SHOP_MESSAGE_MS:
             self.purchase_message = ""
 
         if signals.get("quit_shop"):
-            self.machine.change(ExploreState(self.player, self.meta, self.screen))
+            self.machine.change(ExploreState(self.player, self.meta, self.screen, self.rng))
             return
 
         if signals.get("number_keys"):
@@ -135,68 +157,56 @@ class ShopState(BaseState):
             else:
                 self._show_purchase_message("Not enough gold!")
 
+    def dirty_regions(self) -> list:
+        """The shop is redrawn as a whole whenever anything on it changes."""
+        player = self.player
+        return [
+            ("shop", pygame.Rect(0, 0, config.SCREEN_WIDTH, config.SCREEN_HEIGHT),
+             (player.health, player.max_health, player.gold, player.xp,
+              UI.inventory_signature(player.inventory),
+              tuple((item["name"], item["cost"]) for item in self.items.values()),
+              self.purchase_message)),
+        ]
+
     def render(self, screen):
-        """Renders the shop screen."""
+        """Renders the shop screen from its retained widgets."""
         screen.fill(config.BG_COLOR)
+        self.hud.draw(screen)
 
-        # Title
-        UI.display_text(screen, "Shop", config.SHOP_TITLE_POS,
-                        font_size=config.LARGE_FONT_SIZE)
-
-        self._render_player_stats(screen)
-
-        # Items
-        y_offset = 0
+    def _menu_rows(self) -> tuple:
+        """Line text, color and description of each item, greyed out if unaffordable."""
+        rows = []
         for key, item in self.items.items():
-            color = config.TEXT_COLOR
-            currency_suffix = "XP" if item.get("price_type") == "xp" else "G"
-
-            can_afford = False
             if item.get("price_type") == "xp":
-                can_afford = self.player.xp >= item['cost']
+                currency_suffix, can_afford = "XP", self.player.xp >= item['cost']
             else:
-                can_afford = self.player.gold >= item['cost']
-
-            if not can_afford:
-                color = (150, 150, 150)  # Greyed out
-
-            text = f"{key}) {item['name']} - {item['cost']} {currency_suffix}"
-
-            UI.display_text(
-                screen, text,
-                (config.SHOP_MENU_START_X, config.SHOP_MENU_START_Y + y_offset),
-                color=color
-            )
-
+                currency_suffix, can_afford = "G", self.player.gold >= item['cost']
+            color = config.TEXT_COLOR if can_afford else (150, 150, 150)  # Greyed out
+            rows.append((f"{key}) {item['name']} - {item['cost']} {currency_suffix}",
+                         color, item['desc']))
+        return tuple(rows)
+
+    @staticmethod
+    def _paint_menu(surface, origin, rows) -> pygame.Rect:
+        """Draws the item lines and their descriptions."""
+        x, y = origin
+        y_offset = 0
+        drawn = []
+        for text, color, desc in rows:
+            drawn.append(UI.display_text(surface, text, (x, y + y_offset), color=color))
             desc_color = color if color != config.TEXT_COLOR else config.UI_ACCENT_COLOR
-            UI.display_text(
-                screen,
-                f"   {item['desc']}",
-                (config.SHOP_MENU_START_X + 20,
-                 config.SHOP_MENU_START_Y + y_offset + 20),
-                font_size=config.SMALL_FONT_SIZE,
-                color=desc_color
-            )
+            drawn.append(UI.display_text(surface, f"   {desc}", (x + 20, y + y_offset + 20),
+                                         font_size=config.SMALL_FONT_SIZE, color=desc_color))
             y_offset += config.SHOP_LINE_SPACING + 20
-
-        # Exit
-        UI.display_text(screen, "Q) Exit Shop",
-                        (config.SHOP_MENU_START_X,
-                         config.SHOP_MENU_START_Y + y_offset + 20))
-
-        # Purchase Message
-        if self.purchase_message:
-            UI.display_text(
-                screen, self.purchase_message, (350, 500), color=(255, 255, 0)
-            )
-
-
-    def _render_player_stats(self, screen):
-        """Renders the player's current stats (HP, Gold, XP) and inventory."""
-        stats_line_1 = (f"HP  {self.player.health} / {self.player.max_health}    "
-                        f"Gold  {self.player.gold} G    "
-                        f"XP  {self.player.xp}")
-        UI.display_text(screen, stats_line_1, (10, 10))
-
-        # Render inventory below the stats
-        UI.render_inventory(screen, self.player.inventory, pos=(10, 40))
+        return union(drawn, origin)
+
+    @staticmethod
+    def _paint_static(surface, origin, item_count) -> pygame.Rect:
+        """Draws the title and the exit hint below `item_count` menu lines."""
+        x, y = origin
+        title_x, title_y = config.SHOP_TITLE_POS
+        title = UI.display_text(surface, "Shop", (x + title_x, y + title_y),
+                                font_size=config.LARGE_FONT_SIZE)
+        exit_y = config.SHOP_MENU_START_Y + item_count * (config.SHOP_LINE_SPACING + 20) + 20
+        return title.union(UI.display_text(surface, "Q) Exit Shop",
+                                           (x + config.SHOP_MENU_START_X, y + exit_y)))
@@ -10,7 +10,7 @@ from src.core.ui import UI
 class VictoryState(BaseState):
     """Represents the state of the game after a victorious battle."""
 
-    def __init__(self, player, meta, screen, last_battle_log):
+    def __init__(self, player, meta, screen, last_battle_log, rng=None):
         """
         Initializes the victory state.
 
@@ -19,12 +19,14 @@ class VictoryState(BaseState):
             meta: The encounter metadata.
             screen: The screen surface to draw on.
             last_battle_log: The log from the last battle.
+            rng: The session's RNG service, handed on to the shop.
         """
         super().__init__()
         self.player = player
         self.meta = meta
         self.screen = screen
         self.last_battle_log = last_battle_log
+        self.rng = rng
 
     def handle_events(self, events):
         """
@@ -35,7 +37,7 @@ class VictoryState(BaseState):
         for event in events:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_SPACE:
-                    self.machine.change(ShopState(self.player, self.meta, self.screen))
+                    self.machine.change(ShopState(self.player, self.meta, self.screen, self.rng))
 
     def render(self, screen):
         """
@@ -0,0 +1,5 @@
+"""
+Command-line developer tools (balance sweeps and similar).
+
+Each module is runnable with `python -m src.tools.<name>`.
+"""
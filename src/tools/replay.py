@@ -0,0 +1,59 @@
+"""
+replay.py
+Replay recorded sessions headlessly and report where each one ended.
+
+Example:
+    python -m src.tools.replay saves/last_session.rpl
+    python -m src.tools.replay recordings/*.rpl --json > results.jsonl
+
+A recording that raises while replaying makes the command exit non-zero,
+which is what CI needs to catch regressions; compare the `--json` output
+against a stored baseline to catch balance drift.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import traceback
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# pylint: disable=wrong-import-position
+from ..core.replay import load, replay
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Replay recorded sessions headlessly.")
+    parser.add_argument("paths", nargs="+", help="Recording files.")
+    parser.add_argument("--render-every", type=int, default=0, metavar="N",
+                        help="Render every N-th frame off-screen (default: never).")
+    parser.add_argument("--json", action="store_true",
+                        help="Print one JSON object per recording.")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for path in args.paths:
+        try:
+            result = replay(load(path), render_every=args.render_every)
+        except Exception:  # pylint: disable=broad-except
+            failures += 1
+            print(f"{path}: FAILED", file=sys.stderr)
+            traceback.print_exc()
+            continue
+        row = {"path": path, **result.summary()}
+        if args.json:
+            print(json.dumps(row))
+        else:
+            rate = result.frames / result.seconds if result.seconds else float("inf")
+            print(f"{path}: {row['state']} after {row['frames']} frames "
+                  f"(HP {row['health']}, XP {row['xp']}, gold {row['gold']}, "
+                  f"battles won {row['battles_won']}) at {rate:,.0f} frames/s")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+"""
+sweep.py
+Fan simulated full runs out over a grid of `src/config.py` settings.
+
+Example:
+    python -m src.tools.sweep --param BASE_ENCOUNTER_CHANCE=0.05,0.1,0.2 \\
+        --param FLEE_SUCCESS_PROB=0.25,0.5 --runs 500 --out sweep.csv
+
+Every run gets its own seed derived from `--seed`, the grid point and the
+run number, so the merged table is identical bit-for-bit regardless of the
+number of workers or the order in which they finish.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+# pylint: disable=wrong-import-position
+from .. import config
+from ..rng import derive_seed
+from ..sim.run import config_overrides, simulate_run
+
+
+def parse_param(text: str) -> tuple[str, list]:
+    """
+    Parse "NAME=v1,v2,..." into the setting name and typed values.
+    Values take the type of the current `config` value (int or float).
+    """
+    name, sep, values = text.partition("=")
+    name = name.strip()
+    if not sep or not values:
+        raise argparse.ArgumentTypeError(f"expected NAME=v1,v2,... got {text!r}")
+    if not hasattr(config, name):
+        raise argparse.ArgumentTypeError(f"unknown config setting {name!r}")
+    default = getattr(config, name)
+    if isinstance(default, bool) or not isinstance(default, (int, float)):
+        raise argparse.ArgumentTypeError(f"{name} is not a numeric setting")
+    kind = type(default)
+    try:
+        return name, [kind(value) for value in values.split(",")]
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"bad value for {name}: {exc}") from exc
+
+
+def build_grid(params: list[tuple[str, list]]) -> list[dict]:
+    """Cartesian product of parameter values, in command-line order."""
+    names = [name for name, _ in params]
+    return [dict(zip(names, combo)) for combo in itertools.product(*(v for _, v in params))]
+
+
+def _run_task(task: tuple[int, dict, int, int, int]) -> dict:
+    """Worker entry point: one seeded run under one set of overrides."""
+    point, overrides, run, seed, max_steps = task
+    with config_overrides(overrides):
+        result = simulate_run(seed, max_steps=max_steps)
+    return {"point": point, "run": run, **overrides, **result.as_row()}
+
+
+def run_sweep(grid: list[dict], runs: int, seed: int = 0, workers: int | None = None,
+              max_steps: int = 2_000) -> list[dict]:
+    """
+    Simulate `runs` full runs for every grid point and return the merged
+    rows ordered by (point, run).
+
+    With `workers == 1` everything runs in-process; otherwise a
+    `ProcessPoolExecutor` with `workers` processes (default: all cores).
+    """
+    tasks = [
+        (point, overrides, run, derive_seed(seed, point, run), max_steps)
+        for point, overrides in enumerate(grid)
+        for run in range(runs)
+    ]
+    if workers == 1:
+        return [_run_task(task) for task in tasks]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 8))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_run_task, tasks, chunksize=chunksize))
+
+
+def write_csv(rows: list[dict], stream) -> None:
+    """Write rows as CSV with a header taken from the first row."""
+    if not rows:
+        return
+    writer = csv.DictWriter(stream, fieldnames=list(rows[0]), lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main(argv=None) -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(
+        description="Sweep config settings over simulated full runs.")
+    parser.add_argument("--param", type=parse_param, action="append", default=[],
+                        metavar="NAME=v1,v2,...",
+                        help="A config setting and the values to try; repeatable.")
+    parser.add_argument("--runs", type=int, default=100, help="Runs per grid point.")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed.")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: all cores; 1 = in-process).")
+    parser.add_argument("--max-steps", type=int, default=2_000,
+                        help="Exploration steps before a run is cut off.")
+    parser.add_argument("--out", default="-", help="CSV output path, '-' for stdout.")
+    args = parser.parse_args(argv)
+
+    grid = build_grid(args.param)
+    start = time.perf_counter()
+    rows = run_sweep(grid, args.runs, seed=args.seed, workers=args.workers,
+                     max_steps=args.max_steps)
+    elapsed = time.perf_counter() - start
+
+    if args.out == "-":
+        write_csv(rows, sys.stdout)
+    else:
+        with open(args.out, "w", newline="", encoding="utf-8") as stream:
+            write_csv(rows, stream)
+    print(f"{len(rows)} runs over {len(grid)} grid points in {elapsed:.2f}s",
+          file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
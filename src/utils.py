@@ -8,10 +8,11 @@ from collections import OrderedDict
 
 import pygame
 from src import config
-from .entities.status import Status
+from .items.inventory import Inventory
 
 if TYPE_CHECKING:
     from .entities.base import Entity
+    from .entities.status import Status
     from .core.battle_log import BattleLog
 
 
@@ -38,9 +39,23 @@ class HealthBarSpec:
     color: Tuple[int, int, int]
     label: str
 
+_IMAGES: dict = {}
+
+
 def load_image(file_path):
-    """Load an image from the specified file path."""
-    image = pygame.image.load(file_path)
+    """
+    Load an image from the specified file path, once.
+
+    Later calls return the same surface, which must not be drawn onto.
+    Images are converted to the display format (keeping alpha) when a
+    display mode has been set.
+    """
+    image = _IMAGES.get(file_path)
+    if image is None:
+        image = pygame.image.load(file_path)
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha()
+        _IMAGES[file_path] = image
     return image
 
 def manage_game_settings(_settings):
@@ -48,9 +63,19 @@ def manage_game_settings(_settings):
     # Placeholder for managing game settings
 
 
-def add_to_log(battle_log, message, max_log=config.MAX_LOG_MESSAGES):
-    """Add a message to the battle log, ensuring it doesn't exceed the max size."""
-    battle_log.append(message)
+def add_to_log(battle_log, message, *args, max_log=config.MAX_LOG_MESSAGES):
+    """
+    Add a message to the battle log, ensuring it doesn't exceed the max size.
+
+    With `args`, `message` is a `str.format` template. A `BattleLog` keeps
+    the template and formats it only when read (and is bounded by its own
+    `maxlen`); plain lists get the formatted text.
+    """
+    add = getattr(battle_log, "add", None)  # BattleLog
+    if add is not None:
+        add(message, *args)
+        return
+    battle_log.append(message.format(*args) if args else message)
     if len(battle_log) > max_log:
         battle_log.pop(0)
 
@@ -66,6 +91,8 @@ def group_inventory(inventory: list) -> list[tuple[any, int, int]]:
     Returns:
         A list of tuples, where each tuple contains (item, quantity, first_index).
     """
+    if isinstance(inventory, Inventory):
+        return inventory.grouped()
     if not inventory:
         return []
 
@@ -99,7 +126,18 @@ def handle_item_use(player, key, logger_callback) -> dict:
     Returns:
         A dictionary with the result of the action.
     """
-    selected_index = key - pygame.key.key_code("1")
+    selected_index = key - pygame.K_1
+    if isinstance(player.inventory, Inventory):
+        # Slots map straight onto the number keys; no regrouping needed.
+        if 0 <= selected_index < player.inventory.slot_count:
+            result = player.use_slot(selected_index)
+            if result:
+                logger_callback(result["message"])
+                return {"success": True, "used_item": True}
+            return {"success": False, "used_item": False}
+        logger_callback("Invalid item selection.")
+        return {"success": False, "used_item": False}
+
     grouped_inventory = group_inventory(player.inventory)
 
     if 0 <= selected_index < len(grouped_inventory):
@@ -116,12 +154,13 @@ def handle_item_use(player, key, logger_callback) -> dict:
 
 def give_status(
     target: "Entity",
-    status_cls: Type[Status],
+    status_cls: "Type[Status]",
     duration: int,
     log_callback: "BattleLog" = None
 ):
     """
-    Apply or refresh a status effect on the target Entity.
+    Apply a status effect to the target Entity following the status's
+    stacking rule (refresh, extend or stack).
 
     Args:
         target (Entity): The entity receiving the status.
@@ -130,21 +169,17 @@ def give_status(
         log_callback (Callable[[str], None] | None): Optional function to append
             messages to the battle log.
     """
-    # Check if status already active -> refresh duration
-    for s in target.statuses:
-        if isinstance(s, status_cls):
-            s.duration = max(s.duration, duration)
-            if log_callback:
-                add_to_log(
-                    log_callback,
-                    f"{target.name} already has {s.name}. "
-                    f"Duration refreshed to {s.duration}."
-                )
-            return
-
-    # Otherwise, apply a fresh instance
     new_status = status_cls(duration)
-    target.apply_status(new_status)
+    live = target.apply_status(new_status)
+    if live is not new_status:
+        if log_callback:
+            add_to_log(
+                log_callback,
+                f"{target.name} already has {live.name}. "
+                f"Duration refreshed to {live.duration}."
+            )
+        return
+
     if log_callback:
         add_to_log(
             log_callback,
@@ -0,0 +1,52 @@
+"""
+Tests for the precomputed enemy archetype table and the enemy pool.
+"""
+from src import config
+from src.entities.archetypes import ArchetypeTable, EnemyPool, get_archetype
+from src.entities.enemy import Enemy
+from src.entities.status import PoisonStatus
+from src.sim.run import config_overrides
+
+
+def test_table_matches_the_stat_formulas_and_extends_lazily():
+    table = ArchetypeTable(depth=4)
+    row = table[3]
+    assert len(table) == 4
+    assert row.name == "Enemy lvl 3"
+    assert row.max_health == config.ENEMY_BASE_HEALTH + 2 * config.ENEMY_HEALTH_SCALING
+    assert row.attack == config.ENEMY_BASE_ATTACK + 2 * config.ENEMY_ATTACK_SCALING
+    assert (row.xp, row.gold) == (40, 20)
+
+    assert table[9].encounter_index == 9 and len(table) == 10
+    assert table[3] is row
+
+
+def test_table_follows_config_changes():
+    before = get_archetype(2).max_health
+    with config_overrides({"ENEMY_HEALTH_SCALING": config.ENEMY_HEALTH_SCALING + 5}):
+        assert get_archetype(2).max_health == before + 5
+        assert Enemy(2).max_health == before + 5
+    assert get_archetype(2).max_health == before
+
+
+def test_pool_reuses_and_resets_enemies():
+    pool = EnemyPool(max_size=2)
+    enemy = pool.acquire(1)
+    enemy.take_damage(30)
+    enemy.apply_status(PoisonStatus(3))
+    enemy.cooldowns["Shield Bash"] = 2
+    pool.release(enemy)
+    pool.release(enemy)
+    assert len(pool) == 1
+
+    again = pool.acquire(5)
+    assert again is enemy
+    assert again.encounter_index == 5 and again.name == "Enemy lvl 5"
+    assert again.health == again.max_health == get_archetype(5).max_health
+    assert not again.statuses and not again.cooldowns and again.stamina == 1
+
+
+def test_pool_ignores_enemies_it_did_not_spawn():
+    pool = EnemyPool()
+    pool.release(Enemy(1))
+    assert len(pool) == 0
@@ -0,0 +1,65 @@
+"""
+Tests for the icon atlas and the image cache.
+"""
+import os
+
+import pygame
+
+from src.core.assets import AssetManager
+from src.core.ui import UI, render_status_icons
+from src.entities.enemy import Enemy
+from src.entities.status import PoisonStatus
+from src.utils import load_image
+
+
+def test_missing_icons_become_fallback_squares_in_one_atlas(tmp_path):
+    assets = AssetManager(root=str(tmp_path), cell=8, columns=2)
+    poison = assets.icon("icons/poison", fallback=(80, 200, 120))
+    assert poison.get_size() == (8, 8) and poison.get_parent() is assets.atlas
+    assert poison.get_at((3, 3)) == (80, 200, 120, 255)
+
+    small = assets.icon("icons/poison", 4)
+    assert small.get_size() == (4, 4) and assets.icon("icons/poison", 4) is small
+    assert assets.stats() == {"icons": 1, "loaded": 0, "generated": 1, "scaled": 1,
+                              "bytes": assets.memory_bytes()}
+
+
+def test_icons_are_loaded_from_files_and_survive_atlas_growth(tmp_path):
+    (tmp_path / "icons").mkdir()
+    art = pygame.Surface((16, 16))
+    art.fill((10, 20, 30))
+    pygame.image.save(art, str(tmp_path / "icons" / "stun.png"))
+
+    assets = AssetManager(root=str(tmp_path), cell=8, columns=2)
+    stun = assets.icon("icons/stun")
+    for key in ("a", "b", "c", "d"):
+        assets.icon(key)
+    assert assets.atlas.get_height() == 8 * 4
+    assert assets.loaded == 1 and assets.generated == 4
+
+    again = assets.icon("icons/stun")
+    assert again is not stun and again.get_parent() is assets.atlas
+    assert again.get_at((4, 4))[:3] == (10, 20, 30)
+
+
+def test_load_image_returns_one_shared_surface(tmp_path):
+    path = str(tmp_path / "logo.png")
+    pygame.image.save(pygame.Surface((3, 2)), path)
+    image = load_image(path)
+    assert image.get_size() == (3, 2) and load_image(path) is image
+
+
+def test_status_icons_are_drawn_from_atlas_cells(monkeypatch, tmp_path):
+    assets = AssetManager(root=str(tmp_path))
+    monkeypatch.setattr(UI, "assets", assets)
+    pygame.font.init()
+    enemy = Enemy(1)
+    enemy.apply_status(PoisonStatus(2))
+    render_status_icons(pygame.Surface((400, 40)), enemy, (0, 0))
+    assert assets.stats()["icons"] == 1 and assets.stats()["scaled"] == 0
+
+
+def test_relative_root_falls_back_to_the_project_root(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    root = AssetManager(root="assets").root
+    assert os.path.isabs(root) and os.path.isfile(os.path.join(root, "content.json"))
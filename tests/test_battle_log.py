@@ -0,0 +1,86 @@
+"""
+Tests for the bounded, lazily formatted battle log.
+"""
+from src.core.battle_log import BattleLog, NullLog
+from src.entities.enemy import Enemy
+from src.entities.player import Player
+from src.sim.battle import simulate_battle
+from src.utils import add_to_log
+
+
+class _Counted:  # pylint: disable=too-few-public-methods
+    """Formats as its name and counts how often it was formatted."""
+
+    def __init__(self, name):
+        self.name = name
+        self.formatted = 0
+
+    def __format__(self, spec):
+        self.formatted += 1
+        return self.name
+
+
+def test_oldest_messages_fall_off():
+    log = BattleLog(maxlen=3)
+    for turn in range(5):
+        log.add("turn {}", turn)
+    assert len(log) == 3
+    assert log == ["turn 2", "turn 3", "turn 4"]
+    assert log[-1] == "turn 4"
+    assert log[-2:] == ["turn 3", "turn 4"]
+    assert list(reversed(log)) == ["turn 4", "turn 3", "turn 2"]
+
+
+def test_messages_are_formatted_once_on_read():
+    hero = _Counted("Hero")
+    log = BattleLog()
+    log.add("{} attacks.", hero)
+    assert hero.formatted == 0
+    assert log[0] == "Hero attacks."
+    assert list(log) == ["Hero attacks."]
+    assert hero.formatted == 1
+
+    evicted = _Counted("Ghost")
+    small = BattleLog(maxlen=1)
+    small.add("{} fades.", evicted)
+    small.add("gone")
+    assert list(small) == ["gone"] and evicted.formatted == 0
+
+
+def test_revision_counts_changes():
+    log = BattleLog(["start"])
+    assert log.revision == 0 and log
+    log.add("a")
+    log.append("b")
+    assert log.revision == 2
+    log.clear()
+    assert log.revision == 3 and not log
+    assert log == [] and log != ["a"]
+
+
+def test_null_log_drops_everything():
+    log = NullLog()
+    log.add("{} attacks.", "Hero")
+    log.append("ignored")
+    assert not log.enabled and len(log) == 0 and log.revision == 0
+
+
+def test_add_to_log_accepts_lists_and_logs():
+    messages = []
+    for turn in range(7):
+        add_to_log(messages, "turn {}", turn, max_log=5)
+    assert messages == [f"turn {turn}" for turn in range(2, 7)]
+
+    log = BattleLog(maxlen=5)
+    for turn in range(7):
+        add_to_log(log, "turn {}", turn)
+    assert log == messages
+
+
+def test_simulation_keeps_a_log_only_when_given_one():
+    result = simulate_battle(Player(), Enemy(1), max_turns=10)
+    assert result.turns > 0
+
+    log = BattleLog()
+    simulate_battle(Player(), Enemy(1), max_turns=10, log=log)
+    assert 0 < len(log) <= log.maxlen
@@ -0,0 +1,18 @@
+"""
+Tests for the benchmark harness (not the timings themselves).
+"""
+import pytest
+
+from benchmarks.bench import BENCHMARKS, compare
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    baseline = {"a": 1.0, "b": 1.0, "c": 1.0}
+    results = {"a": 1.2, "b": 1.3, "c": 0.5, "new": 9.0}
+    assert compare(results, baseline, threshold=0.25) == ["b"]
+
+
+@pytest.mark.filterwarnings("ignore:pygame.init")
+def test_every_benchmark_runs_once():
+    for setup in BENCHMARKS.values():
+        setup()()
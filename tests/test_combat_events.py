@@ -0,0 +1,108 @@
+"""
+Tests for the combat event bus and its standard subscribers.
+"""
+import io
+import json
+
+import pytest
+
+from src.core.battle_log import BattleLog, NullLog
+from src.entities.enemy import Enemy
+from src.entities.player import Player
+from src.events.bus import EventBus
+from src.events.combat import (CombatMetrics, DamageDealt, JsonlRecorder, LogWriter,
+                               RewardGranted, SkillUsed, StatusApplied, TurnEnded)
+from src.rng import RNGService
+from src.sim.battle import BattleEngine, simulate_battle
+from src.utils import EncounterMeta
+
+
+def test_subscribers_get_their_kinds_in_batches():
+    bus = EventBus()
+    assert not bus.active
+    batches, skills = [], []
+    bus.subscribe(batches.append, batch_size=2)
+    bus.subscribe(skills.extend, kinds=(SkillUsed,))
+    assert bus.active
+
+    events = [SkillUsed("Player", "Shield Bash"), TurnEnded(1, "Player"),
+              DamageDealt("Enemy lvl 0", "Player", 7)]
+    for event in events:
+        bus.publish(event)
+    assert batches == [events[:2]]
+    assert skills == events[:1]
+
+    bus.flush()
+    assert batches == [events[:2], events[2:]]
+    with pytest.raises(ValueError):
+        bus.subscribe(batches.append, batch_size=0)
+
+
+def test_unsubscribe_flushes_pending_events():
+    bus = EventBus()
+    seen = []
+    subscription = bus.subscribe(seen.extend, batch_size=10)
+    bus.publish(TurnEnded(1, "Player"))
+    bus.unsubscribe(subscription)
+    bus.publish(TurnEnded(2, "Player"))
+    assert seen == [TurnEnded(1, "Player")] and not bus.active
+
+
+def test_log_writer_renders_the_old_messages():
+    log = BattleLog(maxlen=10)
+    LogWriter(log)([
+        DamageDealt("Player", "Goblin", 12),
+        DamageDealt("Goblin", "Player", 20, crit=True),
+        DamageDealt("Goblin", "Player", 0, miss=True),
+        DamageDealt("Player", "Goblin", 9, skill="Shield Bash"),
+        SkillUsed("Player", "Shield Bash"),
+        RewardGranted(10, 5),
+        RewardGranted(0, 0, "Healing Potion", "drop"),
+        RewardGranted(0, 12, None, "drop"),
+    ])
+    assert log == [
+        "Player deals 12 damage.",
+        "Critical hit! Goblin deals 20 damage.",
+        "Goblin missed!",
+        "Player uses Shield Bash.",
+        "You gain 10 XP and 5 gold.",
+        "The enemy dropped Healing Potion!",
+        "The enemy dropped 12 gold!",
+    ]
+
+
+def test_metrics_and_recorder_follow_a_battle():
+    bus = EventBus()
+    metrics = CombatMetrics()
+    metrics.attach(bus)
+    stream = io.StringIO()
+    JsonlRecorder(stream).attach(bus)
+
+    player = Player()
+    result = simulate_battle(player, Enemy(0), rng=RNGService(3), bus=bus)
+
+    summary = metrics.summary()
+    assert summary["turns"] == result.turns
+    assert sum(summary["damage"].values()) > 0
+    if result.outcome == "victory":
+        assert summary["xp"] == player.xp
+    lines = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert sum(line["event"] == "TurnEnded" for line in lines) == result.turns
+    assert {"event": "SkillUsed", "actor": "Player", "skill": "Shield Bash"} in lines
+
+
+def test_shield_bash_publishes_damage_and_stun():
+    player, enemy = Player(), Enemy(0)
+    seen = []
+    battle = BattleEngine(player, enemy, EncounterMeta(0), RNGService(0))
+    battle.bus.subscribe(seen.extend, kinds=(DamageDealt, StatusApplied))
+    battle.start()
+    battle.player_skill("q")
+    assert [type(event) for event in seen] == [DamageDealt, StatusApplied]
+    assert seen[0].skill == "Shield Bash" and seen[1] == StatusApplied(enemy.name, "stun", 1)
+    assert battle.battle_log[-1] == "Player uses Shield Bash."
+
+
+def test_headless_battles_build_no_events():
+    quiet = BattleEngine(Player(), Enemy(0), EncounterMeta(0), RNGService(0), log=NullLog())
+    assert not quiet.bus.active
@@ -0,0 +1,95 @@
+"""
+Tests for alias-table sampling and the compiled content file.
+"""
+import json
+from collections import Counter
+
+import pytest
+
+from src import content
+from src.items import Antidote, GoldPile
+from src.rng import Stream
+from src.sampling import AliasTable, WeightedSampler
+
+SOURCE = {
+    "loot": {"chest": [{"item": "Antidote", "weight": 3},
+                       {"item": "Gold Pile", "weight": 1, "amount": [7, 7]},
+                       {"item": None, "weight": 0}]},
+    "events": {"TrapEvent": 1.0},
+    "event_contexts": {"deep": {"TrapEvent": 1, "PuzzleEvent": 2}},
+}
+
+
+def test_alias_table_matches_weights():
+    weights = [0.5, 0.0, 2.0, 1.5, 0.01]
+    table = AliasTable(weights)
+    rng = Stream(42)
+    trials = 200_000
+    counts = Counter(table.sample(rng) for _ in range(trials))
+    assert counts[1] == 0
+    for index, weight in enumerate(weights):
+        assert abs(counts[index] / trials - weight / sum(weights)) < 0.005
+    with pytest.raises(ValueError):
+        AliasTable([0, 0])
+
+
+def test_weighted_sampler_add_replace_remove():
+    sampler = WeightedSampler([("a", 1.0), ("b", 1.0)])
+    assert set(sampler.sample(100, Stream(1))) == {"a", "b"}
+    sampler.add("b", 0.0)  # replaces the weight, still one entry
+    sampler.add("c", 1.0)
+    assert len(sampler) == 3 and sampler.total == 2.0
+    assert set(sampler.sample(200, Stream(1))) == {"a", "c"}
+    assert sampler.remove("a") and "a" not in sampler
+    assert sampler.choice(Stream(1)) == "c"
+    with pytest.raises(ValueError):
+        sampler.add("d", -1)
+
+
+def test_loot_table_draws_items(tmp_path):
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps(SOURCE))
+    chest = content.load_content(str(path)).loot_table("chest")
+    drops = [chest.draw(Stream(seed)) for seed in range(200)]
+    assert {type(drop) for drop in drops} == {Antidote, GoldPile}
+    assert all(drop is Antidote() or drop.amount == 7 for drop in drops)
+    with pytest.raises(content.ContentError):
+        content.load_content(str(path)).loot_table("missing")
+
+
+def test_sidecar_cache_skips_parsing_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps(SOURCE))
+    first = content.load_content(str(path))
+    assert (tmp_path / "content.json.cache").exists()
+
+    def no_parsing(*_):
+        raise AssertionError("parsed despite a valid cache")
+    monkeypatch.setattr(content.json, "loads", no_parsing)
+    cached = content.load_content(str(path))
+    assert cached.events == first.events == [("TrapEvent", 1.0)]
+    assert cached.loot["chest"].entries == first.loot["chest"].entries
+    assert cached.event_contexts == {"deep": [("TrapEvent", 1.0), ("PuzzleEvent", 2.0)]}
+
+    monkeypatch.undo()
+    path.write_text(json.dumps({**SOURCE, "events": {"TrapEvent": 2.0}}))
+    assert content.load_content(str(path)).events == [("TrapEvent", 2.0)]
+
+
+def test_cache_is_rechecked_when_items_change(tmp_path, monkeypatch):
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps(SOURCE))
+    content.load_content(str(path))
+    monkeypatch.delitem(content.ItemMeta.registry, "Antidote")
+    with pytest.raises(content.ContentError, match="Antidote"):
+        content.load_content(str(path))
+
+
+def test_invalid_content_is_rejected(tmp_path):
+    path = tmp_path / "content.json"
+    path.write_text(json.dumps({"loot": {"chest": [{"item": "Elixir", "weight": 1}]}}))
+    with pytest.raises(content.ContentError, match="Elixir"):
+        content.load_content(str(path))
+    path.write_text("{not json")
+    with pytest.raises(content.ContentError):
+        content.load_content(str(path), use_cache=False)
@@ -0,0 +1,52 @@
+"""
+Tests for dirty-rectangle rendering through the state machine.
+"""
+import pygame
+
+from src import config
+from src.core.dirty import DirtyTracker
+from src.core.state_machine import StateMachine
+from src.entities.enemy import Enemy
+from src.entities.player import Player
+from src.states.battle import BattleState
+from src.utils import EncounterMeta
+
+
+def test_tracker_reports_only_changed_regions():
+    screen = pygame.Rect(0, 0, 800, 600)
+    tracker = DirtyTracker()
+    a, b = pygame.Rect(0, 0, 800, 50), pygame.Rect(0, 100, 800, 50)
+
+    assert tracker.collect([("a", a, 1), ("b", b, 1)], screen) == [screen]
+    assert tracker.collect([("a", a, 1), ("b", b, 1)], screen) == []
+    assert tracker.collect([("a", a, 1), ("b", b, 2)], screen) == [b, b]
+
+    tracker.invalidate()
+    assert tracker.collect([("a", a, 1), ("b", b, 2)], screen) == [screen]
+
+
+def test_idle_battle_frames_draw_nothing():
+    """Only a changed health bar is redrawn after the first full frame."""
+    pygame.font.init()
+    screen = pygame.Surface((800, 600))
+    player, enemy = Player(), Enemy(1)
+    machine = StateMachine(BattleState(player, enemy, EncounterMeta(1), screen))
+
+    assert machine.render(screen) == [screen.get_rect()]
+    assert machine.render(screen) == []
+
+    enemy.health -= 5
+    rects = machine.render(screen)
+    assert rects and all(rect.width == screen.get_width() for rect in rects)
+    assert screen.get_clip() == screen.get_rect()
+
+
+def test_idle_timeout_follows_turns():
+    """The loop may sleep on the player's turn but not on the enemy's."""
+    screen = pygame.Surface((800, 600))
+    state = BattleState(Player(), Enemy(1), EncounterMeta(1), screen)
+    machine = StateMachine(state)
+
+    assert machine.idle_timeout() == config.IDLE_MAX_WAIT_MS
+    state.player_turn = False
+    assert machine.idle_timeout() == 0
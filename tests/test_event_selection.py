@@ -5,6 +5,7 @@ Tests for mini-event probability and selection logic.
 from collections import Counter
 from random import Random
 
+from src.events import mini_events
 from src.events.mini_events import (
     EVENT_TABLE,
     WEIGHT_SUM,
@@ -14,6 +15,10 @@ from src.events.mini_events import (
     PuzzleEvent,
     TrapEvent,
     choose_event,
+    choose_events,
+    register_event,
+    trigger_random,
+    unregister_event,
 )
 
 
@@ -57,3 +62,70 @@ def test_event_classes_match_table():
         GoldCacheEvent,
     }
     assert table_events == expected_events
+
+
+def test_batched_draws_follow_weights():
+    """`choose_events` draws many classes at once with the same distribution."""
+    counts = Counter(choose_events(50_000, Random(7)))
+    for event_class, weight in EVENT_TABLE:
+        assert abs(counts[event_class] / 50_000 - weight / WEIGHT_SUM) <= 0.01
+
+
+def test_register_and_unregister_rebuild_lazily():
+    """Registration changes the table seen by the next draw, and is undoable."""
+    class RareEvent(PuzzleEvent):
+        """A stand-in for a mod's event."""
+
+    register_event(RareEvent, 1000.0)
+    try:
+        assert mini_events.WEIGHT_SUM == WEIGHT_SUM + 1000.0
+        assert Counter(choose_events(100, Random(1)))[RareEvent] > 80
+    finally:
+        assert unregister_event(RareEvent) and not unregister_event(RareEvent)
+    assert mini_events.WEIGHT_SUM == WEIGHT_SUM
+    assert RareEvent not in choose_events(1000, Random(1))
+
+
+def test_context_tables_replace_the_default():
+    """A context draws only from its own table; unknown contexts use the default."""
+    register_event(TrapEvent, 1.0, context="crypt")
+    register_event(GoldCacheEvent, 3.0, context="crypt")
+    try:
+        crypt = Counter(choose_events(4000, Random(3), context="crypt"))
+        assert set(crypt) == {TrapEvent, GoldCacheEvent}
+        assert 0.7 < crypt[GoldCacheEvent] / 4000 < 0.8
+        assert set(choose_events(4000, Random(3), context="forest")) == \
+               {cls for cls, _ in EVENT_TABLE}
+        assert choose_event(Random(3), context="crypt") in (TrapEvent, GoldCacheEvent)
+    finally:
+        del mini_events._CONTEXT_EVENTS["crypt"]  # pylint: disable=protected-access
+
+
+def test_emptied_context_falls_back_to_the_default_table():
+    """Unregistering a context's last event drops the context table."""
+    register_event(TrapEvent, 1.0, context="cave")
+    assert unregister_event(TrapEvent, context="cave")
+    assert "cave" not in mini_events._CONTEXT_EVENTS  # pylint: disable=protected-access
+    assert choose_event(Random(3), context="cave") == choose_event(Random(3))
+    assert not unregister_event(TrapEvent, context="cave")
+
+
+def test_trigger_random_hands_its_stream_to_events_without_an_rng_argument():
+    """Mod events written against the no-argument constructor still trigger."""
+    class ModEvent(PuzzleEvent):
+        """A mod's event whose constructor takes no stream."""
+
+        def __init__(self):  # pylint: disable=super-init-not-called
+            self.rng = None
+
+        def execute(self, player, meta, log) -> str:
+            return str(self.rng.randint(1, 100))
+
+    register_event(ModEvent, 1.0, context="mod")
+    try:
+        expected = Random(4)
+        expected.random()  # the draw that picked the event
+        assert trigger_random(None, {}, [], Random(4), context="mod") == \
+               str(expected.randint(1, 100))
+    finally:
+        del mini_events._CONTEXT_EVENTS["mod"]  # pylint: disable=protected-access
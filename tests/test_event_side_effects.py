@@ -75,16 +75,12 @@ def log():
     return MockLog()
 
 
-def test_trap_event_effect(player: DummyPlayer, log: MockLog, monkeypatch):
+def test_trap_event_effect(player: DummyPlayer, log: MockLog):
     """
     Verify a TrapEvent either deals damage or applies poison.
     """
     # Force a specific RNG outcome for the trap's effect
-    rng = Random(1)  # This seed causes damage
-    monkeypatch.setattr("random.random", rng.random)
-    monkeypatch.setattr("random.randint", rng.randint)
-
-    event = TrapEvent()
+    event = TrapEvent(rng=Random(1))  # This seed causes damage
     initial_hp = player.health
     event.execute(player, {}, log)
 
@@ -95,25 +91,24 @@ def test_trap_event_effect(player: DummyPlayer, log: MockLog, monkeypatch):
 
     # Now test the poison outcome with a different seed
     player = DummyPlayer()  # Reset player
-    rng = Random(2)  # This seed causes poison
-    monkeypatch.setattr("random.random", rng.random)
+    event = TrapEvent(rng=Random(2))  # This seed causes poison
 
     event.execute(player, {}, log)
     assert player.has_status(PoisonStatus), "Trap failed to apply poison"
 
 
-def test_gold_award_range(player: DummyPlayer, log: MockLog, monkeypatch):
+def test_gold_award_range(player: DummyPlayer, log: MockLog):
     """
     Verify GoldCacheEvent awards an amount within the expected range.
     """
-    # Monkeypatch the randint call inside execute
-    def mock_randint(min_val, max_val):
-        assert min_val == 5
-        assert max_val == 30
-        return 15  # A fixed value within the range
-    monkeypatch.setattr("src.events.mini_events.randint", mock_randint)
-
-    event = GoldCacheEvent()
+    # Stub the randint call inside execute
+    class MockRng(Random):
+        def randint(self, a, b):
+            assert a == 5
+            assert b == 30
+            return 15  # A fixed value within the range
+
+    event = GoldCacheEvent(rng=MockRng())
     initial_gold = player.gold
 
     # Execute the event, which should call the logging util.
@@ -203,8 +198,12 @@ def test_poison_ticks_in_explore_mode(player: DummyPlayer, monkeypatch):
     from src.states.explore import ExploreState
     from src.entities.status import PoisonStatus
 
-    # Prevent encounters and mini-events from happening
-    monkeypatch.setattr("random.random", lambda: 0.9)
+    from src.rng import RNGService
+
+    # Prevent encounters, item finds and mini-events from happening
+    rng = RNGService(0)
+    monkeypatch.setattr(rng.events, "random", lambda: 0.9)
+    monkeypatch.setattr(rng.loot, "random", lambda: 0.9)
     def mock_trigger_random(*args, **kwargs):
         return ""
     monkeypatch.setattr("src.states.explore.trigger_random", mock_trigger_random)
@@ -216,7 +215,7 @@ def test_poison_ticks_in_explore_mode(player: DummyPlayer, monkeypatch):
     class MockMeta:
         encounter_index = 0
 
-    explore_state = ExploreState(player, MockMeta(), None)
+    explore_state = ExploreState(player, MockMeta(), None, rng)
     
     # Simulate 3 steps in explore mode
     for _ in range(3):
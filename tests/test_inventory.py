@@ -0,0 +1,73 @@
+"""
+Tests for the counted inventory store.
+"""
+import pygame
+import pytest
+
+from src import config
+from src.entities.player import Player
+from src.items import (Antidote, GoldPile, HealingPotion, Inventory, StaminaPotion,
+                       get_item)
+from src.utils import group_inventory, handle_item_use
+
+
+def test_stacks_keep_slot_order_and_counts():
+    inventory = Inventory([HealingPotion(), StaminaPotion(), HealingPotion()])
+    assert inventory.slot_count == 2 and len(inventory) == 3
+    assert [(item.name, qty, first) for item, qty, first in inventory.grouped()] == \
+           [("Healing Potion", 2, 0), ("Stamina Potion", 1, 2)]
+    assert inventory.count("Healing Potion") == 2
+
+    inventory.add(Antidote())
+    assert inventory.take(1).name == "Stamina Potion"
+    assert [item.name for item, _ in map(inventory.slot, range(inventory.slot_count))] == \
+           ["Healing Potion", "Antidote"]
+    assert inventory.remove(HealingPotion()) and not inventory.remove(StaminaPotion())
+
+
+def test_list_view_matches_group_inventory():
+    items = [HealingPotion(), Antidote(), HealingPotion(), StaminaPotion()]
+    inventory = Inventory(items)
+    flat = list(inventory)
+    assert [item.name for item in flat] == [item.name for item in inventory[:]]
+    assert inventory[-1] is flat[-1] and inventory[1] is flat[1]
+    assert items[2] in inventory and HealingPotion() in inventory  # one shared definition
+    assert [(i.name, q) for i, q, _ in group_inventory(inventory)] == \
+           [(i.name, q) for i, q, _ in group_inventory(items)]
+
+
+def test_number_keys_use_slots():
+    player = Player()
+    for item in (HealingPotion(), StaminaPotion(), HealingPotion()):
+        player.add_item(item)
+    player.health = 10
+    messages = []
+
+    assert handle_item_use(player, pygame.K_1, messages.append)["success"]
+    assert player.health > 10 and player.inventory.count("Healing Potion") == 1
+    assert not handle_item_use(player, pygame.K_3, messages.append)["success"]
+    assert messages[-1] == "Invalid item selection."
+    assert player.use_item(1)["value"] > 0 and player.inventory.slot_count == 1
+
+
+def test_flyweight_items_share_one_immutable_definition(monkeypatch):
+    potion = HealingPotion()
+    assert potion is HealingPotion() is get_item("Healing Potion")
+    with pytest.raises(AttributeError):
+        potion.amount = 3  # no __dict__, nothing per instance
+    monkeypatch.setattr(config, "HEALING_POTION_COST", 99)
+    assert potion.cost == 99  # definitions read config live
+
+    piles = GoldPile(5), GoldPile(7)
+    assert piles[0] is not piles[1] and piles[0].amount == 5
+    with pytest.raises(KeyError):
+        get_item("Elixir")
+
+
+def test_stacks_hold_definition_and_count():
+    inventory = Inventory()
+    inventory.add(Antidote(), 1000)
+    assert len(inventory) == 1000 and inventory.slot(0) == (Antidote(), 1000)
+    assert inventory[999] is Antidote() and inventory.take(0) is Antidote()
+    with pytest.raises(ValueError):
+        inventory.add(GoldPile(3), 2)
@@ -0,0 +1,30 @@
+"""
+Tests for the object pools and their use for enemies.
+"""
+from src.entities.archetypes import EnemyPool
+from src.entities.status import PoisonStatus
+from src.pool import ObjectPool, pool_stats
+from src.utils import give_status
+
+
+def test_pool_recycles_and_counts_hits():
+    pool = ObjectPool(lambda size: [0] * size, lambda obj, size: obj.__init__([0] * size),
+                      max_size=1, name="test.lists")
+    first = pool.acquire(2)
+    first[0] = 7
+    pool.release(first)
+    pool.release([1])  # over max_size: dropped
+    again = pool.acquire(3)
+    assert again is first and again == [0, 0, 0]
+    assert pool.stats() == {"hits": 1, "misses": 1, "dropped": 1, "free": 0,
+                            "hit_rate": 0.5}
+    assert pool_stats()["test.lists"]["hits"] == 1
+
+
+def test_released_enemies_respawn_without_statuses():
+    pool = EnemyPool()
+    enemy = pool.acquire(1)
+    give_status(enemy, PoisonStatus, 3)
+    pool.release(enemy)
+    assert pool.acquire(2) is enemy and not enemy.statuses
+    assert pool.hit_rate == 0.5
@@ -0,0 +1,129 @@
+"""
+Tests for the frame profiler.
+"""
+import io
+import json
+import tracemalloc
+from itertools import count
+
+import pygame
+import pytest
+
+from src.core import profiler as profiler_module
+from src.core.profiler import (AllocationTracker, CProfileWindow, FrameProfiler, NullProfiler,
+                               histogram, percentile)
+from src import main as main_module
+from src.main import parse_args
+
+
+class ExploreState:  # pylint: disable=too-few-public-methods
+    """Stands in for a state; only its class name is recorded."""
+
+
+def _run_frames(profiler, monkeypatch, frames: int) -> None:
+    ticks = count()
+    monkeypatch.setattr(profiler_module, "perf_counter", lambda: next(ticks) / 1000)
+    for _ in range(frames):
+        profiler.start_frame(ExploreState())
+        for phase in profiler_module.PHASES:
+            profiler.lap(phase)
+        profiler.end_frame()
+
+
+def test_percentiles_and_histogram_buckets():
+    assert percentile([], 50) == 0.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 50) == 2.0
+    assert percentile([3.0, 1.0, 2.0, 4.0], 99) == 4.0
+    assert histogram([0.2, 1.0, 1.5, 500.0]) == [1, 1, 1, 0, 0, 0, 0, 0, 0, 1]
+
+
+def test_frames_are_split_by_phase_and_state(monkeypatch, tmp_path):
+    profiler = FrameProfiler(window=3)
+    _run_frames(profiler, monkeypatch, 5)
+    assert len(profiler.frames) == 3
+
+    summary = profiler.summary()["ExploreState"]
+    assert summary["frames"] == 3
+    assert summary["update"]["p50"] == pytest.approx(1.0)
+    assert summary["frame"]["p99"] == pytest.approx(4.0)  # every phase but process_events
+
+    path = tmp_path / "profile" / "frames.json"
+    profiler.export(str(path))
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert sum(data["histograms"]["ExploreState"]["frame"]) == 3
+    assert data["summary"]["ExploreState"]["frames"] == 3
+
+
+def test_overlay_toggles_on_f3_and_null_profiler_records_nothing(monkeypatch):
+    pygame.font.init()
+    screen = pygame.Surface((800, 600))
+    profiler = FrameProfiler()
+    _run_frames(profiler, monkeypatch, 2)
+    f3 = pygame.event.Event(pygame.KEYDOWN, key=pygame.K_F3)  # pylint: disable=no-member
+
+    assert profiler.draw(screen, 60.0) is None
+    assert profiler.handle_events([f3]) is False
+    rect = profiler.draw(screen, 60.0)
+    assert rect is not None and rect.right == 795
+    assert profiler.handle_events([f3]) is True  # hidden again: redraw the screen
+
+    null = NullProfiler()
+    _run_frames(null, monkeypatch, 2)
+    assert not null.enabled and not null.frames and not null.handle_events([f3])
+
+
+def test_cprofile_window_dumps_only_its_frames(tmp_path):
+    path = tmp_path / "frames.prof"
+    window = CProfileWindow(2, str(path), start=1)
+    for _ in range(4):
+        window.start_frame(ExploreState())
+        sorted(range(1000))
+        window.end_frame()
+    assert window.done and path.exists()
+    assert not CProfileWindow(2, str(tmp_path / "never.prof"), start=10).finish()
+
+
+def test_allocation_tracker_reports_each_transition():
+    out = io.StringIO()
+    tracker = AllocationTracker(limit=2, stream=out)
+    try:
+        kept = [bytearray(1024) for _ in range(50)]
+        tracker(ExploreState(), ExploreState())
+    finally:
+        tracemalloc.stop()
+    report = out.getvalue().splitlines()
+    assert report[0].startswith("[tracemalloc] ExploreState -> ExploreState:")
+    assert len(report) == 3 and kept
+
+
+def test_command_line_options_default_to_off():
+    args = parse_args([])
+    assert not (args.profile or args.profile_frames or args.tracemalloc or args.headless)
+    args = parse_args(["--profile-frames", "30", "--tracemalloc", "--headless"])
+    assert (args.profile_frames, args.tracemalloc, args.headless) == (30, 10, True)
+    with pytest.raises(SystemExit):
+        parse_args(["--profile", "--profile-frames", "5"])
+
+
+@pytest.mark.parametrize("option", [["--profile"], ["--profile-frames", "50"]])
+def test_profiles_are_written_when_the_session_is_interrupted(monkeypatch, tmp_path, option):
+    class InterruptedGame:  # pylint: disable=too-few-public-methods
+        """Plays a few frames, then is stopped with Ctrl-C."""
+
+        def __init__(self, seed=None):
+            self.seed = seed
+            self.profiler = NullProfiler()
+
+        def run(self):
+            for _ in range(3):
+                self.profiler.start_frame(ExploreState())
+                sorted(range(1000))
+                self.profiler.end_frame()
+            raise KeyboardInterrupt
+
+    monkeypatch.setattr(main_module, "Game", InterruptedGame)
+    monkeypatch.setattr(main_module, "print_profile", lambda path: None)
+    path = tmp_path / "session.prof"
+    with pytest.raises(KeyboardInterrupt):
+        main_module.main([*option, "--profile-out", str(path)])
+    assert path.exists()
@@ -0,0 +1,50 @@
+"""
+Tests for recording and replaying sessions.
+"""
+import pygame
+
+from src.core.replay import QUIT_CODE, Recorder, Recording, ReplayError, replay
+from src.tools.replay import main
+
+import pytest
+
+
+def _key(key):
+    return pygame.event.Event(pygame.KEYDOWN, key=key)
+
+
+def _record(seed=4, frames=400):
+    """Explore, fight, shop and leave again, pressing a key on even frames."""
+    recorder = Recorder(seed)
+    keys = [pygame.K_e, pygame.K_a, pygame.K_SPACE, pygame.K_q]
+    for frame in range(frames):
+        recorder.record([_key(keys[frame // 2 % len(keys)])] if frame % 2 == 0 else [])
+    return recorder.recording
+
+
+def test_recording_roundtrips_compactly():
+    recording = _record()
+    recording.inputs.append((recording.frames, (QUIT_CODE,)))
+    recording.frames += 1
+    data = recording.to_bytes()
+    assert Recording.from_bytes(data) == recording
+    assert len(data) < 4 * len(recording.inputs) + 20
+    with pytest.raises(ReplayError):
+        Recording.from_bytes(b"not a recording")
+
+
+def test_replay_is_deterministic_and_renders_on_request():
+    recording = _record()
+    first, second = replay(recording), replay(recording, render_every=50)
+    assert first.summary() == second.summary()
+    assert first.meta.battles_won > 0
+
+
+def test_replay_stops_at_quit(tmp_path, capsys):
+    recording = Recording(seed=1, frames=10, inputs=[(3, (QUIT_CODE,))])
+    assert replay(recording).frames == 4
+
+    path = tmp_path / "session.rpl"
+    path.write_bytes(recording.to_bytes())
+    assert main([str(path), "--json"]) == 0
+    assert '"frames": 4' in capsys.readouterr().out
@@ -0,0 +1,48 @@
+"""
+Tests for the headless battle engine.
+"""
+import pygame
+
+from src.entities.enemy import Enemy
+from src.entities.player import Player
+from src.sim import BattleEngine, simulate_battle
+from src.states.battle import BattleState
+from src.utils import EncounterMeta
+
+
+def test_simulated_battle_runs_to_completion():
+    """A fight resolves to a terminal outcome and mutates the combatants."""
+    player = Player()
+    enemy = Enemy(1)
+    meta = EncounterMeta(encounter_index=1)
+
+    result = simulate_battle(player, enemy, meta)
+
+    assert result.outcome in {"victory", "defeat"}
+    assert result.turns == meta.turns > 0
+    if result.outcome == "victory":
+        assert not enemy.is_alive()
+        assert meta.battles_won == 1
+        assert player.xp > 0
+    else:
+        assert not player.is_alive()
+
+
+def test_simulation_needs_no_display():
+    """Many fights can be resolved without initialising pygame."""
+    for index in range(1, 51):
+        simulate_battle(Player(), Enemy(index))
+    assert not pygame.display.get_init()
+
+
+def test_timeout_when_policy_never_acts():
+    """A policy that cannot make progress is cut off by max_turns."""
+    player = Player()
+    player.stamina = 0
+    result = simulate_battle(player, Enemy(1), policy=lambda battle: "attack", max_turns=10)
+    assert result.outcome == "timeout"
+
+
+def test_battle_state_uses_engine_rules():
+    """BattleState is a thin layer over the shared engine."""
+    assert issubclass(BattleState, BattleEngine)
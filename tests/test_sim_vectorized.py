@@ -0,0 +1,63 @@
+"""
+Tests for the batched NumPy combat simulator.
+"""
+import math
+
+import numpy as np
+
+from src import config
+from src.entities.enemy import Enemy
+from src.entities.player import Player
+from src.entities.status import PoisonStatus
+from src.sim import simulate_battle
+from src.sim.vectorized import DEFEAT, TIMEOUT, VICTORY, simulate_batch, sweep
+
+
+def _scalar_win_rate(encounter_index: int, fights: int) -> float:
+    wins = sum(
+        simulate_battle(Player(), Enemy(encounter_index)).outcome == "victory"
+        for _ in range(fights)
+    )
+    return wins / fights
+
+
+def test_batch_matches_scalar_engine():
+    """Win rates agree with the headless engine on a contested encounter."""
+    batch = simulate_batch(50_000, encounter_index=5, seed=7)
+    assert abs(batch.win_rate - _scalar_win_rate(5, 3_000)) < 0.03
+
+
+def test_batch_is_reproducible_and_complete():
+    """The same seed yields identical arrays and every fight finishes."""
+    first = simulate_batch(5_000, encounter_index=3, seed=42)
+    second = simulate_batch(5_000, encounter_index=3, seed=42)
+    assert np.array_equal(first.outcome, second.outcome)
+    assert np.array_equal(first.turns, second.turns)
+    assert set(np.unique(first.outcome)) <= {VICTORY, DEFEAT}
+    won = first.outcome == VICTORY
+    assert np.all(first.enemy_health[won] == 0)
+    assert np.all(first.player_health[won] > 0)
+
+
+def test_poison_ticks_like_status():
+    """A poisoned player that never finishes loses exactly the poison damage."""
+    batch = simulate_batch(10, encounter_index=1, player_statuses={"poison": 3},
+                           max_turns=1, seed=0)
+    tick = math.ceil(config.PLAYER_BASE_HEALTH * PoisonStatus.PCT_DAMAGE)
+    assert np.all(batch.outcome == TIMEOUT)
+    assert np.all(batch.player_health == config.PLAYER_BASE_HEALTH - tick)
+
+
+def test_config_changes_shift_win_rate(monkeypatch):
+    """Sweeps read config at call time."""
+    baseline = simulate_batch(20_000, encounter_index=5, seed=1).win_rate
+    monkeypatch.setattr(config, "ENEMY_HEALTH_SCALING", 0)
+    easier = simulate_batch(20_000, encounter_index=5, seed=1).win_rate
+    assert easier > baseline
+
+
+def test_sweep_reports_each_encounter():
+    """sweep() returns one summary row per encounter index."""
+    rows = sweep(range(0, 3), 1_000, seed=3)
+    assert [row["encounter_index"] for row in rows] == [0, 1, 2]
+    assert all(0.0 <= row["win_rate"] <= 1.0 for row in rows)
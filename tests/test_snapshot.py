@@ -0,0 +1,103 @@
+"""
+Tests for binary save/load snapshots.
+"""
+import io
+
+import pytest
+
+from src.core import snapshot
+from src.core.game import new_session
+from src.entities.enemy import Enemy
+from src.entities.status import PoisonStatus, StunStatus
+from src.items.items import Antidote
+from src.rng import RNGService
+from src.states.battle import BattleState
+from src.states.game_over import GameOverState
+from src.states.victory import VictoryState
+
+
+def _roundtrip(player, meta, machine, compress=False):
+    stream = io.BytesIO()
+    snapshot.write_snapshot(stream, player, meta, machine, compress=compress)
+    data = stream.getvalue()
+    return data, snapshot.restore(snapshot.read_snapshot(data), None, RNGService())
+
+
+def test_pack_roundtrips_all_value_types():
+    value = {"a": [0, -1, -33, 127, 128, 70_000, -70_000, 2**40, -(2**40)],
+             "b": [None, True, False, 0.25, "x" * 40, b"\x00" * 300],
+             "c": {str(i): i for i in range(20)}}
+    assert snapshot.unpack(snapshot.pack(value)) == value
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_battle_snapshot_roundtrip(compress):
+    rng = RNGService(5)
+    player, meta, machine = new_session(None, rng)
+    player.add_item(Antidote())
+    player.state.gold = 42
+    player.max_hp_mult = 1.25
+    player.cooldowns["Shield Bash"] = 2
+    meta.battles_won = 3
+    machine.change(BattleState(player, Enemy(4), meta, None, rng))
+    battle = machine.current
+    battle.enemy.health -= 7
+    battle.enemy.apply_status(PoisonStatus(3))
+    player.apply_status(StunStatus(2))
+    battle.player_turn = False
+    rng.combat.random()
+    expected = rng.getstate()
+
+    data, (player2, meta2, machine2) = _roundtrip(player, meta, machine, compress)
+    battle2 = machine2.current
+
+    assert isinstance(battle2, BattleState) and not battle2.player_turn
+    assert (player2.health, player2.max_health, player2.gold) == \
+           (player.health, player.max_health, 42)
+    assert [type(i) for i in player2.inventory] == [type(i) for i in player.inventory]
+    assert player2.cooldowns == {"Shield Bash": 2} and player2.stunned
+    assert repr(player2.statuses) == repr(player.statuses)
+    assert battle2.enemy.health == battle.enemy.health
+    assert repr(battle2.enemy.statuses) == "[poison(3)]"
+    assert meta2 == meta and battle2.battle_log == battle.battle_log
+    assert battle2.rng.getstate() == expected
+    assert len(data) < 600
+
+
+def test_victory_snapshot_is_small():
+    player, meta, machine = new_session(None)
+    machine.change(VictoryState(player, meta, None, ["You win"]))
+    sections = snapshot.capture(player, meta, machine)
+    assert len(snapshot.pack(sections)) < 500
+    assert sections["state"] == {"name": "VictoryState", "last_battle_log": ["You win"]}
+
+
+def test_rejects_foreign_and_future_data():
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.read_snapshot(b"PK\x03\x04 not a save")
+    future = snapshot.MAGIC + bytes([snapshot.FORMAT_VERSION + 1, 0]) + b"\xc0"
+    with pytest.raises(snapshot.SnapshotError):
+        snapshot.read_snapshot(future)
+
+
+def test_game_over_snapshot_roundtrip():
+    player, meta, machine = new_session(None)
+    machine.change(GameOverState(player, meta, None, ["You died"]))
+    sections = snapshot.capture(player, meta, machine)
+    assert sections["state"] == {"name": "GameOverState", "battle_log": ["You died"]}
+
+    _, (_, _, machine2) = _roundtrip(player, meta, machine)
+    assert isinstance(machine2.current, GameOverState)
+    assert machine2.current.battle_log == ["You died"]
+
+
+def test_inventory_stacks_and_version_1_lists():
+    player, meta, machine = new_session(None)
+    player.inventory.add(Antidote(), 50)
+    sections = snapshot.capture(player, meta, machine)
+    assert sections["player"]["inventory"]["Antidote"] == 50
+
+    sections["player"]["inventory"] = ["Antidote", "HealingPotion", "Antidote"]
+    player2, _, _ = snapshot.restore(sections, None, RNGService())
+    assert [(item.name, qty) for item, qty, _ in player2.inventory.grouped()] == \
+           [("Antidote", 2), ("Healing Potion", 1)]
@@ -0,0 +1,120 @@
+"""
+Tests for the keyed status container and its stacking rules.
+"""
+from src.core.battle_log import BattleLog
+from src.entities.enemy import Enemy
+from src.entities.status import (BleedStatus, PoisonStatus, Polarity, RegenerationStatus,
+                                 Stacking, Status, StatusSet, StunStatus, tick_all)
+from src.items import Antidote
+from src.utils import give_status
+
+
+class _Battle:  # pylint: disable=too-few-public-methods
+    def __init__(self):
+        self.battle_log = []
+
+
+class BurnStatus(PoisonStatus):
+    """A poison variant whose durations add up."""
+    name = "burn"
+    stacking = Stacking.EXTEND
+
+
+def test_stacking_rules():
+    statuses = StatusSet()
+    first = PoisonStatus(2)
+    assert statuses.add(first) is first
+    assert statuses.add(PoisonStatus(5)) is first and first.duration == 5
+    assert statuses.add(PoisonStatus(1)) is first and first.duration == 5
+
+    burn = statuses.add(BurnStatus(2))
+    statuses.add(BurnStatus(3))
+    assert burn.duration == 5
+
+    statuses.add(BleedStatus(1))
+    statuses.add(BleedStatus(3))
+    assert len(statuses) == 4
+    assert repr(statuses) == "[poison(5), burn(5), bleed(1), bleed(3)]"
+
+
+def test_has_answers_for_base_classes():
+    statuses = StatusSet([BurnStatus(1)])
+    assert statuses.has(BurnStatus) and statuses.has(PoisonStatus) and statuses.has(Status)
+    assert not statuses.has(StunStatus)
+    assert statuses.get(PoisonStatus).name == "burn"
+    assert statuses.remove(statuses.get(BurnStatus)) and not statuses.has(PoisonStatus)
+    assert not statuses
+
+
+def test_tick_expires_in_one_pass_and_calls_hooks():
+    enemy = Enemy(0)
+    enemy.apply_status(StunStatus(1))
+    enemy.apply_status(BleedStatus(1))
+    enemy.apply_status(BleedStatus(2))
+    assert enemy.stunned and enemy.has_status(StunStatus)
+
+    enemy.tick_statuses(_Battle())
+    assert not enemy.stunned and not enemy.has_status(StunStatus)
+    assert repr(enemy.statuses) == "[bleed(1)]"
+    enemy.tick_statuses(_Battle())
+    assert not enemy.statuses and not enemy.has_status(Status)
+
+
+def test_antidote_clears_by_polarity():
+    enemy = Enemy(0)
+    for status in (PoisonStatus(3), RegenerationStatus(3), StunStatus(2), BleedStatus(2)):
+        enemy.apply_status(status)
+    assert RegenerationStatus.polarity is Polarity.POSITIVE
+    assert Antidote().use(enemy)["value"] == 3
+    assert repr(enemy.statuses) == "[regeneration(3)]" and not enemy.stunned
+
+
+def _population(size):
+    enemies = [Enemy(i % 3) for i in range(size)]
+    for index, enemy in enumerate(enemies):
+        enemy.apply_status(PoisonStatus(1 + index % 3))
+        enemy.apply_status(RegenerationStatus(2))
+        if index % 2:
+            enemy.apply_status(StunStatus(1))
+    return enemies
+
+
+def test_tick_all_matches_ticking_one_by_one():
+    batched, single = _population(30), _population(30)
+    batch_state, single_state = _Battle(), _Battle()
+    for _ in range(3):
+        tick_all(batched, batch_state)
+        for enemy in single:
+            enemy.tick_statuses(single_state)
+    assert [(e.health, repr(e.statuses), e.stunned) for e in batched] == \
+           [(e.health, repr(e.statuses), e.stunned) for e in single]
+    assert batch_state.battle_log[-1].endswith("suffers 6 from poison.")
+
+
+def test_tick_all_formats_only_kept_lines():
+    enemies = _population(100)
+    state = _Battle()
+    tick_all(enemies, state, log=None)
+    assert not state.battle_log and enemies[0].health < enemies[0].max_health
+    tick_all(enemies, state)
+    assert len(state.battle_log) == 5
+    assert all(line.endswith("regenerates 4 HP.") for line in state.battle_log)
+
+
+def test_give_status_follows_stacking_rules():
+    enemy, log = Enemy(1), BattleLog(["Battle start"], maxlen=10)
+    give_status(enemy, PoisonStatus, 2, log)
+    poison = enemy.statuses.get(PoisonStatus)
+    give_status(enemy, PoisonStatus, 5, log)
+    give_status(enemy, PoisonStatus, 1, log)
+    assert enemy.statuses.get(PoisonStatus) is poison and poison.duration == 5
+
+    give_status(enemy, BurnStatus, 2, log)
+    give_status(enemy, BurnStatus, 3, log)
+    assert enemy.statuses.get(BurnStatus).duration == 5
+
+    give_status(enemy, BleedStatus, 1, log)
+    give_status(enemy, BleedStatus, 3, log)
+    assert repr(enemy.statuses) == "[poison(5), burn(5), bleed(1), bleed(3)]"
+    assert [line.split()[-1] for line in list(log)[1:]] == \
+           ["(2).", "5.", "5.", "(2).", "5.", "(1).", "(3)."]
@@ -0,0 +1,57 @@
+"""
+Tests for headless full runs and the config sweep runner.
+"""
+import argparse
+
+import pytest
+
+from src import config
+from src.sim.run import config_overrides, simulate_run
+from src.tools.sweep import build_grid, parse_param, run_sweep
+
+
+def test_simulated_run_is_deterministic():
+    """The same seed replays the same run."""
+    assert simulate_run(123, max_steps=200) == simulate_run(123, max_steps=200)
+
+
+def test_config_overrides_restore_values():
+    """Overrides apply inside the block and are undone afterwards."""
+    original = config.FLEE_SUCCESS_PROB
+    with config_overrides({"FLEE_SUCCESS_PROB": 0.9}):
+        assert config.FLEE_SUCCESS_PROB == 0.9
+    assert config.FLEE_SUCCESS_PROB == original
+    with pytest.raises(KeyError):
+        with config_overrides({"NOT_A_SETTING": 1}):
+            pass
+
+
+def test_flee_probability_changes_runs():
+    """The run policy flees when hurt without potions, so the odds matter."""
+    def runs(prob):
+        with config_overrides({"FLEE_SUCCESS_PROB": prob}):
+            return [simulate_run(seed, max_steps=300) for seed in range(10)]
+    assert runs(0.0) != runs(1.0)
+
+
+def test_parse_param_types_values():
+    """Values take the type of the config default; bad names are rejected."""
+    assert parse_param("BOOST_COST_GROWTH=1.2,2") == ("BOOST_COST_GROWTH", [1.2, 2.0])
+    assert parse_param("MAX_STAMINA=2,3") == ("MAX_STAMINA", [2, 3])
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_param("NOPE=1")
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_param("GAME_TITLE=x")
+
+
+def test_sweep_is_reproducible_across_worker_counts():
+    """Parallel and in-process sweeps produce identical tables."""
+    grid = build_grid([("BASE_ENCOUNTER_CHANCE", [0.05, 0.2]),
+                       ("ENCOUNTER_INCREMENT", [0.05])])
+    serial = run_sweep(grid, runs=5, seed=9, workers=1, max_steps=100)
+    parallel = run_sweep(grid, runs=5, seed=9, workers=2, max_steps=100)
+    assert serial == parallel
+    assert [(row["point"], row["run"]) for row in serial] == [
+        (point, run) for point in range(2) for run in range(5)
+    ]
+    assert {row["BASE_ENCOUNTER_CHANCE"] for row in serial} == {0.05, 0.2}
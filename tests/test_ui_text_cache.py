@@ -0,0 +1,60 @@
+"""
+Tests for the UI font registry and rendered-text cache.
+"""
+import pygame
+import pytest
+
+from src.core.text_cache import TextCache
+from src.core.ui import UI, render_battle_screen
+from src.entities.enemy import Enemy
+from src.entities.player import Player
+from src.states.battle import BattleState
+from src.utils import EncounterMeta
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fonts():
+    """Initialise just the font module (no window is needed)."""
+    pygame.font.init()
+    yield
+    UI.text_cache.clear()
+
+
+def test_fonts_are_registered_once_per_size():
+    cache = TextCache()
+    assert cache.font(24) is cache.font(24)
+    assert cache.font(24) is not cache.font(28)
+
+
+def test_rendered_text_is_cached_with_counters():
+    cache = TextCache()
+    first = cache.render("Gold: 10", 24, (255, 255, 255))
+    second = cache.render("Gold: 10", 24, (255, 255, 255))
+    cache.render("Gold: 10", 24, (200, 200, 200))
+
+    assert first is second
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.hit_rate == pytest.approx(1 / 3)
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TextCache(maxsize=2)
+    a = cache.render("a", 24, (0, 0, 0))
+    cache.render("b", 24, (0, 0, 0))
+    cache.render("a", 24, (0, 0, 0))      # "a" becomes most recent
+    cache.render("c", 24, (0, 0, 0))      # evicts "b"
+    assert cache.render("a", 24, (0, 0, 0)) is a
+    misses = cache.misses
+    cache.render("b", 24, (0, 0, 0))
+    assert cache.misses == misses + 1
+
+
+def test_battle_screen_reuses_cached_text():
+    """A second identical frame renders no new text."""
+    screen = pygame.Surface((800, 600))
+    battle = BattleState(Player(), Enemy(1), EncounterMeta(1), screen)
+    render_battle_screen(screen, battle)
+    misses = UI.text_cache.misses
+    render_battle_screen(screen, battle)
+    assert UI.text_cache.misses == misses
@@ -0,0 +1,83 @@
+"""
+Tests for the retained HUD widgets.
+"""
+import pygame
+import pytest
+
+from src import config
+from src.core.ui import render_battle_screen, render_status_icons
+from src.core.widgets import HealthBar, Label, StaticLayer, WidgetGroup
+from src.entities.enemy import Enemy
+from src.entities.player import Player
+from src.entities.status import PoisonStatus
+from src.states.battle import BattleState
+from src.utils import EncounterMeta
+
+
+@pytest.fixture(scope="module", autouse=True)
+def fonts():
+    """Initialise just the font module (no window is needed)."""
+    pygame.font.init()
+
+
+def _screen() -> pygame.Surface:
+    return pygame.Surface((config.SCREEN_WIDTH, config.SCREEN_HEIGHT))
+
+
+def test_widget_recomposes_only_when_its_value_changes():
+    values = {"gold": 5}
+    label = Label((10, 10), lambda: f"Gold: {values['gold']}")
+    screen = _screen()
+    first = label.draw(screen)
+    label.draw(screen)
+    assert label.renders == 1 and first.width > 0
+    assert screen.get_rect().clip(pygame.Rect(10, 10, 800, 600)).contains(first)
+
+    values["gold"] = 50
+    label.draw(screen)
+    assert label.renders == 2
+
+
+def test_group_redraws_only_the_changed_widget():
+    health = {"player": 100}
+    bar = HealthBar((50, 60), lambda: ("Player", health["player"], 100),
+                    config.PLAYER_HEALTH_COLOR)
+    title = Label((300, 10), lambda: "Title")
+    hud = WidgetGroup([bar, title])
+    screen = _screen()
+    hud.draw(screen)
+    health["player"] = 40
+    hud.draw(screen)
+    assert (bar.renders, title.renders, hud.renders) == (2, 1, 3)
+
+
+def test_static_layer_is_painted_once_per_layout():
+    painted = []
+    layout = {"lines": 4}
+
+    def paint(surface, origin, lines):
+        painted.append(lines)
+        pygame.draw.rect(surface, (255, 0, 0), (origin[0] + 100, origin[1] + 40 * lines, 20, 5))
+
+    layer = StaticLayer(paint, layout=lambda: layout["lines"])
+    screen = _screen()
+    assert layer.draw(screen) == pygame.Rect(100, 160, 20, 5)
+    layer.draw(screen)
+    layout["lines"] = 5
+    assert layer.draw(screen) == pygame.Rect(100, 200, 20, 5)
+    assert painted == [4, 5]
+
+
+def test_battle_hud_matches_the_immediate_mode_screen():
+    player, enemy = Player(), Enemy(3)
+    player.apply_status(PoisonStatus(2))
+    player.cooldowns["Shield Bash"] = 2
+    battle = BattleState(player, enemy, EncounterMeta(3), None)
+    battle.battle_log.add("Player attacks for %d damage.", 7)
+
+    expected, retained = _screen(), _screen()
+    render_battle_screen(expected, battle)
+    render_status_icons(expected, player, (50, 100))
+    render_status_icons(expected, enemy, (500, 100))
+    battle.render(retained)
+    assert pygame.image.tobytes(retained, "RGB") == pygame.image.tobytes(expected, "RGB")